@@ -0,0 +1,69 @@
+"""
+Benchmark: per-message formatting and encoding cost.
+
+Compares building every payload from scratch and encoding it the way
+``requests`` does for ``json=`` (the previous send path) with rendering a
+compiled MessageTemplate and encoding it with slack_logger.serialization
+(orjson when installed).
+
+Usage:
+    python benchmarks/bench_format.py [--iterations 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from slack_logger.formatter import LogLevel, MessageTemplate, SlackMessageFormatter  # noqa: E402
+from slack_logger.serialization import dumps, encoder_name  # noqa: E402
+
+CONTEXT = {"user_id": 42, "path": "/api/orders", "region": "eu-west-1"}
+
+
+def _uncompiled(message: str) -> bytes:
+    payload = MessageTemplate("checkout-service", LogLevel.ERROR).render(
+        message, additional_context=CONTEXT
+    )
+    return json.dumps(payload, allow_nan=False).encode("utf-8")
+
+
+def _compiled(message: str) -> bytes:
+    payload = TEMPLATE.render(message, additional_context=CONTEXT)
+    return dumps(payload)
+
+
+TEMPLATE = SlackMessageFormatter.compile("checkout-service", LogLevel.ERROR)
+
+
+def _bench(name: str, func, iterations: int) -> None:
+    func("warm up")
+    start = time.perf_counter()
+    for i in range(iterations):
+        func("Payment provider returned an error")
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for i in range(1000):
+        func("Payment provider returned an error")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<32} {elapsed / iterations * 1e6:7.2f} us/msg  peak {peak / 1024:6.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"JSON encoder: {encoder_name()}")
+    _bench("build per call + json.dumps", _uncompiled, args.iterations)
+    _bench("compiled template + dumps", _compiled, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: cost of ``import slack_logger`` in a fresh interpreter.
+
+Each run starts a new Python process, measures the import and checks that
+heavy optional modules (the HTTP stack, asyncio, python-dotenv, orjson) are
+not loaded until a message is actually sent. Exits with status 1 if one of
+them is imported eagerly or the median import time exceeds --max-ms, so it
+can guard against regressions in CI.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--max-ms 100]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Must stay out of sys.modules after "import slack_logger"
+LAZY_MODULES = ("requests", "urllib3", "asyncio", "aiohttp", "dotenv", "orjson")
+
+_PROBE = """
+import json, sys, time
+baseline = set(sys.modules)
+start = time.perf_counter()
+import slack_logger
+elapsed = time.perf_counter() - start
+loaded = [m for m in {lazy!r} if m in sys.modules and m not in baseline]
+print(json.dumps({{"ms": elapsed * 1000, "loaded": loaded}}))
+"""
+
+
+def _run_once() -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="")
+    output = subprocess.check_output(
+        [sys.executable, "-c", _PROBE.format(lazy=LAZY_MODULES)],
+        env=env,
+        cwd=ROOT
+    )
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=100.0, help="fail above this median import time")
+    args = parser.parse_args()
+
+    _run_once()  # warm the bytecode cache
+    results = [_run_once() for _ in range(args.runs)]
+    times = sorted(result["ms"] for result in results)
+    median = statistics.median(times)
+    print(f"import slack_logger: median {median:.1f} ms, min {times[0]:.1f} ms, max {times[-1]:.1f} ms")
+
+    failed = False
+    eager = sorted({module for result in results for module in result["loaded"]})
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if median > args.max_ms:
+        print(f"FAIL: median import time above {args.max_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Benchmark: memory held by deferred exceptions under a sustained error burst.
+
+Every simulated request handler has a large request object in scope when
+it fails. The burst's exceptions are kept the way a deferred delivery path
+(queue, batch or retry) would keep them: as live exception objects, whose
+tracebacks pin every frame and its locals, or as ExceptionSnapshot records
+from TracebackRenderer.capture. Reports memory still held after the burst
+and the capture cost per exception.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--errors 2000] [--request-kib 64]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from slack_logger.formatter import SlackMessageFormatter  # noqa: E402
+
+RENDERER = SlackMessageFormatter.TRACEBACK_RENDERER
+
+
+def _handle(request: dict, depth: int) -> None:
+    if depth == 0:
+        raise KeyError(f"missing field in request {request['id']}")
+    _handle(request, depth - 1)
+
+
+def _failed_request(index: int, request_kib: int) -> BaseException:
+    request = {"id": index, "body": bytearray(request_kib * 1024)}
+    try:
+        try:
+            _handle(request, 20)
+        except KeyError as e:
+            raise RuntimeError("request failed") from e
+    except RuntimeError as e:
+        return e
+
+
+def _burst(keep, errors: int, request_kib: int) -> float:
+    """Run the burst, keeping ``keep(exception)`` for each error; return MiB held."""
+    gc.collect()
+    tracemalloc.start()
+    held = [keep(_failed_request(index, request_kib)) for index in range(errors)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--errors", type=int, default=2000)
+    parser.add_argument("--request-kib", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{args.errors} errors, {args.request_kib} KiB request object in scope of each")
+    live = _burst(lambda e: e, args.errors, args.request_kib)
+    snapshots = _burst(RENDERER.capture, args.errors, args.request_kib)
+    print(f"  live exceptions held:     {live:9.1f} MiB")
+    print(f"  ExceptionSnapshot held:   {snapshots:9.1f} MiB")
+
+    exception = _failed_request(0, 1)
+    iterations = 20000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        RENDERER.capture(exception, fingerprint=True)
+    elapsed = time.perf_counter() - start
+    print(f"  capture + fingerprint:    {elapsed / iterations * 1e6:9.2f} us/exception")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: stack trace rendering cost for deep and chained exceptions.
+
+Compares the previous approach (``traceback.format_exception`` over the
+whole chain, then truncation to 3000 characters) with the bounded,
+cached TracebackRenderer used by SlackMessageFormatter.
+
+Usage:
+    python benchmarks/bench_traceback.py [--depth 500] [--iterations 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+import traceback
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from slack_logger.tracebacks import TracebackRenderer  # noqa: E402
+
+MAX_CHARS = 3000
+
+
+def _recurse(depth: int) -> None:
+    if depth == 0:
+        raise ValueError("bottom of the stack")
+    _recurse(depth - 1)
+
+
+def _deep_exception(depth: int) -> BaseException:
+    try:
+        _recurse(depth)
+    except ValueError as e:
+        return e
+
+
+def _chained_exception(depth: int, links: int) -> BaseException:
+    def _raise(level: int) -> None:
+        if level == 0:
+            _recurse(depth)
+        try:
+            _raise(level - 1)
+        except Exception as e:
+            raise RuntimeError(f"wrapped at level {level}") from e
+
+    try:
+        _raise(links)
+    except RuntimeError as e:
+        return e
+
+
+def _format_full(exception: BaseException) -> str:
+    text = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+    if len(text) > MAX_CHARS:
+        text = text[:MAX_CHARS] + "\n... (truncated)"
+    return text
+
+
+def _bench(name: str, render, exception: BaseException, iterations: int) -> None:
+    render(exception)  # warm linecache and the frame cache
+    start = time.perf_counter()
+    for _ in range(iterations):
+        text = render(exception)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<22} {elapsed / iterations * 1e6:9.1f} us/trace  {len(text):6d} chars")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    renderer = TracebackRenderer(max_chars=MAX_CHARS)
+    cases = [
+        (f"deep recursion ({args.depth} frames)", _deep_exception(args.depth)),
+        (f"5 chained x {args.depth // 5} frames", _chained_exception(args.depth // 5, 5)),
+        ("shallow (1 frame)", _deep_exception(0)),
+    ]
+    for title, exception in cases:
+        print(title)
+        _bench("format_exception", _format_full, exception, args.iterations)
+        _bench("TracebackRenderer", renderer.render, exception, args.iterations)
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(10000)
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: per-message latency with and without connection reuse.
+
+Starts a local HTTP/1.1 stub webhook and posts the same payload with the
+module-level ``requests.post`` (new connection per message) and with the
+pooled HTTPTransport used by SlackWebhookClient.
+
+Usage:
+    python benchmarks/bench_transport.py [--messages 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from slack_logger.transport import HTTPTransport  # noqa: E402
+from stub_server import StubWebhook  # noqa: E402
+
+PAYLOAD = {"text": "ERROR: benchmark", "blocks": [{"type": "divider"}]}
+
+
+def _time_per_message(post, url, messages):
+    start = time.perf_counter()
+    for _ in range(messages):
+        post(url, json=PAYLOAD, timeout=5)
+    return (time.perf_counter() - start) / messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    args = parser.parse_args()
+
+    with StubWebhook() as stub:
+        unpooled = _time_per_message(requests.post, stub.url, args.messages)
+        transport = HTTPTransport(pool_size=4)
+        pooled = _time_per_message(transport.post, stub.url, args.messages)
+        stats = transport.stats()
+
+    print(f"requests.post (new connection): {unpooled * 1e3:.3f} ms/message")
+    print(f"HTTPTransport (keep-alive):     {pooled * 1e3:.3f} ms/message")
+    print(f"speedup: {unpooled / pooled:.1f}x")
+    print(f"connections opened: {stats['connections_opened']}, reused: {stats['connections_reused']}")
+
+
+if __name__ == "__main__":
+    main()
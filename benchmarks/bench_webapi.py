@@ -0,0 +1,73 @@
+"""
+Benchmark: Slack requests spent on a recurring error, webhook vs Web API.
+
+Logs a burst in which a few distinct errors recur many times, each with a
+handful of message variants, once through an incoming webhook and once
+through the Web API client against the local stub. The webhook posts every
+occurrence; the Web API posts one parent per error, replies once per new
+variant and edits the parents' occurrence counters.
+
+Usage:
+    python benchmarks/bench_webapi.py [--events 2000] [--errors 5] [--variants 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SLACK_LOGGER_RATE_LIMIT", "0")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from slack_logger import SlackLogger  # noqa: E402
+from slack_logger.config import Config  # noqa: E402
+from stub_server import StubWebhook  # noqa: E402
+
+
+def _fail(error: int, variant: int, index: int) -> BaseException:
+    try:
+        raise [KeyError, ValueError, TimeoutError, OSError, RuntimeError][error % 5](
+            f"variant {'abcdefgh'[variant % 8]} failed for request {index}"
+        )
+    except Exception as e:
+        return e
+
+
+def _burst(logger: SlackLogger, events: int, errors: int, variants: int) -> float:
+    start = time.perf_counter()
+    for index in range(events):
+        error = index % errors
+        logger.error(f"Handler {error} failed", exception=_fail(error, (index // errors) % variants, index))
+    logger.close()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--errors", type=int, default=5)
+    parser.add_argument("--variants", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.events} events, {args.errors} recurring errors, {args.variants} variants each")
+    with StubWebhook() as stub:
+        elapsed = _burst(SlackLogger(webhook_url=stub.url, service_name="bench"), args.events, args.errors, args.variants)
+        print(f"  webhook:  {stub.counts['requests']:6d} requests  {elapsed:6.2f}s")
+
+        stub.reset()
+        os.environ["SLACK_LOGGER_API_URL"] = stub.api_url
+        Config.reload()
+        logger = SlackLogger(bot_token="xoxb-bench", channel="C000", service_name="bench")
+        elapsed = _burst(logger, args.events, args.errors, args.variants)
+        calls = stub.api_calls
+        print(
+            f"  Web API:  {stub.counts['requests']:6d} requests  {elapsed:6.2f}s  "
+            f"({calls['chat.postMessage'] - calls['replies']} parents, {calls['replies']} replies, "
+            f"{calls['chat.update']} counter edits)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Local stub of a Slack incoming webhook, and of the Web API, for benchmarks.
+
+The stub answers every POST with 200 by default. Latency, server errors,
+429 rate limiting and stalls (requests that hang well past any sensible
+timeout) can be injected with a fixed probability, from a seeded random
+generator so runs are reproducible.
+
+Usage:
+    with StubWebhook(latency=0.005, error_rate=0.01) as stub:
+        logger = SlackLogger(webhook_url=stub.url)
+        ...
+        print(stub.counts)
+
+Posts under ``stub.api_url`` are answered like the Web API's
+``chat.postMessage`` and ``chat.update``; the messages as last posted or
+edited are kept in ``stub.messages`` by ``ts``.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Many client threads connect at once; the default backlog of 5 drops SYNs
+    request_queue_size = 256
+
+
+class StubWebhook:
+    """Threaded HTTP/1.1 server that behaves like a Slack webhook."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        stall_rate: float = 0.0,
+        stall: float = 30.0,
+        seed: int = 0
+    ):
+        """
+        Configure the stub. Call ``start`` (or use it as a context manager).
+
+        Args:
+            latency: Seconds every response is delayed
+            error_rate: Fraction of requests answered with 500
+            rate_limit_rate: Fraction of requests answered with 429
+            retry_after: Retry-After header sent with a 429, in seconds
+            stall_rate: Fraction of requests that hang for ``stall`` seconds
+            stall: Seconds a stalled request hangs before answering 200
+            seed: Seed for the fault injection
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.stall_rate = stall_rate
+        self.stall = stall
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0, "stalled": 0}
+        self.bytes_received = 0
+        self.api_calls: Dict[str, int] = {"chat.postMessage": 0, "chat.update": 0, "replies": 0}
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        """Webhook URL of the running stub."""
+        return f"http://127.0.0.1:{self._server.server_port}/services/T000/B000/XXXX"
+
+    @property
+    def api_url(self) -> str:
+        """Web API base URL of the running stub."""
+        return f"http://127.0.0.1:{self._server.server_port}/api"
+
+    def _api(self, method: str, body: bytes) -> Dict[str, Any]:
+        """Answer a Web API call, keeping the posted or edited message."""
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return {"ok": False, "error": "invalid_json"}
+        with self._lock:
+            if method == "chat.postMessage":
+                self.api_calls[method] += 1
+                if payload.get("thread_ts"):
+                    self.api_calls["replies"] += 1
+                ts = f"{1700000000 + len(self.messages)}.000100"
+                self.messages[ts] = payload
+                return {"ok": True, "channel": "C000", "ts": ts}
+            if method == "chat.update":
+                self.api_calls[method] += 1
+                ts = payload.get("ts")
+                if ts not in self.messages:
+                    return {"ok": False, "error": "message_not_found"}
+                self.messages[ts] = payload
+                return {"ok": True, "channel": "C000", "ts": ts}
+        return {"ok": False, "error": "unknown_method"}
+
+    def _outcome(self, size: int) -> str:
+        with self._lock:
+            self.counts["requests"] += 1
+            self.bytes_received += size
+            roll = self._random.random()
+            if roll < self.stall_rate:
+                outcome = "stalled"
+            elif roll < self.stall_rate + self.error_rate:
+                outcome = "errors"
+            elif roll < self.stall_rate + self.error_rate + self.rate_limit_rate:
+                outcome = "rate_limited"
+            else:
+                outcome = "ok"
+            self.counts[outcome] += 1
+            return outcome
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                size = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(size)
+                outcome = stub._outcome(size)
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if outcome == "stalled":
+                    time.sleep(stub.stall)
+
+                if outcome == "errors":
+                    self._reply(500, b"internal_error")
+                elif outcome == "rate_limited":
+                    self._reply(429, b"rate_limited", {"Retry-After": f"{stub.retry_after:g}"})
+                elif self.path.startswith("/api/"):
+                    self._reply(200, json.dumps(stub._api(self.path[len("/api/"):], body)).encode())
+                else:
+                    self._reply(200, b"ok")
+
+            def _reply(self, status, body, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubWebhook":
+        """Start serving on a free localhost port."""
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        threading.Thread(target=self._server.serve_forever, name="stub-webhook", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving. Stalled requests are abandoned."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset(self) -> None:
+        """Zero the request counters."""
+        with self._lock:
+            for key in self.counts:
+                self.counts[key] = 0
+            self.bytes_received = 0
+            for key in self.api_calls:
+                self.api_calls[key] = 0
+            self.messages.clear()
+
+    def __enter__(self) -> "StubWebhook":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,289 @@
+"""
+Benchmark suite: formatting cost, end-to-end latency and throughput.
+
+Runs every scenario against a local stub webhook (see stub_server.py) and
+prints a table. With --output the results are written as JSON; with
+--baseline they are compared against a previous run and the script exits
+with status 1 if any result regressed by more than --tolerance.
+
+Scenarios:
+    format.<shape>      render + fit + encode one payload, per payload shape
+    sync.*              latency of SlackLogger.error(), waiting for delivery
+    async.*             latency of SlackLogger.error(async_send=True) for
+                        the caller, and the rate at which the queue drains
+    threads.<n>         sync messages per second from n concurrent threads
+
+Client-side rate limiting is disabled and retry delays are shortened, so
+the numbers measure the library rather than its pacing. Stub faults are
+off by default and can be injected with --latency, --error-rate,
+--rate-limit-rate and --stall-rate. --metrics turns on delivery metrics
+to measure their overhead.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--output results.json]
+    python benchmarks/suite.py --baseline baseline.json [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+# Must be set before the logger reads its configuration
+os.environ["SLACK_LOGGER_RATE_LIMIT"] = "0"
+os.environ["SLACK_LOGGER_RETRY_DELAY"] = "0.01"
+os.environ["SLACK_LOGGER_RETRY_MAX_DELAY"] = "0.05"
+
+from slack_logger import SlackLogger  # noqa: E402
+from slack_logger.formatter import LogLevel, SlackMessageFormatter  # noqa: E402
+from slack_logger.limits import fit_payload  # noqa: E402
+from slack_logger.serialization import dumps, encoder_name  # noqa: E402
+from stub_server import StubWebhook  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+
+def _recurse(depth: int) -> None:
+    if depth == 0:
+        raise ValueError("bottom of the stack")
+    _recurse(depth - 1)
+
+
+def _exception(depth: int) -> BaseException:
+    try:
+        _recurse(depth)
+    except ValueError as e:
+        return e
+
+
+def _large_context() -> Dict[str, Any]:
+    return {
+        f"field_{i}": {
+            "id": i,
+            "name": f"item-{i}",
+            "tags": ["alpha", "beta", "gamma"],
+            "nested": {"values": list(range(20)), "flag": i % 2 == 0},
+        }
+        for i in range(200)
+    }
+
+
+def _payload_shapes() -> Dict[str, Dict[str, Any]]:
+    """Keyword arguments for MessageTemplate.render, per payload shape."""
+    return {
+        "plain": {"message": "Payment provider returned an error"},
+        "exception": {"message": "Checkout failed", "exception": _exception(3)},
+        "deep_traceback": {"message": "Recursion blew up", "exception": _exception(400)},
+        "large_context": {"message": "Batch import failed", "additional_context": _large_context()},
+    }
+
+
+class Results:
+    """Collects named measurements with their unit and direction."""
+
+    def __init__(self):
+        self.values: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, name: str, value: float, unit: str, better: str = "lower") -> None:
+        self.values[name] = {"value": round(value, 6), "unit": unit, "better": better}
+        print(f"  {name:<28} {value:12.3f} {unit}")
+
+
+def _median_rate(func: Callable[[], None], iterations: int, repeats: int = 5) -> float:
+    """Median seconds per call of ``func`` over ``repeats`` timed loops."""
+    func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter() - start) / iterations)
+    return statistics.median(samples)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_format(results: Results, iterations: int) -> None:
+    """Per-payload cost of rendering, fitting to Slack's limits and encoding."""
+    template = SlackMessageFormatter.compile("bench-service", LogLevel.ERROR)
+    for shape, kwargs in _payload_shapes().items():
+        def run():
+            for part in fit_payload(template.render(**kwargs)):
+                dumps(part)
+        results.add(f"format.{shape}", _median_rate(run, iterations) * 1e6, "us")
+
+
+def bench_sync(results: Results, logger: SlackLogger, messages: int) -> None:
+    """Latency of a blocking SlackLogger.error call, delivery included."""
+    logger.error("warm up")
+    samples = []
+    for i in range(messages):
+        start = time.perf_counter()
+        logger.error(f"sync message {i}", additional_context={"index": i})
+        samples.append(time.perf_counter() - start)
+    results.add("sync.p50", _percentile(samples, 0.50) * 1e3, "ms")
+    results.add("sync.p99", _percentile(samples, 0.99) * 1e3, "ms")
+    results.add("sync.throughput", messages / sum(samples), "msg/s", better="higher")
+
+
+def bench_async(results: Results, logger: SlackLogger, messages: int) -> None:
+    """Caller-side latency of async_send and the rate the queue drains at."""
+    logger.error("warm up", async_send=True)
+    logger.flush(10)
+    samples = []
+    begin = time.perf_counter()
+    for i in range(messages):
+        start = time.perf_counter()
+        logger.error(f"async message {i}", additional_context={"index": i}, async_send=True)
+        samples.append(time.perf_counter() - start)
+    logger.flush(60)
+    elapsed = time.perf_counter() - begin
+    results.add("async.enqueue_p50", _percentile(samples, 0.50) * 1e6, "us")
+    results.add("async.enqueue_p99", _percentile(samples, 0.99) * 1e6, "us")
+    results.add("async.throughput", messages / elapsed, "msg/s", better="higher")
+
+
+def bench_threads(results: Results, logger: SlackLogger, thread_counts: List[int], messages: int) -> None:
+    """Sync messages per second with several threads logging at once."""
+    for count in thread_counts:
+        per_thread = max(1, messages // count)
+        barrier = threading.Barrier(count + 1)
+
+        def worker():
+            barrier.wait()
+            for i in range(per_thread):
+                logger.error(f"threaded message {i}")
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results.add(f"threads.{count}", per_thread * count / elapsed, "msg/s", better="higher")
+
+
+def compare(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        current: Results of this run
+        baseline: Results of a previous run
+        tolerance: Allowed relative change in the worse direction
+
+    Returns:
+        Names of the results that regressed
+    """
+    regressed = []
+    print(f"\n{'result':<28} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["value"], result["value"]
+        change = (new - old) / old if old else 0.0
+        worse = change > tolerance if result["better"] == "lower" else change < -tolerance
+        if worse:
+            regressed.append(name)
+        flag = "  REGRESSED" if worse else ""
+        print(f"{name:<28} {old:12.3f} {new:12.3f} {change:+8.1%}{flag}")
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer iterations and thread counts")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results JSON from a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression, e.g. 0.25 = 25%%")
+    parser.add_argument("--metrics", action="store_true", help="run with delivery metrics enabled")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub response latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="Retry-After of injected 429s")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="fraction of requests that hang")
+    parser.add_argument("--stall", type=float, default=5.0, help="seconds a stalled request hangs")
+    args = parser.parse_args()
+
+    # Retry warnings under injected faults would dominate the timings
+    logging.getLogger("slack_logger").setLevel(logging.ERROR)
+    scale = 0.2 if args.quick else 1.0
+    thread_counts = [1, 4, 16, 64] if args.quick else [1, 2, 4, 8, 16, 32, 64]
+    results = Results()
+
+    print(f"JSON encoder: {encoder_name()}")
+    print("format")
+    bench_format(results, int(2000 * scale))
+
+    stub = StubWebhook(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        stall_rate=args.stall_rate,
+        stall=args.stall
+    )
+    with stub:
+        # One pool large enough for the widest thread count
+        logger = SlackLogger(
+            webhook_url=stub.url,
+            service_name="bench-service",
+            timeout=1,
+            pool_size=max(thread_counts),
+            queue_size=int(5000 * scale) + 1,
+            metrics=args.metrics
+        )
+        print("end to end")
+        bench_sync(results, logger, int(1000 * scale))
+        bench_async(results, logger, int(5000 * scale))
+        print("threads")
+        bench_threads(results, logger, thread_counts, int(2000 * scale))
+        logger.close(5)
+        stub_counts = dict(stub.counts)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "encoder": encoder_name(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "args": vars(args),
+            "stub": stub_counts,
+            "circuit": logger.circuit_state(),
+            "metrics": logger.stats(),
+        },
+        "results": results.values,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\nwrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressed = compare(results.values, baseline["results"], args.tolerance)
+        if regressed:
+            print(f"\n{len(regressed)} result(s) regressed by more than {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(10000)
+    main()
@@ -38,5 +38,14 @@ setup(
         "requests>=2.28.0",
         "python-dotenv>=0.19.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8.0"],
+        "fast": ["orjson>=3.6.0"],
+    },
+    entry_points={
+        "console_scripts": [
+            "slack-logger-relay=slack_logger.relay:main",
+        ],
+    },
 )
 
@@ -3,9 +3,23 @@ Slack Error Logger - A Python library for centralized error logging to Slack.
 """
 
 from .logger import SlackLogger
+from .delivery import DropPolicy
+from .handler import SlackLoggingHandler
+from .hooks import install_hooks
+from .metrics import render_prometheus
 
 __version__ = "1.0.0"
-__all__ = ["SlackLogger"]
+__all__ = [
+    "SlackLogger", "AsyncSlackLogger", "SlackLoggingHandler", "DropPolicy", "render_prometheus", "install_hooks"
+]
+
+
+def __getattr__(name):
+    # AsyncSlackLogger pulls in asyncio; import it only when asked for
+    if name == "AsyncSlackLogger":
+        from .async_logger import AsyncSlackLogger
+        return AsyncSlackLogger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
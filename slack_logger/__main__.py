@@ -0,0 +1,75 @@
+"""
+Command line interface: python -m slack_logger <command>.
+
+Commands:
+    replay    Deliver messages left in an on-disk spool
+    relay     Run the host-local relay (same as slack-logger-relay)
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+from .client import SlackWebhookClient
+from .config import Config
+from .relay import main as relay_main
+from .spool import Spool
+
+
+def _replay(args: argparse.Namespace) -> int:
+    webhook_url = Config.get_webhook_url(args.webhook_url)
+    if not webhook_url:
+        print("error: --webhook-url or SLACK_WEBHOOK_URL is required", file=sys.stderr)
+        return 2
+    spool_dir = Config.get_spool_dir(args.spool_dir)
+    if not spool_dir:
+        print("error: --spool-dir or SLACK_LOGGER_SPOOL_DIR is required", file=sys.stderr)
+        return 2
+
+    try:
+        spool = Spool(spool_dir, fsync=Config.get_spool_fsync(), max_bytes=Config.get_spool_max_bytes())
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    pending = len(spool)
+    # Routed messages go back to the webhooks they were routed to
+    clients = {}
+
+    def deliver(payload, url):
+        url = url or webhook_url
+        if url not in clients:
+            clients[url] = SlackWebhookClient(url)
+        return clients[url].deliver(payload)
+
+    delivered = spool.replay(deliver, rate=args.rate)
+    remaining = len(spool)
+    spool.close()
+    print(f"Replayed {delivered} of {pending} spooled messages")
+    return 0 if not remaining else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m slack_logger")
+    subcommands = parser.add_subparsers(dest="command")
+    subcommands.required = True
+
+    replay = subcommands.add_parser("replay", help="deliver messages left in an on-disk spool")
+    replay.add_argument("--spool-dir", help="spool directory (default: SLACK_LOGGER_SPOOL_DIR)")
+    replay.add_argument("--webhook-url", help="Slack webhook URL (default: SLACK_WEBHOOK_URL)")
+    replay.add_argument("--rate", type=float, default=1.0, help="maximum messages per second (default: 1)")
+    replay.set_defaults(handler=_replay)
+
+    # Listed for --help only; "relay" is dispatched to the relay's own parser below
+    subcommands.add_parser("relay", help="run the host-local relay (see slack-logger-relay --help)")
+
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "relay":
+        return relay_main(argv[1:])
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
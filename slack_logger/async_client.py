@@ -0,0 +1,194 @@
+"""
+Non-blocking HTTP client for sending messages to Slack webhook from asyncio code.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+from .breaker import CircuitBreaker, get_circuit_breaker
+from .config import Config
+from .ratelimit import TokenBucket, get_rate_limiter, parse_retry_after
+from .retry import RetryPolicy
+from .serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+
+def _import_aiohttp():
+    """Import aiohttp, explaining how to install it if it is missing."""
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "AsyncSlackLogger requires aiohttp. Install it with "
+            "'pip install slack-error-logger[async]' or 'pip install aiohttp'."
+        )
+    return aiohttp
+
+
+class AsyncSlackWebhookClient:
+    """Asyncio client for sending messages to Slack via webhook."""
+
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Initialize the async Slack webhook client.
+
+        The aiohttp session is created lazily inside the running event loop
+        on the first send.
+
+        Args:
+            webhook_url: Slack incoming webhook URL
+            timeout: HTTP request timeout in seconds
+            pool_size: Maximum number of pooled connections
+            retry_policy: Backoff and deadline settings. Defaults to
+                         Config.get_retry_policy().
+        """
+        self._aiohttp = _import_aiohttp()
+        self.webhook_url = webhook_url
+        self.timeout = timeout or Config.get_timeout()
+        self.retry_policy = retry_policy or Config.get_retry_policy()
+        self.pool_size = pool_size or Config.get_pool_size()
+        self._session = None
+
+        rate = Config.get_rate_limit()
+        self.rate_limiter: Optional[TokenBucket] = None
+        if rate > 0:
+            self.rate_limiter = get_rate_limiter(webhook_url, rate, Config.get_rate_burst())
+
+        breaker_settings = Config.get_breaker_settings()
+        self.breaker: Optional[CircuitBreaker] = None
+        if breaker_settings is not None:
+            self.breaker = get_circuit_breaker(webhook_url, **breaker_settings)
+
+    def _get_session(self):
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                headers={"Content-Type": "application/json"}
+            )
+        return self._session
+
+    async def send(self, payload: Dict[str, Any]) -> bool:
+        """
+        Send a message to Slack webhook with retry logic.
+
+        Follows the client's RetryPolicy and shares the webhook's rate
+        limiter with SlackWebhookClient.send, but waits with asyncio.sleep,
+        so other tasks keep running. The payload is encoded to JSON once for
+        all attempts. Attempts are reported to the webhook's circuit breaker,
+        shared with SlackWebhookClient; while it is open, this returns False
+        without sending.
+
+        Args:
+            payload: Slack message payload (blocks or text)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        session = self._get_session()
+        data = dumps(payload)
+        policy = self.retry_policy
+        breaker = self.breaker
+        deadline = policy.start()
+        for attempt in range(policy.max_attempts):
+            if breaker is not None and not breaker.allow():
+                return False
+
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(min(self.timeout, deadline.remaining()))
+                if wait is None:
+                    logger.warning(
+                        f"Slack webhook rate limit leaves no time before the deadline "
+                        f"(attempt {attempt + 1}/{policy.max_attempts})"
+                    )
+                    return False
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            attempt_timeout = min(self.timeout, deadline.remaining())
+            if attempt_timeout <= 0:
+                break
+
+            try:
+                async with session.post(
+                    self.webhook_url,
+                    data=data,
+                    timeout=self._aiohttp.ClientTimeout(total=attempt_timeout)
+                ) as response:
+                    body = await response.text()
+
+                # Anything below 500 shows the webhook is up
+                if breaker is not None:
+                    if response.status >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                # Slack returns 200 for successful webhook posts
+                if response.status == 200:
+                    return True
+
+                # Rate limited: back off the shared bucket, then retry
+                if response.status == 429:
+                    retry_after = parse_retry_after(response.headers)
+                    if self.rate_limiter is None:
+                        # Nothing to pause; don't hold the task for Retry-After
+                        logger.warning(f"Slack webhook rate limited for {retry_after}s")
+                        return False
+                    self.rate_limiter.pause(retry_after)
+                    # Waiting out a pause that outlasts the deadline would
+                    # only end in a timeout; give up as rate limited instead.
+                    # The next attempt waits for a token at most this long.
+                    remaining = min(self.timeout, deadline.remaining())
+                    if attempt == policy.max_attempts - 1 or retry_after >= remaining:
+                        logger.warning(
+                            f"Slack webhook rate limited for {retry_after}s, "
+                            f"only {max(0.0, remaining):.1f}s left to wait"
+                        )
+                        return False
+                    logger.warning(
+                        f"Slack webhook rate limited, retrying after {retry_after}s "
+                        f"(attempt {attempt + 1}/{policy.max_attempts})"
+                    )
+                    continue
+
+                # Log error but don't raise exception
+                logger.warning(
+                    f"Slack webhook returned status {response.status}: {body}"
+                )
+
+                # If it's a client error (4xx), don't retry
+                if 400 <= response.status < 500:
+                    return False
+
+            except asyncio.TimeoutError:
+                logger.warning(f"Slack webhook request timed out (attempt {attempt + 1}/{policy.max_attempts})")
+                if breaker is not None:
+                    breaker.record_failure()
+            except self._aiohttp.ClientError as e:
+                logger.warning(f"Slack webhook request failed (attempt {attempt + 1}/{policy.max_attempts}): {e}")
+                if breaker is not None:
+                    breaker.record_failure()
+
+            # Back off before retrying, unless that would run past the deadline
+            if attempt < policy.max_attempts - 1:
+                delay = policy.backoff(attempt)
+                if delay >= deadline.remaining():
+                    break
+                await asyncio.sleep(delay)
+
+        return False
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
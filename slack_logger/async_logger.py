@@ -0,0 +1,317 @@
+"""
+Asyncio variant of SlackLogger for FastAPI, aiohttp and other event-loop services.
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Set, Union
+from .config import Config
+from .async_client import AsyncSlackWebhookClient
+from .formatter import SlackMessageFormatter, LogLevel
+from .limits import fit_payload
+from .retry import RetryPolicy
+from .scrubber import Scrubber
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSlackLogger:
+    """
+    Slack Logger whose logging methods are coroutines.
+
+    Usage:
+        logger = AsyncSlackLogger(webhook_url="...", service_name="my-service")
+        await logger.error("Something went wrong", exception=e)
+
+        # Fire and forget: schedule delivery and return immediately
+        await logger.error("Something went wrong", exception=e, background=True)
+
+        # On shutdown
+        await logger.close()
+
+    Requires the optional ``aiohttp`` dependency.
+    """
+
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        service_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        scrubber: Optional[Union[bool, Scrubber]] = None
+    ):
+        """
+        Initialize the async Slack Logger.
+
+        Args:
+            webhook_url: Slack incoming webhook URL. If not provided, will try
+                        to get from SLACK_WEBHOOK_URL environment variable.
+            service_name: Name of the service using this logger. If not provided,
+                         will try to get from SLACK_LOGGER_SERVICE_NAME environment
+                         variable, or default to "unknown-service".
+            timeout: HTTP request timeout in seconds. Defaults to 10.
+            pool_size: Maximum number of pooled HTTP connections. Defaults to 10.
+            retry_policy: Backoff and per-message deadline. Defaults to the
+                         SLACK_LOGGER_RETRY_* and SLACK_LOGGER_DEADLINE settings.
+            scrubber: Redacts secrets before sending, as for SlackLogger.
+                     Defaults to SLACK_LOGGER_SCRUB, or True.
+
+        Raises:
+            ValueError: If webhook_url is not provided and not found in environment,
+                       or a scrub pattern is not a valid regular expression.
+            ImportError: If aiohttp is not installed.
+        """
+        self.webhook_url = Config.get_webhook_url(webhook_url)
+        if not self.webhook_url:
+            raise ValueError(
+                "webhook_url must be provided either as parameter or "
+                "SLACK_WEBHOOK_URL environment variable"
+            )
+
+        self.service_name = Config.get_service_name(service_name)
+        # Header, divider and fallback prefix are built once per level
+        self._templates = {
+            level: SlackMessageFormatter.compile(self.service_name, level)
+            for level in LogLevel
+        }
+        self.scrubber = Config.get_scrubber(scrubber)
+        self.client = AsyncSlackWebhookClient(
+            self.webhook_url,
+            timeout=timeout,
+            pool_size=pool_size,
+            retry_policy=retry_policy
+        )
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "AsyncSlackLogger":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of background deliveries that have not finished yet."""
+        return len(self._tasks)
+
+    async def _send(self, payloads: List[Dict[str, Any]]) -> bool:
+        """Send payloads in order, logging instead of raising on failure."""
+        sent = True
+        for payload in payloads:
+            try:
+                sent = await self.client.send(payload) and sent
+            except Exception as e:
+                logger.error(f"Failed to send log to Slack: {e}", exc_info=True)
+                sent = False
+        return sent
+
+    async def _log(
+        self,
+        message: str,
+        level: LogLevel,
+        exception: Optional[Exception] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        background: bool = False
+    ) -> bool:
+        """
+        Internal method to log a message.
+
+        Args:
+            message: The message to log
+            level: Log level
+            exception: Optional exception object
+            additional_context: Optional dictionary with additional context
+            background: If True, schedule delivery as a tracked task and
+                       return without waiting for Slack
+
+        Returns:
+            True if sent successfully (or scheduled, when background is True),
+            False otherwise
+        """
+        try:
+            # Oversized payloads continue in follow-up messages
+            payloads = fit_payload(self._templates[level].render(
+                message,
+                exception=exception,
+                additional_context=additional_context,
+                scrubber=self.scrubber
+            ))
+        except Exception as e:
+            # Prevent logging errors from breaking the application
+            logger.error(f"Failed to send log to Slack: {e}", exc_info=True)
+            return False
+
+        if background:
+            task = asyncio.ensure_future(self._send(payloads))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return True
+        return await self._send(payloads)
+
+    async def info(
+        self,
+        message: str,
+        additional_context: Optional[Dict[str, Any]] = None,
+        background: bool = False
+    ) -> bool:
+        """
+        Log an info message.
+
+        Args:
+            message: The message to log
+            additional_context: Optional dictionary with additional context
+            background: If True, schedule delivery and return immediately
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        return await self._log(
+            message=message,
+            level=LogLevel.INFO,
+            exception=None,
+            additional_context=additional_context,
+            background=background
+        )
+
+    async def warning(
+        self,
+        message: str,
+        exception: Optional[Exception] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        background: bool = False
+    ) -> bool:
+        """
+        Log a warning message.
+
+        Args:
+            message: The message to log
+            exception: Optional exception object
+            additional_context: Optional dictionary with additional context
+            background: If True, schedule delivery and return immediately
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        return await self._log(
+            message=message,
+            level=LogLevel.WARNING,
+            exception=exception,
+            additional_context=additional_context,
+            background=background
+        )
+
+    async def error(
+        self,
+        message: str,
+        exception: Optional[Exception] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        background: bool = False
+    ) -> bool:
+        """
+        Log an error message.
+
+        Args:
+            message: The message to log
+            exception: Optional exception object
+            additional_context: Optional dictionary with additional context
+            background: If True, schedule delivery and return immediately
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        return await self._log(
+            message=message,
+            level=LogLevel.ERROR,
+            exception=exception,
+            additional_context=additional_context,
+            background=background
+        )
+
+    async def critical(
+        self,
+        message: str,
+        exception: Optional[Exception] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        background: bool = False
+    ) -> bool:
+        """
+        Log a critical message.
+
+        Args:
+            message: The message to log
+            exception: Optional exception object
+            additional_context: Optional dictionary with additional context
+            background: If True, schedule delivery and return immediately
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        return await self._log(
+            message=message,
+            level=LogLevel.CRITICAL,
+            exception=exception,
+            additional_context=additional_context,
+            background=background
+        )
+
+    async def log_exception(
+        self,
+        message: str,
+        exception: Exception,
+        additional_context: Optional[Dict[str, Any]] = None,
+        background: bool = False
+    ) -> bool:
+        """
+        Convenience method to log an exception as an error.
+
+        Args:
+            message: The message to log
+            exception: The exception object
+            additional_context: Optional dictionary with additional context
+            background: If True, schedule delivery and return immediately
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        return await self.error(
+            message=message,
+            exception=exception,
+            additional_context=additional_context,
+            background=background
+        )
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background deliveries to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if every background delivery finished within the timeout
+        """
+        if not self._tasks:
+            return True
+        done, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        return not pending
+
+    async def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drain background deliveries, cancel stragglers and close connections.
+
+        Args:
+            timeout: Maximum seconds to wait for pending deliveries
+
+        Returns:
+            True if no delivery had to be cancelled
+        """
+        drained = await self.drain(timeout)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            # Let the cancelled deliveries unwind before the session closes
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self.client.close()
+        return drained
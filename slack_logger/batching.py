@@ -0,0 +1,130 @@
+"""
+Coalescing of several Slack payloads into one webhook message.
+"""
+
+from typing import Any, Dict, List, Tuple
+from .envelope import Envelope
+from .limits import MAX_BLOCKS
+from .serialization import dumps
+
+_DIVIDER = {"type": "divider"}
+_DIVIDER_SIZE = len('{"type":"divider"}') + 1
+
+
+class PayloadBatcher:
+    """
+    Merges payloads into as few Slack messages as the limits allow.
+
+    Entries are joined with a divider block. A merged message never exceeds
+    ``max_blocks`` blocks or ``max_bytes`` of encoded JSON; blocks themselves
+    are never modified, so per-section text limits hold as long as they held
+    for each input payload.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 20,
+        linger: float = 0.2,
+        max_blocks: int = MAX_BLOCKS,
+        max_bytes: int = 30000
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch: Maximum number of payloads merged into one message
+            linger: Seconds to wait for more payloads before sending a batch
+            max_blocks: Block budget per merged message
+            max_bytes: Encoded JSON budget per merged message
+        """
+        self.max_batch = max(1, int(max_batch))
+        self.linger = linger
+        self.max_blocks = min(MAX_BLOCKS, max(1, int(max_blocks)))
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _size(payload: Dict[str, Any]) -> int:
+        return len(dumps(payload))
+
+    def merge(self, envelopes: List[Envelope]) -> List[Envelope]:
+        """
+        Merge payloads into messages that fit the block and byte budgets.
+
+        Only envelopes bound for the same destinations are merged; threaded
+        envelopes are never merged.
+
+        Args:
+            envelopes: Envelopes in delivery order
+
+        Returns:
+            Envelopes of the merged payloads, in delivery order per destination
+        """
+        if len(envelopes) <= 1:
+            return list(envelopes)
+
+        by_destination: Dict[Tuple[str, ...], List[Envelope]] = {}
+        for envelope in envelopes:
+            by_destination.setdefault(envelope.destinations, []).append(envelope)
+        merged = []
+        for group in by_destination.values():
+            merged.extend(self._merge_group(group))
+        return merged
+
+    def _merge_group(self, envelopes: List[Envelope]) -> List[Envelope]:
+        """Merge envelopes that share their destinations."""
+        merged = []
+        group: List[Envelope] = []
+        blocks = 0
+        size = 0
+        for envelope in envelopes:
+            if envelope.thread_key is not None:
+                # Counted against its parent message, so it must stay whole
+                if group:
+                    merged.append(self._combine(group))
+                    group, blocks, size = [], 0, 0
+                merged.append(envelope)
+                continue
+            payload_blocks = len(envelope.payload.get("blocks", ()))
+            payload_size = self._size(envelope.payload)
+            if group and (
+                blocks + 1 + payload_blocks > self.max_blocks
+                or size + _DIVIDER_SIZE + payload_size > self.max_bytes
+            ):
+                merged.append(self._combine(group))
+                group, blocks, size = [], 0, 0
+            if group:
+                blocks += 1
+                size += _DIVIDER_SIZE
+            group.append(envelope)
+            blocks += payload_blocks
+            size += payload_size
+        if group:
+            merged.append(self._combine(group))
+        return merged
+
+    @staticmethod
+    def _combine(group: List[Envelope]) -> Envelope:
+        """Join a group of payloads with dividers between entries."""
+        if len(group) == 1:
+            return group[0]
+
+        blocks = []
+        spool_ids = []
+        for index, envelope in enumerate(group):
+            if index:
+                blocks.append(_DIVIDER)
+            blocks.extend(envelope.payload.get("blocks", ()))
+            spool_ids.extend(envelope.spool_ids)
+
+        text = group[0].payload.get("text", "")
+        payload = {
+            "blocks": blocks,
+            "text": f"{text} (+{len(group) - 1} more)",
+        }
+        return Envelope(
+            payload,
+            spool_ids,
+            priority=max(envelope.priority for envelope in group),
+            sample_rate=min(envelope.sample_rate for envelope in group),
+            destinations=group[0].destinations
+        )
@@ -0,0 +1,201 @@
+"""
+Per-webhook circuit breaker.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Dict
+
+
+class CircuitState(Enum):
+    """State of a CircuitBreaker."""
+    CLOSED = "closed"        # requests flow normally
+    OPEN = "open"            # requests are rejected without being sent
+    HALF_OPEN = "half_open"  # one probe request is testing recovery
+
+
+class CircuitBreaker:
+    """
+    Stops sending to a webhook that keeps failing.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, or
+    when at least half of the last ``window`` attempts were recorded and
+    ``failure_rate`` of them failed. While open, ``allow`` returns False
+    immediately. After ``reset_timeout`` seconds the circuit goes half-open
+    and lets exactly one probe through: its success closes the circuit,
+    its failure opens it for another ``reset_timeout``. A probe that never
+    reports back is replaced after ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        reset_timeout: float = 30.0
+    ):
+        """
+        Initialize the breaker closed.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            failure_rate: Failure ratio over the window that opens the circuit
+            window: Number of recent attempts the failure rate is computed over
+            reset_timeout: Seconds the circuit stays open before a probe
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.failure_rate = failure_rate
+        self.window = max(1, int(window))
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes = deque(maxlen=self.window)
+        self._failures_in_window = 0
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, without triggering a transition."""
+        return self._state
+
+    @property
+    def rejecting(self) -> bool:
+        """
+        True if ``allow`` would currently refuse a request.
+
+        Unlike ``allow``, this never starts a probe, so callers can use it
+        to route messages to a fallback before doing any work.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state is CircuitState.OPEN:
+                return now - self._opened_at < self.reset_timeout
+            if self._state is CircuitState.HALF_OPEN:
+                return now - self._probe_started < self.reset_timeout
+            return False
+
+    def allow(self) -> bool:
+        """
+        Ask permission to send one request.
+
+        Returns:
+            True if the request may be sent (possibly as the recovery probe)
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state is CircuitState.OPEN and now - self._opened_at >= self.reset_timeout:
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started = now
+                return True
+            if self._state is CircuitState.HALF_OPEN and now - self._probe_started >= self.reset_timeout:
+                self._probe_started = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Report a request the webhook handled (any non-server-error response)."""
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state is not CircuitState.CLOSED:
+                self._close()
+                return
+            self._record(False)
+
+    def record_failure(self) -> None:
+        """Report a request that failed (timeout, connection error or 5xx)."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state is not CircuitState.CLOSED:
+                self._open()
+                return
+            self._record(True)
+            if self._consecutive_failures >= self.failure_threshold or (
+                len(self._outcomes) * 2 >= self.window
+                and self._failures_in_window >= self.failure_rate * len(self._outcomes)
+            ):
+                self._open()
+
+    def _record(self, failed: bool) -> None:
+        """Add an outcome to the sliding window. Caller holds the lock."""
+        if len(self._outcomes) == self.window and self._outcomes[0]:
+            self._failures_in_window -= 1
+        self._outcomes.append(failed)
+        if failed:
+            self._failures_in_window += 1
+
+    def _open(self) -> None:
+        """Caller holds the lock."""
+        if self._state is not CircuitState.OPEN:
+            self.opened += 1
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._failures_in_window = 0
+
+    def _close(self) -> None:
+        """Caller holds the lock."""
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures_in_window = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the breaker's current state.
+
+        Returns:
+            Dictionary with the state, failure counters, seconds until the
+            next probe (while open) and rejection and opening counts
+        """
+        with self._lock:
+            retry_in = 0.0
+            if self._state is CircuitState.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_rate": (
+                    self._failures_in_window / len(self._outcomes) if self._outcomes else 0.0
+                ),
+                "retry_in": round(retry_in, 3),
+                "rejected": self.rejected,
+                "opened": self.opened,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(webhook_url: str, **settings: Any) -> CircuitBreaker:
+    """
+    Return the shared circuit breaker for ``webhook_url``.
+
+    Every client posting to the same webhook shares one breaker. Its
+    settings are fixed by the first caller for that webhook.
+
+    Args:
+        webhook_url: Slack incoming webhook URL
+        **settings: CircuitBreaker arguments, used if it has to be created
+
+    Returns:
+        Shared CircuitBreaker instance
+    """
+    breaker = _breakers.get(webhook_url)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(webhook_url)
+            if breaker is None:
+                breaker = CircuitBreaker(**settings)
+                _breakers[webhook_url] = breaker
+    return breaker
@@ -4,51 +4,198 @@ HTTP client for sending messages to Slack webhook.
 
 import time
 import logging
-from typing import Dict, Any, Optional
-import requests
+from enum import Enum
+from typing import Dict, Any, Optional, Tuple
+from .breaker import CircuitBreaker, get_circuit_breaker
 from .config import Config
+from .metrics import Metrics
+from .ratelimit import TokenBucket, get_rate_limiter, parse_retry_after
+from .retry import RetryPolicy
+from .serialization import dumps
+from .transport import get_transport, load_requests
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class SendResult(Enum):
+    """Outcome of delivering one payload."""
+    SENT = "sent"
+    REJECTED = "rejected"            # 4xx other than 429; resending can't succeed
+    RATE_LIMITED = "rate_limited"    # Retry-After runs past the deadline
+    CIRCUIT_OPEN = "circuit_open"    # the webhook's circuit breaker refused it
+    FAILED = "failed"                # timeouts, connection errors, 5xx
+    
+    @property
+    def retryable(self) -> bool:
+        """True if the payload may be delivered by a later attempt."""
+        return self is not SendResult.SENT and self is not SendResult.REJECTED
+
 
 class SlackWebhookClient:
     """Client for sending messages to Slack via webhook."""
     
-    def __init__(self, webhook_url: str, timeout: Optional[int] = None):
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None
+    ):
         """
         Initialize the Slack webhook client.
         
         Args:
             webhook_url: Slack incoming webhook URL
             timeout: HTTP request timeout in seconds
+            pool_size: Keep-alive connections per webhook host. The pool is
+                      shared by every client posting to the same host.
+            retry_policy: Backoff and deadline settings. Defaults to
+                         Config.get_retry_policy().
+            metrics: Records serialize and HTTP timings, retries and
+                    in-flight requests. None disables recording.
         """
         self.webhook_url = webhook_url
+        self.metrics = metrics
         self.timeout = timeout or Config.get_timeout()
-        self.retry_count = Config.get_retry_count()
-        self.retry_delay = Config.get_retry_delay()
+        self.retry_policy = retry_policy or Config.get_retry_policy()
+        self.retry_count = self.retry_policy.max_attempts
+        self.retry_delay = self.retry_policy.base_delay
+        self.transport = get_transport(webhook_url, pool_size or Config.get_pool_size())
+        
+        rate = Config.get_rate_limit()
+        self.rate_limiter: Optional[TokenBucket] = None
+        if rate > 0:
+            self.rate_limiter = get_rate_limiter(webhook_url, rate, Config.get_rate_burst())
+        
+        breaker_settings = Config.get_breaker_settings()
+        self.breaker: Optional[CircuitBreaker] = None
+        if breaker_settings is not None:
+            self.breaker = get_circuit_breaker(webhook_url, **breaker_settings)
     
     def send(self, payload: Dict[str, Any]) -> bool:
         """
         Send a message to Slack webhook with retry logic.
         
+        Attempts follow the client's RetryPolicy: exponential backoff with
+        full jitter between attempts and one deadline for the whole message.
+        Each attempt's HTTP timeout is capped by the budget left, and the
+        client never sleeps past the deadline.
+        
+        Each attempt first takes a token from the webhook's rate limiter.
+        A 429 response pauses the limiter for the Retry-After period and the
+        message is retried once the pause is over, instead of being dropped.
+        Without a rate limiter there is nothing to pause, so a 429 ends the
+        send as RATE_LIMITED rather than sleeping on the caller's thread.
+        
+        The payload is encoded to JSON once and the same body is reused by
+        every attempt.
+        
+        Every attempt is reported to the webhook's circuit breaker. While
+        the circuit is open, ``send`` returns False at once without
+        touching the network.
+        
         Args:
             payload: Slack message payload (blocks or text)
             
         Returns:
             True if successful, False otherwise
         """
-        for attempt in range(self.retry_count):
-            try:
-                response = requests.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=self.timeout,
-                    headers={"Content-Type": "application/json"}
+        return self.deliver(payload) is SendResult.SENT
+    
+    def deliver(self, payload: Dict[str, Any]) -> SendResult:
+        """
+        Send a message like ``send``, reporting why delivery failed.
+        
+        Args:
+            payload: Slack message payload (blocks or text)
+            
+        Returns:
+            SendResult of the last attempt
+        """
+        return self._send_body(self.webhook_url, self._encode(payload), _JSON_HEADERS)[0]
+    
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        """Encode a payload to JSON, recording serialize timing."""
+        metrics = self.metrics
+        if metrics is None:
+            return dumps(payload)
+        started = time.perf_counter()
+        body = dumps(payload)
+        metrics.observe("serialize", time.perf_counter() - started)
+        return body
+    
+    def _send_body(self, url: str, body: bytes, headers: Dict[str, str]) -> Tuple[SendResult, Any]:
+        """
+        POST an encoded body with the retry, rate limit and breaker logic of ``send``.
+        
+        Returns:
+            (SendResult, the 200 response or None)
+        """
+        requests = load_requests()
+        metrics = self.metrics
+        policy = self.retry_policy
+        breaker = self.breaker
+        deadline = policy.start()
+        for attempt in range(policy.max_attempts):
+            if breaker is not None and not breaker.allow():
+                return SendResult.CIRCUIT_OPEN, None
+            
+            if self.rate_limiter is not None and not self.rate_limiter.acquire(
+                min(self.timeout, deadline.remaining())
+            ):
+                logger.warning(
+                    f"Slack webhook rate limit leaves no time before the deadline "
+                    f"(attempt {attempt + 1}/{policy.max_attempts})"
                 )
+                return SendResult.RATE_LIMITED, None
+            
+            attempt_timeout = min(self.timeout, deadline.remaining())
+            if attempt_timeout <= 0:
+                break
+            
+            if attempt and metrics is not None:
+                metrics.inc("retried")
+            
+            try:
+                response = self._post(url, body, attempt_timeout, headers)
+                
+                # Anything below 500 shows the webhook is up
+                if breaker is not None:
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
                 
                 # Slack returns 200 for successful webhook posts
                 if response.status_code == 200:
-                    return True
+                    return SendResult.SENT, response
+                
+                # Rate limited: back off the shared bucket, then retry
+                if response.status_code == 429:
+                    retry_after = parse_retry_after(response.headers)
+                    if self.rate_limiter is None:
+                        # Leave the wait to the fallback or the spool replay
+                        logger.warning(f"Slack webhook rate limited for {retry_after}s")
+                        return SendResult.RATE_LIMITED, None
+                    self.rate_limiter.pause(retry_after)
+                    # Waiting out a pause that outlasts the deadline would
+                    # only end in a timeout; report it as rate limited instead.
+                    # The next attempt waits for a token at most this long.
+                    remaining = min(self.timeout, deadline.remaining())
+                    if attempt == policy.max_attempts - 1 or retry_after >= remaining:
+                        logger.warning(
+                            f"Slack webhook rate limited for {retry_after}s, "
+                            f"only {max(0.0, remaining):.1f}s left to wait"
+                        )
+                        return SendResult.RATE_LIMITED, None
+                    logger.warning(
+                        f"Slack webhook rate limited, retrying after {retry_after}s "
+                        f"(attempt {attempt + 1}/{policy.max_attempts})"
+                    )
+                    continue
                 
                 # Log error but don't raise exception
                 logger.warning(
@@ -57,32 +204,52 @@ class SlackWebhookClient:
                 
                 # If it's a client error (4xx), don't retry
                 if 400 <= response.status_code < 500:
-                    return False
+                    return SendResult.REJECTED, None
                 
             except requests.exceptions.Timeout:
-                logger.warning(f"Slack webhook request timed out (attempt {attempt + 1}/{self.retry_count})")
+                logger.warning(f"Slack webhook request timed out (attempt {attempt + 1}/{policy.max_attempts})")
+                if breaker is not None:
+                    breaker.record_failure()
             except requests.exceptions.RequestException as e:
-                logger.warning(f"Slack webhook request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
+                logger.warning(f"Slack webhook request failed (attempt {attempt + 1}/{policy.max_attempts}): {e}")
+                if breaker is not None:
+                    breaker.record_failure()
             
-            # Wait before retrying (except on last attempt)
-            if attempt < self.retry_count - 1:
-                time.sleep(self.retry_delay)
+            # Back off before retrying, unless that would run past the deadline
+            if attempt < policy.max_attempts - 1:
+                delay = policy.backoff(attempt)
+                if delay >= deadline.remaining():
+                    break
+                time.sleep(delay)
+        
+        return SendResult.FAILED, None
+    
+    def _post(self, url: str, body: bytes, timeout: float, headers: Dict[str, str]):
+        """POST an encoded payload once, recording in-flight and HTTP timing metrics."""
+        metrics = self.metrics
+        if metrics is None:
+            return self.transport.post(url, data=body, timeout=timeout, headers=headers)
         
-        return False
+        metrics.request_started()
+        started = time.perf_counter()
+        try:
+            return self.transport.post(url, data=body, timeout=timeout, headers=headers)
+        finally:
+            metrics.request_finished()
+            metrics.observe("http", time.perf_counter() - started)
     
     def send_async(self, payload: Dict[str, Any]) -> None:
         """
-        Send a message to Slack webhook asynchronously (fire and forget).
+        Send a message to Slack webhook without raising exceptions.
         
-        This method doesn't wait for the response and doesn't raise exceptions.
-        Useful for non-blocking error logging.
+        This still runs on the caller's thread. For non-blocking delivery use
+        SlackLogger with async_send=True, which hands the payload to a
+        background DeliveryQueue.
         
         Args:
             payload: Slack message payload (blocks or text)
         """
         try:
-            # Use a thread or async approach - for simplicity, we'll use a basic approach
-            # In production, you might want to use threading or asyncio
             self.send(payload)
         except Exception as e:
             # Silently fail to prevent logging errors from breaking the application
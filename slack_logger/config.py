@@ -2,21 +2,220 @@
 Configuration management for Slack Logger.
 """
 
+import json
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from .retry import RetryPolicy
+from .scrubber import DEFAULT_KEYS, DEFAULT_PATTERNS, Scrubber
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+
+class ConfigSnapshot(NamedTuple):
+    """Settings resolved from the environment at one point in time."""
+    webhook_url: Optional[str]
+    service_name: Optional[str]
+    timeout: int
+    retry_count: int
+    retry_delay: float
+    retry_max_delay: float
+    deadline: float
+    queue_size: int
+    worker_count: int
+    drop_policy: str
+    block_timeout: float
+    flush_timeout: float
+    pool_size: int
+    dedupe_window: float
+    dedupe_max_entries: int
+    batch_size: int
+    batch_linger: float
+    batch_max_bytes: int
+    rate_limit: float
+    rate_burst: float
+    spool_dir: Optional[str]
+    spool_fsync: str
+    spool_max_bytes: int
+    relay_socket: Optional[str]
+    sample_queue_depth: int
+    sample_send_rate: float
+    sample_min_rate: float
+    breaker_failures: int
+    breaker_failure_rate: float
+    breaker_window: int
+    breaker_reset: float
+    fallback: Optional[str]
+    metrics: bool
+    routes: Optional[str]
+    digest_interval: float
+    digest_max_events: int
+    digest_max_groups: int
+    digest_bypass_critical: bool
+    bot_token: Optional[str]
+    channel: Optional[str]
+    api_url: str
+    thread_update_interval: float
+    thread_cache_size: int
+    thread_max_replies: int
+    scrub: bool
+    scrub_keys: Tuple[str, ...]
+    scrub_patterns: Optional[str]
 
 
 class Config:
-    """Configuration class for Slack Logger."""
+    """
+    Configuration class for Slack Logger.
+    
+    Settings come from environment variables, plus a ``.env`` file if one
+    is found. They are resolved once, on first use, into an immutable
+    ConfigSnapshot that every getter reads from; call ``Config.reload()``
+    after changing the environment to pick up new values.
+    """
     
     # Default settings
     DEFAULT_TIMEOUT = 10  # seconds
     DEFAULT_RETRY_COUNT = 3
     DEFAULT_RETRY_DELAY = 1  # seconds
+    DEFAULT_RETRY_MAX_DELAY = 30  # seconds
+    DEFAULT_DEADLINE = 30  # seconds per message, across all attempts
+    DEFAULT_QUEUE_SIZE = 1000
+    DEFAULT_WORKER_COUNT = 1
+    DEFAULT_DROP_POLICY = "drop_oldest"
+    DEFAULT_BLOCK_TIMEOUT = 1.0  # seconds
+    DEFAULT_FLUSH_TIMEOUT = 5.0  # seconds
+    DEFAULT_POOL_SIZE = 10  # connections per webhook host
+    DEFAULT_DEDUPE_WINDOW = 0.0  # seconds, 0 disables duplicate suppression
+    DEFAULT_DEDUPE_MAX_ENTRIES = 1000
+    DEFAULT_BATCH_SIZE = 1  # messages per webhook post, 1 disables batching
+    DEFAULT_BATCH_LINGER = 0.2  # seconds
+    DEFAULT_BATCH_MAX_BYTES = 30000
+    DEFAULT_RATE_LIMIT = 1.0  # messages per second per webhook, 0 disables
+    DEFAULT_RATE_BURST = 10  # messages
+    DEFAULT_SPOOL_FSYNC = "batch"
+    DEFAULT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_SAMPLE_QUEUE_DEPTH = 0  # queued messages, 0 ignores queue depth
+    DEFAULT_SAMPLE_SEND_RATE = 0.0  # messages per second, 0 ignores the rate
+    DEFAULT_SAMPLE_MIN_RATE = 0.01
+    DEFAULT_BREAKER_FAILURES = 5  # consecutive failures, 0 disables the breaker
+    DEFAULT_BREAKER_FAILURE_RATE = 0.5
+    DEFAULT_BREAKER_WINDOW = 20  # attempts
+    DEFAULT_BREAKER_RESET = 30.0  # seconds
+    DEFAULT_METRICS = False
+    DEFAULT_DIGEST_INTERVAL = 0.0  # seconds, 0 disables digest mode
+    DEFAULT_DIGEST_MAX_EVENTS = 0  # events that close a window early, 0 = no limit
+    DEFAULT_DIGEST_MAX_GROUPS = 100
+    DEFAULT_DIGEST_BYPASS_CRITICAL = True
+    DEFAULT_API_URL = "https://slack.com/api"
+    DEFAULT_THREAD_UPDATE_INTERVAL = 10.0  # seconds between edits of one parent message
+    DEFAULT_THREAD_CACHE_SIZE = 1000  # fingerprints mapped to a parent message
+    DEFAULT_THREAD_MAX_REPLIES = 10  # variant replies per parent message
+    DEFAULT_SCRUB = True
+    
+    _snapshot: Optional[ConfigSnapshot] = None
+    _dotenv_loaded = False
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def current() -> ConfigSnapshot:
+        """
+        Return the current settings, resolving them on first use.
+        
+        Returns:
+            The cached ConfigSnapshot
+        
+        Raises:
+            ValueError: If a numeric setting can't be parsed.
+        """
+        snapshot = Config._snapshot
+        if snapshot is None:
+            with Config._lock:
+                snapshot = Config._snapshot
+                if snapshot is None:
+                    snapshot = Config._snapshot = Config._resolve()
+        return snapshot
+    
+    @staticmethod
+    def reload() -> ConfigSnapshot:
+        """
+        Re-read the environment (and ``.env`` file) and replace the snapshot.
+        
+        Loggers and clients that already exist keep the settings they were
+        created with.
+        
+        Returns:
+            The new ConfigSnapshot
+        """
+        with Config._lock:
+            Config._dotenv_loaded = False
+            snapshot = Config._snapshot = Config._resolve()
+        return snapshot
+    
+    @staticmethod
+    def _load_dotenv() -> None:
+        """Load the .env file, importing python-dotenv only when needed."""
+        if Config._dotenv_loaded:
+            return
+        Config._dotenv_loaded = True
+        from dotenv import load_dotenv
+        
+        # Load environment variables from .env file if it exists
+        load_dotenv()
+    
+    @staticmethod
+    def _resolve() -> ConfigSnapshot:
+        """Build a snapshot from the environment. Caller holds the lock."""
+        Config._load_dotenv()
+        env = os.environ.get
+        return ConfigSnapshot(
+            webhook_url=env("SLACK_WEBHOOK_URL") or None,
+            service_name=env("SLACK_LOGGER_SERVICE_NAME") or None,
+            timeout=int(env("SLACK_LOGGER_TIMEOUT", Config.DEFAULT_TIMEOUT)),
+            retry_count=int(env("SLACK_LOGGER_RETRY_COUNT", Config.DEFAULT_RETRY_COUNT)),
+            retry_delay=float(env("SLACK_LOGGER_RETRY_DELAY", Config.DEFAULT_RETRY_DELAY)),
+            retry_max_delay=float(env("SLACK_LOGGER_RETRY_MAX_DELAY", Config.DEFAULT_RETRY_MAX_DELAY)),
+            deadline=float(env("SLACK_LOGGER_DEADLINE", Config.DEFAULT_DEADLINE)),
+            queue_size=int(env("SLACK_LOGGER_QUEUE_SIZE", Config.DEFAULT_QUEUE_SIZE)),
+            worker_count=int(env("SLACK_LOGGER_WORKERS", Config.DEFAULT_WORKER_COUNT)),
+            drop_policy=env("SLACK_LOGGER_DROP_POLICY", Config.DEFAULT_DROP_POLICY),
+            block_timeout=float(env("SLACK_LOGGER_BLOCK_TIMEOUT", Config.DEFAULT_BLOCK_TIMEOUT)),
+            flush_timeout=float(env("SLACK_LOGGER_FLUSH_TIMEOUT", Config.DEFAULT_FLUSH_TIMEOUT)),
+            pool_size=int(env("SLACK_LOGGER_POOL_SIZE", Config.DEFAULT_POOL_SIZE)),
+            dedupe_window=float(env("SLACK_LOGGER_DEDUPE_WINDOW", Config.DEFAULT_DEDUPE_WINDOW)),
+            dedupe_max_entries=int(env("SLACK_LOGGER_DEDUPE_MAX_ENTRIES", Config.DEFAULT_DEDUPE_MAX_ENTRIES)),
+            batch_size=int(env("SLACK_LOGGER_BATCH_SIZE", Config.DEFAULT_BATCH_SIZE)),
+            batch_linger=float(env("SLACK_LOGGER_BATCH_LINGER", Config.DEFAULT_BATCH_LINGER)),
+            batch_max_bytes=int(env("SLACK_LOGGER_BATCH_MAX_BYTES", Config.DEFAULT_BATCH_MAX_BYTES)),
+            rate_limit=float(env("SLACK_LOGGER_RATE_LIMIT", Config.DEFAULT_RATE_LIMIT)),
+            rate_burst=float(env("SLACK_LOGGER_RATE_BURST", Config.DEFAULT_RATE_BURST)),
+            spool_dir=env("SLACK_LOGGER_SPOOL_DIR") or None,
+            spool_fsync=env("SLACK_LOGGER_SPOOL_FSYNC", Config.DEFAULT_SPOOL_FSYNC),
+            spool_max_bytes=int(env("SLACK_LOGGER_SPOOL_MAX_BYTES", Config.DEFAULT_SPOOL_MAX_BYTES)),
+            relay_socket=env("SLACK_LOGGER_RELAY_SOCKET") or None,
+            sample_queue_depth=int(env("SLACK_LOGGER_SAMPLE_QUEUE_DEPTH", Config.DEFAULT_SAMPLE_QUEUE_DEPTH)),
+            sample_send_rate=float(env("SLACK_LOGGER_SAMPLE_SEND_RATE", Config.DEFAULT_SAMPLE_SEND_RATE)),
+            sample_min_rate=float(env("SLACK_LOGGER_SAMPLE_MIN_RATE", Config.DEFAULT_SAMPLE_MIN_RATE)),
+            breaker_failures=int(env("SLACK_LOGGER_BREAKER_FAILURES", Config.DEFAULT_BREAKER_FAILURES)),
+            breaker_failure_rate=float(env("SLACK_LOGGER_BREAKER_FAILURE_RATE", Config.DEFAULT_BREAKER_FAILURE_RATE)),
+            breaker_window=int(env("SLACK_LOGGER_BREAKER_WINDOW", Config.DEFAULT_BREAKER_WINDOW)),
+            breaker_reset=float(env("SLACK_LOGGER_BREAKER_RESET", Config.DEFAULT_BREAKER_RESET)),
+            fallback=env("SLACK_LOGGER_FALLBACK") or None,
+            metrics=env("SLACK_LOGGER_METRICS", str(Config.DEFAULT_METRICS)).strip().lower() in ("1", "true", "yes", "on"),
+            routes=env("SLACK_LOGGER_ROUTES") or None,
+            digest_interval=float(env("SLACK_LOGGER_DIGEST_INTERVAL", Config.DEFAULT_DIGEST_INTERVAL)),
+            digest_max_events=int(env("SLACK_LOGGER_DIGEST_MAX_EVENTS", Config.DEFAULT_DIGEST_MAX_EVENTS)),
+            digest_max_groups=int(env("SLACK_LOGGER_DIGEST_MAX_GROUPS", Config.DEFAULT_DIGEST_MAX_GROUPS)),
+            digest_bypass_critical=env(
+                "SLACK_LOGGER_DIGEST_BYPASS_CRITICAL", str(Config.DEFAULT_DIGEST_BYPASS_CRITICAL)
+            ).strip().lower() in ("1", "true", "yes", "on"),
+            bot_token=env("SLACK_LOGGER_BOT_TOKEN") or None,
+            channel=env("SLACK_LOGGER_CHANNEL") or None,
+            api_url=env("SLACK_LOGGER_API_URL") or Config.DEFAULT_API_URL,
+            thread_update_interval=float(env("SLACK_LOGGER_THREAD_UPDATE_INTERVAL", Config.DEFAULT_THREAD_UPDATE_INTERVAL)),
+            thread_cache_size=int(env("SLACK_LOGGER_THREAD_CACHE_SIZE", Config.DEFAULT_THREAD_CACHE_SIZE)),
+            thread_max_replies=int(env("SLACK_LOGGER_THREAD_MAX_REPLIES", Config.DEFAULT_THREAD_MAX_REPLIES)),
+            scrub=env("SLACK_LOGGER_SCRUB", str(Config.DEFAULT_SCRUB)).strip().lower() in ("1", "true", "yes", "on"),
+            scrub_keys=tuple(key.strip() for key in env("SLACK_LOGGER_SCRUB_KEYS", "").split(",") if key.strip()),
+            scrub_patterns=env("SLACK_LOGGER_SCRUB_PATTERNS") or None,
+        )
     
     @staticmethod
     def get_webhook_url(webhook_url: Optional[str] = None) -> Optional[str]:
@@ -25,19 +224,15 @@ class Config:
         
         Args:
             webhook_url: Optional webhook URL parameter
-            
+        
         Returns:
             Webhook URL or None if not found
         """
         if webhook_url:
             return webhook_url
         
-        # Try environment variable
-        env_url = os.getenv("SLACK_WEBHOOK_URL")
-        if env_url:
-            return env_url
-        
-        return None
+        # Fall back to SLACK_WEBHOOK_URL
+        return Config.current().webhook_url
     
     @staticmethod
     def get_service_name(service_name: Optional[str] = None) -> str:
@@ -46,36 +241,364 @@ class Config:
         
         Args:
             service_name: Optional service name parameter
-            
+        
         Returns:
             Service name or default
         """
         if service_name:
             return service_name
         
-        # Try environment variable
-        env_name = os.getenv("SLACK_LOGGER_SERVICE_NAME")
-        if env_name:
-            return env_name
-        
-        return "unknown-service"
+        # Fall back to SLACK_LOGGER_SERVICE_NAME
+        return Config.current().service_name or "unknown-service"
     
     @staticmethod
     def get_timeout() -> int:
         """Get HTTP timeout from environment or use default."""
-        return int(os.getenv("SLACK_LOGGER_TIMEOUT", Config.DEFAULT_TIMEOUT))
+        return Config.current().timeout
     
     @staticmethod
     def get_retry_count() -> int:
         """Get retry count from environment or use default."""
-        return int(os.getenv("SLACK_LOGGER_RETRY_COUNT", Config.DEFAULT_RETRY_COUNT))
+        return Config.current().retry_count
     
     @staticmethod
-    def get_retry_delay() -> int:
-        """Get retry delay from environment or use default."""
-        return int(os.getenv("SLACK_LOGGER_RETRY_DELAY", Config.DEFAULT_RETRY_DELAY))
-
-
-
-
-
+    def get_retry_delay() -> float:
+        """Get the base retry backoff from environment or use default."""
+        return Config.current().retry_delay
+    
+    @staticmethod
+    def get_retry_max_delay() -> float:
+        """Get the maximum single retry backoff from environment or use default."""
+        return Config.current().retry_max_delay
+    
+    @staticmethod
+    def get_deadline() -> float:
+        """Get the overall delivery deadline per message from environment or use default."""
+        return Config.current().deadline
+    
+    @staticmethod
+    def get_retry_policy() -> RetryPolicy:
+        """Build the retry policy from the retry settings."""
+        return RetryPolicy(
+            max_attempts=Config.get_retry_count(),
+            base_delay=Config.get_retry_delay(),
+            max_delay=Config.get_retry_max_delay(),
+            deadline=Config.get_deadline()
+        )
+    
+    @staticmethod
+    def get_queue_size() -> int:
+        """Get the background delivery queue size from environment or use default."""
+        return Config.current().queue_size
+    
+    @staticmethod
+    def get_worker_count() -> int:
+        """Get the number of background delivery workers from environment or use default."""
+        return Config.current().worker_count
+    
+    @staticmethod
+    def get_drop_policy() -> str:
+        """Get the full-queue drop policy from environment or use default."""
+        return Config.current().drop_policy
+    
+    @staticmethod
+    def get_block_timeout() -> float:
+        """Get how long a full queue may block the caller (block policy only)."""
+        return Config.current().block_timeout
+    
+    @staticmethod
+    def get_flush_timeout() -> float:
+        """Get how long pending messages may delay interpreter exit."""
+        return Config.current().flush_timeout
+    
+    @staticmethod
+    def get_pool_size() -> int:
+        """Get the keep-alive connection pool size per webhook host."""
+        return Config.current().pool_size
+    
+    @staticmethod
+    def get_dedupe_window() -> float:
+        """Get the duplicate suppression window in seconds (0 disables it)."""
+        return Config.current().dedupe_window
+    
+    @staticmethod
+    def get_dedupe_max_entries() -> int:
+        """Get the maximum number of fingerprints tracked for duplicate suppression."""
+        return Config.current().dedupe_max_entries
+    
+    @staticmethod
+    def get_batch_size() -> int:
+        """Get the maximum number of messages merged into one post (1 disables batching)."""
+        return Config.current().batch_size
+    
+    @staticmethod
+    def get_batch_linger() -> float:
+        """Get how long a batch waits for more messages, in seconds."""
+        return Config.current().batch_linger
+    
+    @staticmethod
+    def get_batch_max_bytes() -> int:
+        """Get the maximum encoded size of a batched payload."""
+        return Config.current().batch_max_bytes
+    
+    @staticmethod
+    def get_rate_limit() -> float:
+        """Get the sustained messages per second allowed per webhook (0 disables)."""
+        return Config.current().rate_limit
+    
+    @staticmethod
+    def get_rate_burst() -> float:
+        """Get how many messages may be sent in a burst before pacing starts."""
+        return Config.current().rate_burst
+    
+    @staticmethod
+    def get_spool_dir(spool_dir: Optional[str] = None) -> Optional[str]:
+        """
+        Get the spool directory from parameter or environment variable.
+        
+        Args:
+            spool_dir: Optional spool directory parameter
+        
+        Returns:
+            Spool directory, or None if spooling is disabled
+        """
+        return spool_dir or Config.current().spool_dir
+    
+    @staticmethod
+    def get_spool_fsync() -> str:
+        """Get the spool fsync policy ("none", "batch" or "always")."""
+        return Config.current().spool_fsync
+    
+    @staticmethod
+    def get_spool_max_bytes() -> int:
+        """Get the total size cap of the spool directory."""
+        return Config.current().spool_max_bytes
+    
+    @staticmethod
+    def get_relay_socket(relay_socket: Optional[str] = None) -> Optional[str]:
+        """
+        Get the relay's Unix socket path from parameter or environment variable.
+        
+        Args:
+            relay_socket: Optional socket path parameter
+        
+        Returns:
+            Socket path, or None if no relay is used
+        """
+        return relay_socket or Config.current().relay_socket
+    
+    @staticmethod
+    def get_sample_queue_depth() -> int:
+        """Get the queue depth above which INFO and WARNING are sampled (0 ignores depth)."""
+        return Config.current().sample_queue_depth
+    
+    @staticmethod
+    def get_sample_send_rate() -> float:
+        """Get the messages per second above which INFO and WARNING are sampled (0 ignores it)."""
+        return Config.current().sample_send_rate
+    
+    @staticmethod
+    def get_sample_min_rate() -> float:
+        """Get the lowest sample rate applied under load."""
+        return Config.current().sample_min_rate
+    
+    @staticmethod
+    def get_breaker_settings() -> Optional[Dict[str, Any]]:
+        """
+        Get the circuit breaker settings.
+        
+        Returns:
+            CircuitBreaker keyword arguments, or None if the breaker is
+            disabled (SLACK_LOGGER_BREAKER_FAILURES=0)
+        """
+        snapshot = Config.current()
+        if snapshot.breaker_failures <= 0:
+            return None
+        return {
+            "failure_threshold": snapshot.breaker_failures,
+            "failure_rate": snapshot.breaker_failure_rate,
+            "window": snapshot.breaker_window,
+            "reset_timeout": snapshot.breaker_reset,
+        }
+    
+    @staticmethod
+    def get_fallback(fallback: Optional[str] = None) -> Optional[str]:
+        """
+        Get where messages go while a webhook's circuit is open.
+        
+        Args:
+            fallback: Optional fallback parameter
+            
+        Returns:
+            "spool", "stderr" or "drop", or None to pick a default
+        """
+        return fallback or Config.current().fallback
+    
+    @staticmethod
+    def get_metrics_enabled(metrics: Optional[bool] = None) -> bool:
+        """
+        Get whether delivery metrics are recorded.
+        
+        Args:
+            metrics: Optional metrics parameter
+            
+        Returns:
+            True if metrics are enabled
+        """
+        if metrics is not None:
+            return metrics
+        return Config.current().metrics
+    
+    @staticmethod
+    def get_routes() -> Optional[str]:
+        """
+        Get the routing table from SLACK_LOGGER_ROUTES.
+        
+        Returns:
+            JSON list of route mappings, or None if not set
+        """
+        return Config.current().routes
+    
+    @staticmethod
+    def get_digest_interval() -> float:
+        """Get the digest window in seconds (0 disables digest mode)."""
+        return Config.current().digest_interval
+    
+    @staticmethod
+    def get_digest_max_events() -> int:
+        """Get the number of events that closes a digest window early (0 = no limit)."""
+        return Config.current().digest_max_events
+    
+    @staticmethod
+    def get_digest_max_groups() -> int:
+        """Get the maximum number of groups itemized per digest window."""
+        return Config.current().digest_max_groups
+    
+    @staticmethod
+    def get_digest_bypass_critical(bypass: Optional[bool] = None) -> bool:
+        """
+        Get whether CRITICAL messages skip the digest and are sent at once.
+        
+        Args:
+            bypass: Optional digest_bypass_critical parameter
+            
+        Returns:
+            True if CRITICAL messages bypass the digest
+        """
+        if bypass is not None:
+            return bypass
+        return Config.current().digest_bypass_critical
+    
+    @staticmethod
+    def get_bot_token(bot_token: Optional[str] = None) -> Optional[str]:
+        """
+        Get the bot token that switches delivery to the Web API.
+        
+        Args:
+            bot_token: Optional bot token parameter
+            
+        Returns:
+            Bot token, or None to post through the webhook
+        """
+        return bot_token or Config.current().bot_token
+    
+    @staticmethod
+    def get_channel(channel: Optional[str] = None) -> Optional[str]:
+        """
+        Get the channel Web API messages are posted to.
+        
+        Args:
+            channel: Optional channel parameter
+            
+        Returns:
+            Channel id or name, or None if not set
+        """
+        return channel or Config.current().channel
+    
+    @staticmethod
+    def get_api_url() -> str:
+        """Get the base URL of the Slack Web API."""
+        return Config.current().api_url
+    
+    @staticmethod
+    def get_thread_settings() -> Dict[str, Any]:
+        """
+        Get the Web API threading settings.
+        
+        Returns:
+            Keyword arguments for SlackWebAPIClient: update_interval,
+            cache_size and max_replies
+        """
+        snapshot = Config.current()
+        return {
+            "update_interval": snapshot.thread_update_interval,
+            "cache_size": snapshot.thread_cache_size,
+            "max_replies": snapshot.thread_max_replies,
+        }
+    
+    @staticmethod
+    def get_scrub_enabled(scrub: Optional[bool] = None) -> bool:
+        """
+        Get whether secrets are redacted before messages are sent.
+        
+        Args:
+            scrub: Optional scrub parameter
+            
+        Returns:
+            True if messages are scrubbed
+        """
+        if scrub is not None:
+            return scrub
+        return Config.current().scrub
+    
+    @staticmethod
+    def get_scrub_keys() -> Tuple[str, ...]:
+        """Get the additional sensitive key names (SLACK_LOGGER_SCRUB_KEYS, comma-separated)."""
+        return Config.current().scrub_keys
+    
+    @staticmethod
+    def get_scrub_patterns() -> List[str]:
+        """
+        Get the additional value patterns to redact.
+        
+        Returns:
+            Regular expressions from SLACK_LOGGER_SCRUB_PATTERNS, a JSON list
+            
+        Raises:
+            ValueError: If SLACK_LOGGER_SCRUB_PATTERNS is not a JSON list of strings
+        """
+        raw = Config.current().scrub_patterns
+        if not raw:
+            return []
+        try:
+            patterns = json.loads(raw)
+        except ValueError as e:
+            raise ValueError(f"SLACK_LOGGER_SCRUB_PATTERNS is not valid JSON: {e}")
+        if not isinstance(patterns, list) or not all(isinstance(pattern, str) for pattern in patterns):
+            raise ValueError("SLACK_LOGGER_SCRUB_PATTERNS must be a JSON list of strings")
+        return patterns
+    
+    @staticmethod
+    def get_scrubber(scrubber: Optional[Union[bool, Scrubber]] = None) -> Optional[Scrubber]:
+        """
+        Get the scrubber redacting secrets from outgoing messages.
+        
+        Args:
+            scrubber: Optional scrubber parameter: a Scrubber, True for the
+                     default rules or False to disable scrubbing
+            
+        Returns:
+            Scrubber with the default rules plus SLACK_LOGGER_SCRUB_KEYS and
+            SLACK_LOGGER_SCRUB_PATTERNS, the given Scrubber, or None if disabled
+            
+        Raises:
+            ValueError: If a scrub pattern is not a valid regular expression
+        """
+        if isinstance(scrubber, Scrubber):
+            return scrubber
+        if not Config.get_scrub_enabled(scrubber):
+            return None
+        return Scrubber(
+            DEFAULT_KEYS + Config.get_scrub_keys(),
+            DEFAULT_PATTERNS + tuple(Config.get_scrub_patterns())
+        )
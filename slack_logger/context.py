@@ -0,0 +1,221 @@
+"""
+Size-bounded rendering of additional_context for Slack sections.
+"""
+
+import json
+from json.encoder import encode_basestring
+from typing import Any, Dict, List, Optional
+
+from .scrubber import Scrubber
+
+_HEADER = "*Additional Context:*\n"
+_TRUNCATED = "…`\n_… context truncated_"
+
+# Characters scrubbed past a value's cut, so a secret straddling it (a PEM
+# key, a long token) is still recognized instead of leaking its first part
+_SCRUB_LOOKAHEAD = 4096
+
+
+class _BudgetExceeded(Exception):
+    """Raised by _Writer once the character budget is used up."""
+
+
+class _Writer:
+    """Append-only text buffer with a hard character budget."""
+
+    __slots__ = ("parts", "remaining")
+
+    def __init__(self, budget: int):
+        self.parts: List[str] = []
+        self.remaining = budget
+
+    def write(self, text: str) -> None:
+        if len(text) > self.remaining:
+            self.parts.append(text[:self.remaining])
+            self.remaining = 0
+            raise _BudgetExceeded
+        self.parts.append(text)
+        self.remaining -= len(text)
+
+
+def safe_repr(value: Any, limit: int = 200) -> str:
+    """
+    Return ``repr(value)`` cut to ``limit`` characters, never raising.
+
+    Args:
+        value: Any object
+        limit: Maximum length of the result
+
+    Returns:
+        The representation, or a placeholder naming the type if repr fails
+    """
+    try:
+        text = repr(value)
+    except Exception:
+        text = f"<unrepresentable {type(value).__name__}>"
+    if len(text) > limit:
+        text = text[:limit] + "…"
+    return text
+
+
+class ContextRenderer:
+    """
+    Renders ``additional_context`` into one Slack section text.
+
+    Rendering streams into a single buffer and stops as soon as
+    ``max_chars`` is reached, so a huge dict is never serialized in full
+    just to be cut. Nested dicts and lists are written as indented JSON
+    down to ``max_depth`` levels, with at most ``max_items`` entries per
+    container and ``max_value_chars`` per string. Values JSON can't
+    represent fall back to a bounded ``repr``. Work is linear in the size
+    of the rendered output.
+
+    With a Scrubber, redaction happens while rendering: values under
+    sensitive keys are written as the replacement without being converted
+    to text, and only the text actually written is scanned, so entries cut
+    by the budgets cost nothing.
+    """
+
+    def __init__(
+        self,
+        max_chars: int = 3000,
+        max_depth: int = 4,
+        max_items: int = 50,
+        max_value_chars: int = 500
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            max_chars: Maximum length of the section text (Slack allows 3000)
+            max_depth: Deepest nesting level rendered; deeper containers
+                      are shown as ``{…}`` or ``[…]``
+            max_items: Maximum entries rendered per dict or list, including
+                      the top-level context
+            max_value_chars: Maximum characters rendered per string value
+        """
+        self.max_chars = max_chars
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_value_chars = max_value_chars
+
+    def render(self, context: Dict[str, Any], scrubber: Optional[Scrubber] = None) -> str:
+        """
+        Render the context section text.
+
+        Args:
+            context: Additional context dictionary
+            scrubber: Optional Scrubber redacting secrets from what is rendered
+
+        Returns:
+            Section text of at most ``max_chars`` characters
+        """
+        writer = _Writer(self.max_chars - len(_TRUNCATED))
+        try:
+            writer.write(_HEADER)
+            for index, (key, value) in enumerate(context.items()):
+                if index >= self.max_items:
+                    writer.write(f"• _… {len(context) - index} more_\n")
+                    break
+                writer.write(f"• *{self._text(key)}:* `")
+                if scrubber is not None and scrubber.is_sensitive(key):
+                    writer.write(scrubber.replacement)
+                elif isinstance(value, (dict, list)):
+                    self._write_json(writer, value, 0, "", scrubber)
+                else:
+                    writer.write(self._text(value, scrubber))
+                writer.write("`\n")
+        except _BudgetExceeded:
+            writer.parts.append(_TRUNCATED)
+        return "".join(writer.parts)
+
+    def _text(self, value: Any, scrubber: Optional[Scrubber] = None) -> str:
+        """str() of a top-level value, bounded, scrubbed and never raising."""
+        if not isinstance(value, str):
+            try:
+                value = str(value)
+            except Exception:
+                value = safe_repr(value, self.max_value_chars)
+        return self._clip(value, scrubber)
+
+    def _clip(self, text: str, scrubber: Optional[Scrubber]) -> str:
+        """Cut ``text`` to ``max_value_chars``, scrubbing only what is kept."""
+        if scrubber is None:
+            cut = len(text) > self.max_value_chars
+        else:
+            window = self.max_value_chars + _SCRUB_LOOKAHEAD
+            scrubbed = scrubber.scrub_text(text[:window])
+            cut = len(text) > window or len(scrubbed) > self.max_value_chars
+            text = scrubbed
+        if cut:
+            text = text[:self.max_value_chars] + "…"
+        return text
+
+    def _write_json(
+        self,
+        writer: _Writer,
+        value: Any,
+        depth: int,
+        indent: str,
+        scrubber: Optional[Scrubber] = None
+    ) -> None:
+        """Write ``value`` as indented JSON, enforcing the budgets."""
+        if isinstance(value, dict):
+            if not value:
+                writer.write("{}")
+                return
+            if depth >= self.max_depth:
+                writer.write("{…}")
+                return
+            inner = indent + "  "
+            writer.write("{")
+            for index, (key, item) in enumerate(value.items()):
+                if index:
+                    writer.write(",")
+                if index >= self.max_items:
+                    writer.write(f'\n{inner}"…": "{len(value) - index} more"')
+                    break
+                writer.write(f"\n{inner}{self._scalar(str(key))}: ")
+                if scrubber is not None and scrubber.is_sensitive(key):
+                    writer.write(encode_basestring(scrubber.replacement))
+                else:
+                    self._write_json(writer, item, depth + 1, inner, scrubber)
+            writer.write(f"\n{indent}}}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                writer.write("[]")
+                return
+            if depth >= self.max_depth:
+                writer.write("[…]")
+                return
+            inner = indent + "  "
+            writer.write("[")
+            for index, item in enumerate(value):
+                if index:
+                    writer.write(",")
+                if index >= self.max_items:
+                    writer.write(f'\n{inner}"… {len(value) - index} more"')
+                    break
+                writer.write(f"\n{inner}")
+                self._write_json(writer, item, depth + 1, inner, scrubber)
+            writer.write(f"\n{indent}]")
+        else:
+            writer.write(self._scalar(value, scrubber))
+
+    def _scalar(self, value: Any, scrubber: Optional[Scrubber] = None) -> str:
+        """Encode a JSON scalar, or a bounded repr string for other types."""
+        if isinstance(value, str):
+            return encode_basestring(self._clip(value, scrubber))
+        if value is None:
+            return "null"
+        if value is True or value is False:
+            return "true" if value else "false"
+        if isinstance(value, int):
+            try:
+                return int.__repr__(value)
+            except ValueError:
+                # Beyond sys.get_int_max_str_digits()
+                return encode_basestring(f"<int with {value.bit_length()} bits>")
+        if isinstance(value, float):
+            return json.dumps(value)
+        return encode_basestring(self._clip(safe_repr(value, self.max_value_chars), scrubber))
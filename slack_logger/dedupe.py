@@ -0,0 +1,185 @@
+"""
+Exception fingerprinting and duplicate suppression.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Union
+from .tracebacks import ExceptionSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Numbers and hex ids vary between otherwise identical messages
+_VARIABLE_RE = re.compile(r"0x[0-9a-fA-F]+|\d+")
+
+
+def fingerprint(message: str, exception: Optional[Union[BaseException, ExceptionSnapshot]] = None) -> str:
+    """
+    Compute a stable fingerprint for a log event.
+
+    With an exception, the fingerprint covers the exception type and every
+    traceback frame as (file name, function, line number); the exception
+    message is ignored so ids and values embedded in it don't split groups.
+    Without one, the message with its numbers normalized is used as the
+    template. A snapshot captured with ``fingerprint=True`` carries the
+    same digest, computed during capture.
+
+    Args:
+        message: The log message
+        exception: Optional exception object, or its ExceptionSnapshot
+
+    Returns:
+        Hex digest identifying the event's origin
+    """
+    if isinstance(exception, ExceptionSnapshot):
+        if exception.fingerprint is not None:
+            return exception.fingerprint
+        # Only the retained innermost frames are known
+        parts = [exception.qualified_name]
+        for code, lineno in exception.frames:
+            parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{lineno}")
+    elif exception is not None:
+        exc_type = type(exception)
+        parts = [f"{exc_type.__module__}.{exc_type.__qualname__}"]
+        tb = exception.__traceback__
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{tb.tb_lineno}")
+            tb = tb.tb_next
+    else:
+        parts = [_VARIABLE_RE.sub("#", message)]
+    return hashlib.sha1("|".join(parts).encode("utf-8", "replace")).hexdigest()[:16]
+
+
+class SuppressedEvent:
+    """Occurrences of one fingerprint within a suppression window."""
+
+    __slots__ = ("key", "message", "level", "window_start", "suppressed")
+
+    def __init__(self, key: Hashable, message: str, level, window_start: float):
+        self.key = key
+        self.message = message
+        self.level = level
+        self.window_start = window_start
+        self.suppressed = 0
+
+
+class DuplicateSuppressor:
+    """
+    Lets the first occurrence of a fingerprint through and counts repeats.
+
+    Each fingerprint opens a window of ``window`` seconds. Repeats inside it
+    are only counted; when the window closes, ``on_summary`` is called once
+    with the SuppressedEvent if anything was suppressed. The table holds at
+    most ``max_entries`` fingerprints: entries leave it when their window
+    expires or, when full, oldest first.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        on_summary: Callable[[SuppressedEvent], None],
+        max_entries: int = 1000
+    ):
+        """
+        Initialize the suppressor.
+
+        Args:
+            window: Suppression window in seconds
+            on_summary: Called with each closed window that suppressed events
+            max_entries: Maximum number of tracked fingerprints
+        """
+        self.window = window
+        self.max_entries = max(1, int(max_entries))
+        self._on_summary = on_summary
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._sweeper: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def should_send(self, key: Hashable, message: str, level) -> bool:
+        """
+        Record an occurrence and decide whether it should be sent.
+
+        Args:
+            key: Event fingerprint
+            message: Message used in the summary
+            level: Log level used in the summary
+
+        Returns:
+            True for the first occurrence in a window, False for repeats
+        """
+        now = time.monotonic()
+        with self._lock:
+            closed = self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.suppressed += 1
+                if self._sweeper is None:
+                    self._start_sweeper()
+                send = False
+            else:
+                self._entries[key] = SuppressedEvent(key, message, level, now)
+                if len(self._entries) > self.max_entries:
+                    closed.append(self._entries.popitem(last=False)[1])
+                send = True
+        self._emit(closed)
+        return send
+
+    def flush(self) -> None:
+        """Close every open window now, emitting pending summaries."""
+        with self._lock:
+            closed = list(self._entries.values())
+            self._entries.clear()
+        self._emit(closed)
+
+    def _expire(self, now: float) -> list:
+        """Pop entries whose window has closed. Caller holds the lock."""
+        closed = []
+        entries = self._entries
+        while entries:
+            entry = next(iter(entries.values()))
+            if now - entry.window_start < self.window:
+                break
+            entries.popitem(last=False)
+            closed.append(entry)
+        return closed
+
+    def _emit(self, closed: list) -> None:
+        for entry in closed:
+            if entry.suppressed:
+                try:
+                    self._on_summary(entry)
+                except Exception as e:
+                    logger.error(f"Failed to report suppressed Slack messages: {e}", exc_info=True)
+
+    def _start_sweeper(self) -> None:
+        """Start the thread that closes windows on time. Caller holds the lock."""
+        self._sweeper = threading.Thread(
+            target=self._sweep,
+            name="slack-logger-dedupe",
+            daemon=True
+        )
+        self._sweeper.start()
+
+    def _sweep(self) -> None:
+        """Sleep until the oldest window closes, then emit its summary."""
+        while True:
+            with self._lock:
+                if self._entries:
+                    oldest = next(iter(self._entries.values()))
+                    delay = oldest.window_start + self.window - time.monotonic()
+                else:
+                    delay = self.window
+                if delay > 0:
+                    self._wakeup.wait(delay)
+                closed = self._expire(time.monotonic())
+            self._emit(closed)
@@ -0,0 +1,344 @@
+"""
+Background delivery queue for non-blocking Slack logging.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from enum import Enum
+from typing import Callable, Optional, Union
+from .batching import PayloadBatcher
+from .envelope import Envelope
+from .formatter import LogLevel
+from .metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+# Queues still alive at interpreter exit get flushed by _flush_all_queues
+_live_queues = weakref.WeakSet()
+
+# Delivery lane per level; higher lanes are always drained first
+LEVEL_PRIORITY = {
+    LogLevel.INFO: 0,
+    LogLevel.WARNING: 1,
+    LogLevel.ERROR: 2,
+    LogLevel.CRITICAL: 3,
+}
+_LANES = len(LEVEL_PRIORITY)
+
+
+class DropPolicy(Enum):
+    """What to do with a new message when the delivery queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+    @classmethod
+    def parse(cls, value: Union[str, "DropPolicy"]) -> "DropPolicy":
+        """
+        Convert a policy name (e.g. "drop_oldest") to a DropPolicy.
+
+        Raises:
+            ValueError: If the name is not a known policy.
+        """
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).strip().lower())
+        except ValueError:
+            choices = ", ".join(policy.value for policy in cls)
+            raise ValueError(f"Unknown drop policy {value!r}, expected one of: {choices}")
+
+
+class DeliveryQueue:
+    """
+    Bounded in-memory queue drained by a pool of worker threads.
+
+    ``put`` only appends to a deque under a lock, so the caller never waits
+    on the network. Workers call ``sender`` for each envelope; ``sender`` is
+    responsible for retries and must not raise (exceptions are logged).
+
+    Envelopes wait in one lane per priority (see LEVEL_PRIORITY) and
+    workers always take from the highest non-empty lane, so a CRITICAL
+    message overtakes queued INFO traffic. When the queue is full, the
+    drop policies evict from the lowest-priority lane, and an envelope
+    ranking below everything queued is itself the one dropped.
+    """
+
+    def __init__(
+        self,
+        sender: Callable[[Envelope], bool],
+        max_size: int = 1000,
+        workers: int = 1,
+        drop_policy: Union[str, DropPolicy] = DropPolicy.DROP_OLDEST,
+        block_timeout: float = 1.0,
+        flush_timeout: float = 5.0,
+        batcher: Optional[PayloadBatcher] = None,
+        name: str = "slack-logger",
+        metrics: Optional[Metrics] = None
+    ):
+        """
+        Initialize the queue and start its worker threads.
+
+        Args:
+            sender: Callable that delivers a single envelope
+            max_size: Maximum number of queued payloads
+            workers: Number of worker threads
+            drop_policy: Policy applied when the queue is full
+            block_timeout: Seconds ``put`` may wait under the BLOCK policy
+            flush_timeout: Seconds to wait for pending payloads at exit
+            batcher: If given, workers collect up to ``batcher.max_batch``
+                    payloads (waiting at most ``batcher.linger`` seconds)
+                    and send them merged
+            name: Prefix for worker thread names
+            metrics: Counts enqueued and dropped payloads. None disables
+                    recording.
+        """
+        self._sender = sender
+        self.max_size = max(1, int(max_size))
+        self.drop_policy = DropPolicy.parse(drop_policy)
+        self.block_timeout = block_timeout
+        self.flush_timeout = flush_timeout
+        self.batcher = batcher
+        self.metrics = metrics
+
+        self._lanes = [deque() for _ in range(_LANES)]
+        self._size = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        self._unfinished = 0
+        self._closed = False
+
+        self.dropped = 0
+
+        self._threads = []
+        for index in range(max(1, int(workers))):
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"{name}-worker-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        _live_queues.add(self)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def depths(self) -> list:
+        """Return the number of queued envelopes per lane, lowest priority first."""
+        with self._lock:
+            return [len(lane) for lane in self._lanes]
+
+    def _lowest_lane(self) -> int:
+        """Index of the lowest non-empty lane. Caller holds the lock."""
+        for index, lane in enumerate(self._lanes):
+            if lane:
+                return index
+        return -1
+
+    def _pop(self) -> Optional[Envelope]:
+        """Take the oldest envelope of the highest non-empty lane. Caller holds the lock."""
+        for lane in reversed(self._lanes):
+            if lane:
+                self._size -= 1
+                self._not_full.notify()
+                return lane.popleft()
+        return None
+
+    @property
+    def closed(self) -> bool:
+        """True once ``close`` has been called."""
+        return self._closed
+
+    def put(self, envelope: Envelope) -> bool:
+        """
+        Enqueue a payload for background delivery.
+
+        Args:
+            envelope: Envelope holding the Slack message payload
+
+        Returns:
+            True if the payload was queued, False if it was dropped
+        """
+        with self._lock:
+            if self._closed:
+                self._count_drop("queue_closed")
+                return False
+
+            lane = min(max(envelope.priority, 0), _LANES - 1)
+            if self._size >= self.max_size:
+                if self.drop_policy is DropPolicy.BLOCK:
+                    deadline = time.monotonic() + self.block_timeout
+                    while self._size >= self.max_size and not self._closed:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._not_full.wait(remaining)
+                    if self._size >= self.max_size or self._closed:
+                        self._count_drop("queue_full")
+                        return False
+                else:
+                    lowest = self._lowest_lane()
+                    if lane < lowest or (self.drop_policy is DropPolicy.DROP_NEWEST and lane == lowest):
+                        # The new envelope is the lowest-priority, newest one
+                        self._count_drop("queue_full")
+                        return False
+                    if self.drop_policy is DropPolicy.DROP_NEWEST:
+                        self._lanes[lowest].pop()
+                    else:
+                        self._lanes[lowest].popleft()
+                    self._size -= 1
+                    self._unfinished -= 1
+                    self._count_drop("queue_full")
+
+            self._lanes[lane].append(envelope)
+            self._size += 1
+            self._unfinished += 1
+            self._not_empty.notify()
+            if self.metrics is not None:
+                self.metrics.inc("enqueued")
+            return True
+
+    def _count_drop(self, reason: str) -> None:
+        """Count a dropped payload. Caller holds the lock."""
+        self.dropped += 1
+        if self.metrics is not None:
+            self.metrics.drop(reason)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued payload has been handled.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the queue drained, False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._unfinished > 0:
+                if deadline is None:
+                    self._all_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._all_done.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting payloads, drain the queue and stop the workers.
+
+        Workers are daemon threads, so payloads still pending after
+        ``timeout`` are abandoned rather than holding up interpreter exit.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if all pending payloads were handled
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        drained = self.flush(timeout)
+        for thread in self._threads:
+            if thread is threading.current_thread():
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+        _live_queues.discard(self)
+        return drained
+
+    def _collect_batch(self, first: Envelope) -> list:
+        """Gather more payloads for a batch. Caller holds the lock."""
+        batch = [first]
+        deadline = time.monotonic() + self.batcher.linger
+        while len(batch) < self.batcher.max_batch:
+            if self._size:
+                batch.append(self._pop())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._closed:
+                break
+            self._not_empty.wait(remaining)
+        return batch
+
+    def _worker(self) -> None:
+        """Worker loop: pop payloads and hand them to the sender."""
+        while True:
+            with self._lock:
+                while not self._size and not self._closed:
+                    self._not_empty.wait()
+                if not self._size:
+                    return
+                envelope = self._pop()
+                if self.batcher is not None:
+                    batch = self._collect_batch(envelope)
+                else:
+                    batch = [envelope]
+
+            try:
+                if len(batch) > 1:
+                    for merged in self.batcher.merge(batch):
+                        self._sender(merged)
+                else:
+                    self._sender(envelope)
+            except Exception as e:
+                logger.error(f"Slack delivery worker failed to send message: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._unfinished -= len(batch)
+                    if self._unfinished <= 0:
+                        self._all_done.notify_all()
+
+
+def close_all_queues(timeout: Optional[float] = None) -> bool:
+    """
+    Close every live queue within one shared time budget.
+
+    Args:
+        timeout: Seconds for all queues together. Defaults to the largest
+                ``flush_timeout`` among them; no queue waits longer than
+                its own ``flush_timeout``.
+
+    Returns:
+        True if every queue drained in time
+    """
+    queues = list(_live_queues)
+    if not queues:
+        return True
+    if timeout is None:
+        timeout = max(queue.flush_timeout for queue in queues)
+    deadline = time.monotonic() + timeout
+    drained = True
+    for queue in queues:
+        remaining = min(queue.flush_timeout, max(0.0, deadline - time.monotonic()))
+        try:
+            drained = queue.close(remaining) and drained
+        except Exception:
+            drained = False
+    return drained
+
+
+def abandon_all_queues() -> None:
+    """Forget every live queue, so exit no longer waits for their messages."""
+    _live_queues.clear()
+
+
+@atexit.register
+def _flush_all_queues() -> None:
+    """Give pending messages a bounded chance to go out at interpreter exit."""
+    close_all_queues()
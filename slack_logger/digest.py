@@ -0,0 +1,292 @@
+"""
+Time-windowed digests: rollup summaries instead of individual messages.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+from .context import ContextRenderer
+from .delivery import LEVEL_PRIORITY
+from .formatter import LogLevel, MessageTemplate
+from .scrubber import Scrubber
+from .tracebacks import ExceptionSnapshot, TracebackRenderer
+
+logger = logging.getLogger(__name__)
+
+# Samples are shown compactly, several groups to a message
+_TRACEBACK_RENDERER = TracebackRenderer(max_chars=1200)
+_CONTEXT_RENDERER = ContextRenderer(max_chars=600, max_depth=2, max_items=10, max_value_chars=100)
+
+
+class DigestEntry:
+    """Occurrences of one (level, fingerprint) group within a digest window."""
+
+    __slots__ = ("level", "message", "count", "first_seen", "last_seen", "exception", "context")
+
+    def __init__(
+        self,
+        level: LogLevel,
+        message: str,
+        now: float,
+        exception: Optional[ExceptionSnapshot] = None,
+        context: Optional[Dict[str, Any]] = None
+    ):
+        self.level = level
+        self.message = message
+        self.count = 1
+        self.first_seen = now
+        self.last_seen = now
+        self.exception = exception
+        self.context = context
+
+
+class Digest:
+    """One closed digest window."""
+
+    __slots__ = ("entries", "events", "overflow", "window_start", "window_end")
+
+    def __init__(
+        self,
+        entries: List[DigestEntry],
+        events: int,
+        overflow: int,
+        window_start: float,
+        window_end: float
+    ):
+        """
+        Initialize the digest.
+
+        Args:
+            entries: Groups, in order of first occurrence
+            events: Events in the window, overflow included
+            overflow: Events that arrived once ``max_groups`` groups existed
+            window_start: Wall-clock time of the window's first event
+            window_end: Wall-clock time the window was closed
+        """
+        self.entries = entries
+        self.events = events
+        self.overflow = overflow
+        self.window_start = window_start
+        self.window_end = window_end
+
+    @property
+    def level(self) -> LogLevel:
+        """Highest level among the groups."""
+        return max((entry.level for entry in self.entries), key=LEVEL_PRIORITY.__getitem__, default=LogLevel.INFO)
+
+
+class DigestAggregator:
+    """
+    Counts events per group and hands over a Digest once per window.
+
+    A window opens with the first event after the previous digest and
+    closes ``interval`` seconds later, or as soon as it holds
+    ``max_events`` events (0 for no limit); ``on_flush`` is then called
+    with the Digest from a background thread. Recording an event is one
+    dict lookup and a counter update. Only the first event of a group keeps
+    a sample: its exception as a snapshot and a shallow copy of its
+    context. At most ``max_groups`` groups are kept per window; events of
+    further groups are only counted.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        on_flush: Callable[[Digest], None],
+        max_events: int = 0,
+        max_groups: int = 100
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            interval: Window length in seconds
+            on_flush: Called with each closed window's Digest
+            max_events: Events that close a window early, 0 for no limit
+            max_groups: Maximum number of groups kept per window
+        """
+        self.interval = interval
+        self.max_events = max(0, int(max_events))
+        self.max_groups = max(1, int(max_groups))
+        self._on_flush = on_flush
+        self._groups: Dict[Hashable, DigestEntry] = {}
+        self._events = 0
+        self._overflow = 0
+        self._window_start = 0.0
+        self._deadline: Optional[float] = None
+        self._full = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._sweeper: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def add(
+        self,
+        key: Hashable,
+        level: LogLevel,
+        message: str,
+        exception: Optional[Union[BaseException, ExceptionSnapshot]] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Record an event.
+
+        Args:
+            key: Group key, e.g. (level, fingerprint)
+            level: Log level
+            message: Message (or its template) shown for the group
+            exception: Optional exception, or its ExceptionSnapshot
+            context: Optional additional_context
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._groups.get(key)
+            if entry is not None:
+                entry.count += 1
+                entry.last_seen = now
+            elif len(self._groups) < self.max_groups:
+                if exception is not None and not isinstance(exception, ExceptionSnapshot):
+                    exception = _TRACEBACK_RENDERER.capture(exception)
+                self._groups[key] = DigestEntry(level, message, now, exception, dict(context) if context else None)
+            else:
+                self._overflow += 1
+
+            self._events += 1
+            if self._events == 1:
+                self._window_start = now
+                self._deadline = time.monotonic() + self.interval
+                if self._sweeper is None:
+                    self._start_sweeper()
+                self._wakeup.notify()
+            elif self.max_events and self._events >= self.max_events and not self._full:
+                self._full = True
+                self._wakeup.notify()
+
+    def flush(self) -> None:
+        """Close the current window now, emitting its digest."""
+        with self._lock:
+            digest = self._take()
+        self._emit(digest)
+
+    def _take(self) -> Optional[Digest]:
+        """Close the window and reset the table. Caller holds the lock."""
+        self._deadline = None
+        self._full = False
+        if not self._events:
+            return None
+        digest = Digest(
+            list(self._groups.values()),
+            self._events,
+            self._overflow,
+            self._window_start,
+            time.time()
+        )
+        self._groups = {}
+        self._events = 0
+        self._overflow = 0
+        return digest
+
+    def _emit(self, digest: Optional[Digest]) -> None:
+        if digest is None:
+            return
+        try:
+            self._on_flush(digest)
+        except Exception as e:
+            logger.error(f"Failed to send Slack digest: {e}", exc_info=True)
+
+    def _start_sweeper(self) -> None:
+        """Start the thread that closes windows. Caller holds the lock."""
+        self._sweeper = threading.Thread(
+            target=self._sweep,
+            name="slack-logger-digest",
+            daemon=True
+        )
+        self._sweeper.start()
+
+    def _sweep(self) -> None:
+        """Sleep until the window is due or full, then emit its digest."""
+        while True:
+            with self._lock:
+                while not self._full:
+                    if self._deadline is None:
+                        self._wakeup.wait()
+                        continue
+                    delay = self._deadline - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._wakeup.wait(delay)
+                digest = self._take()
+            self._emit(digest)
+
+
+def _clock(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%H:%M:%S")
+
+
+def _unchanged(text: str) -> str:
+    return text
+
+
+def _trim(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def render_digest(
+    template: MessageTemplate,
+    digest: Digest,
+    max_shown: int = 10,
+    scrubber: Optional[Scrubber] = None
+) -> Dict[str, Any]:
+    """
+    Render a digest as one Slack payload.
+
+    Groups are listed by count, most frequent first, each with its sample
+    exception and context; groups past ``max_shown`` are summarized in one
+    line.
+
+    Args:
+        template: Template of the digest's level
+        digest: Closed digest window
+        max_shown: Maximum number of groups listed
+        scrubber: Optional Scrubber redacting secrets from the samples
+
+    Returns:
+        Slack message payload with blocks
+    """
+    span = max(0.0, digest.window_end - digest.window_start)
+    groups = len(digest.entries)
+    payload = template.render(
+        f"Digest: {digest.events} event{'' if digest.events == 1 else 's'} "
+        f"in {groups} group{'' if groups == 1 else 's'} "
+        f"over {span:.0f}s ({_clock(digest.window_start)}–{_clock(digest.window_end)} UTC)"
+    )
+    footer = payload["blocks"].pop()
+
+    scrub = scrubber.scrub_text if scrubber is not None else _unchanged
+    entries = sorted(digest.entries, key=lambda entry: entry.count, reverse=True)
+    for entry in entries[:max_shown]:
+        lines = [
+            f"*{entry.count}×* `{entry.level.value.upper()}` {scrub(_trim(entry.message, 300))}",
+            f"First seen {_clock(entry.first_seen)}, last seen {_clock(entry.last_seen)} UTC",
+        ]
+        if entry.exception is not None:
+            lines.append(f"```{scrub(_TRACEBACK_RENDERER.render(entry.exception))}```")
+        if entry.context:
+            lines.append(_CONTEXT_RENDERER.render(entry.context, scrubber).rstrip("\n"))
+        payload["blocks"].append({"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(lines)}})
+
+    hidden = entries[max_shown:]
+    notes = []
+    if hidden:
+        notes.append(f"… and {len(hidden)} more groups ({sum(entry.count for entry in hidden)} events)")
+    if digest.overflow:
+        notes.append(f"{digest.overflow} events in further groups, not itemized")
+    if notes:
+        payload["blocks"].append({"type": "context", "elements": [{"type": "mrkdwn", "text": "\n".join(notes)}]})
+
+    payload["blocks"].append(footer)
+    return payload
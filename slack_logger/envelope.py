@@ -0,0 +1,41 @@
+"""
+Envelope carrying a payload and its delivery bookkeeping through the pipeline.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class Envelope:
+    """A formatted payload plus the spool records it has to acknowledge."""
+
+    __slots__ = ("payload", "spool_ids", "priority", "sample_rate", "destinations", "thread_key")
+
+    def __init__(
+        self,
+        payload: Dict[str, Any],
+        spool_ids: Sequence[int] = (),
+        priority: int = 0,
+        sample_rate: float = 1.0,
+        destinations: Tuple[str, ...] = (),
+        thread_key: Optional[Tuple[str, str]] = None
+    ):
+        """
+        Initialize the envelope.
+
+        Args:
+            payload: Slack message payload
+            spool_ids: Spool record ids to acknowledge once delivered
+            priority: Delivery lane; higher priorities are sent first
+            sample_rate: Probability with which sampling kept this message,
+                        1.0 if it was not sampled
+            destinations: Webhook URLs to deliver to; empty for the
+                         logger's own webhook
+            thread_key: (fingerprint, variant) pair threading the message
+                       under an earlier one, for the Web API client
+        """
+        self.payload = payload
+        self.spool_ids = spool_ids
+        self.priority = priority
+        self.sample_rate = sample_rate
+        self.destinations = destinations
+        self.thread_key = thread_key
@@ -2,11 +2,13 @@
 Formatter for creating rich Slack messages with blocks API.
 """
 
-import json
-import traceback
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Union
 from enum import Enum
+from .context import ContextRenderer
+from .scrubber import Scrubber
+from .tracebacks import ExceptionSnapshot, TracebackRenderer
 
 
 class LogLevel(Enum):
@@ -36,13 +38,38 @@ class SlackMessageFormatter:
         LogLevel.CRITICAL: "🚨",
     }
     
+    # Renders stack traces so the whole section stays within Slack's
+    # 3000 character limit for section text
+    TRACEBACK_RENDERER = TracebackRenderer(max_chars=3000 - len("*Stack Trace:*\n``````"))
+    
+    # Renders additional_context within the same limit
+    CONTEXT_RENDERER = ContextRenderer(max_chars=3000)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile(service_name: str, level: LogLevel) -> "MessageTemplate":
+        """
+        Return the compiled template for a service and level.
+        
+        Templates are cached, so repeated calls are cheap.
+        
+        Args:
+            service_name: Name of the service sending the log
+            level: Log level
+            
+        Returns:
+            MessageTemplate for the pair
+        """
+        return MessageTemplate(service_name, level)
+    
     @staticmethod
     def format_message(
         message: str,
         level: LogLevel,
         service_name: str,
-        exception: Optional[Exception] = None,
-        additional_context: Optional[Dict[str, Any]] = None
+        exception: Optional[Union[BaseException, ExceptionSnapshot]] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        scrubber: Optional[Scrubber] = None
     ) -> Dict[str, Any]:
         """
         Format a message into Slack blocks format.
@@ -51,56 +78,123 @@ class SlackMessageFormatter:
             message: The main error/message text
             level: Log level
             service_name: Name of the service sending the log
-            exception: Optional exception object
+            exception: Optional exception object, or its ExceptionSnapshot
             additional_context: Optional dictionary with additional context
+            scrubber: Optional Scrubber redacting secrets from every field
             
         Returns:
             Slack message payload with blocks
         """
-        timestamp = datetime.utcnow().isoformat()
-        color = SlackMessageFormatter.COLOR_MAP.get(level, "#808080")
-        emoji = SlackMessageFormatter.EMOJI_MAP.get(level, "📝")
+        return SlackMessageFormatter.compile(service_name, level).render(
+            message,
+            exception=exception,
+            additional_context=additional_context,
+            scrubber=scrubber
+        )
+    
+    @staticmethod
+    def format_simple_message(
+        message: str,
+        level: LogLevel,
+        service_name: str
+    ) -> Dict[str, Any]:
+        """
+        Format a simple message without exception details.
         
-        blocks = []
+        Args:
+            message: The message text
+            level: Log level
+            service_name: Name of the service
+            
+        Returns:
+            Slack message payload
+        """
+        return SlackMessageFormatter.format_message(
+            message=message,
+            level=level,
+            service_name=service_name,
+            exception=None,
+            additional_context=None
+        )
+
+
+class MessageTemplate:
+    """
+    Pre-built payload parts for one (service, level) pair.
+    
+    The header and divider blocks and the fallback text prefix are built
+    once; ``render`` only creates the blocks that change per message. The
+    shared blocks appear in every rendered payload, so they must be copied,
+    not modified, by code that post-processes payloads.
+    """
+    
+    __slots__ = ("service_name", "level", "header", "fallback_prefix")
+    
+    _DIVIDER = {"type": "divider"}
+    
+    def __init__(self, service_name: str, level: LogLevel):
+        """
+        Compile the template.
         
-        # Header block with color bar
-        blocks.append({
+        Args:
+            service_name: Name of the service sending the log
+            level: Log level
+        """
+        emoji = SlackMessageFormatter.EMOJI_MAP.get(level, "📝")
+        self.service_name = service_name
+        self.level = level
+        self.header = {
             "type": "header",
             "text": {
                 "type": "plain_text",
                 "text": f"{emoji} {level.value.upper()}: {service_name}"
             }
-        })
-        
-        # Divider
-        blocks.append({"type": "divider"})
+        }
+        self.fallback_prefix = f"{level.value.upper()}: "
+    
+    def render(
+        self,
+        message: str,
+        exception: Optional[Union[BaseException, ExceptionSnapshot]] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        scrubber: Optional[Scrubber] = None
+    ) -> Dict[str, Any]:
+        """
+        Fill the template's variable slots.
         
-        # Main message block
-        message_text = f"*Message:*\n{message}"
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": message_text
-            }
-        })
+        Args:
+            message: The main error/message text
+            exception: Optional exception object, or its ExceptionSnapshot
+            additional_context: Optional dictionary with additional context
+            scrubber: Optional Scrubber; the message, exception message and
+                     stack trace are each scanned once, the context while
+                     it is rendered
+            
+        Returns:
+            Slack message payload with blocks
+        """
+        if scrubber is not None:
+            message = scrubber.scrub_text(message)
+        blocks = [
+            self.header,
+            self._DIVIDER,
+            {"type": "section", "text": {"type": "mrkdwn", "text": f"*Message:*\n{message}"}},
+        ]
+        fallback_text = self.fallback_prefix + message
         
         # Exception details if provided
         if exception:
-            exception_type = type(exception).__name__
-            exception_message = str(exception)
-            
-            # Stack trace
-            stack_trace = "".join(traceback.format_exception(
-                type(exception),
-                exception,
-                exception.__traceback__
-            ))
+            renderer = SlackMessageFormatter.TRACEBACK_RENDERER
+            if not isinstance(exception, ExceptionSnapshot):
+                exception = renderer.capture(exception)
+            exception_type = exception.name
             
-            # Truncate stack trace if too long (Slack has message limits)
-            max_stack_length = 3000
-            if len(stack_trace) > max_stack_length:
-                stack_trace = stack_trace[:max_stack_length] + "\n... (truncated)"
+            # Stack trace, innermost frames first within the size budget
+            stack_trace = renderer.render(exception)
+            exception_message = exception.message
+            if scrubber is not None:
+                stack_trace = scrubber.scrub_text(stack_trace)
+                exception_message = scrubber.scrub_text(exception_message)
             
             blocks.append({
                 "type": "section",
@@ -113,78 +207,23 @@ class SlackMessageFormatter:
             # Stack trace in code block
             blocks.append({
                 "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Stack Trace:*\n```{stack_trace}```"
-                }
+                "text": {"type": "mrkdwn", "text": f"*Stack Trace:*\n```{stack_trace}```"}
             })
+            fallback_text += f" ({exception_type})"
         
         # Additional context if provided
         if additional_context:
-            context_text = "*Additional Context:*\n"
-            for key, value in additional_context.items():
-                # Format value appropriately
-                if isinstance(value, (dict, list)):
-                    value_str = json.dumps(value, indent=2)
-                else:
-                    value_str = str(value)
-                
-                context_text += f"• *{key}:* `{value_str}`\n"
-            
+            context_text = SlackMessageFormatter.CONTEXT_RENDERER.render(additional_context, scrubber)
             blocks.append({
                 "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": context_text
-                }
+                "text": {"type": "mrkdwn", "text": context_text}
             })
         
         # Timestamp footer
         blocks.append({
             "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"🕐 {timestamp} UTC"
-                }
-            ]
+            "elements": [{"type": "mrkdwn", "text": f"🕐 {datetime.utcnow().isoformat()} UTC"}]
         })
         
-        # Return payload with blocks
-        payload = {
-            "blocks": blocks
-        }
-        
-        # Add fallback text for notifications
-        fallback_text = f"{level.value.upper()}: {message}"
-        if exception:
-            fallback_text += f" ({type(exception).__name__})"
-        payload["text"] = fallback_text
-        
-        return payload
-    
-    @staticmethod
-    def format_simple_message(
-        message: str,
-        level: LogLevel,
-        service_name: str
-    ) -> Dict[str, Any]:
-        """
-        Format a simple message without exception details.
-        
-        Args:
-            message: The message text
-            level: Log level
-            service_name: Name of the service
-            
-        Returns:
-            Slack message payload
-        """
-        return SlackMessageFormatter.format_message(
-            message=message,
-            level=level,
-            service_name=service_name,
-            exception=None,
-            additional_context=None
-        )
-
+        # Fallback text is used for notifications
+        return {"blocks": blocks, "text": fallback_text}
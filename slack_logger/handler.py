@@ -0,0 +1,147 @@
+"""
+Standard library logging integration.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional
+from .config import Config
+from .formatter import LogLevel
+from .logger import SlackLogger
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class _RecordMessage:
+    """Defers LogRecord.getMessage() until the message is actually sent."""
+
+    __slots__ = ("record",)
+
+    def __init__(self, record: logging.LogRecord):
+        self.record = record
+
+    def __str__(self) -> str:
+        return self.record.getMessage()
+
+
+class SlackLoggingHandler(logging.Handler):
+    """
+    logging.Handler that forwards records to a SlackLogger.
+
+    Usage:
+        handler = SlackLoggingHandler(service_name="my-service", level=logging.ERROR)
+        logging.getLogger().addHandler(handler)
+
+        log.error("Payment %s failed", order_id, exc_info=True, extra={"user_id": 42})
+
+    The handler's level is checked by ``logging`` itself before the handler
+    is called, so records below it cost no more than an ``isEnabledFor``
+    check. Records that pass the level are then filtered by logger name
+    (verdicts are cached per name) before any Slack formatting runs, and
+    ``%``-style messages are only rendered once duplicate suppression has
+    let the record through.
+
+    ``exc_info`` becomes the Slack ``exception`` and ``extra`` fields become
+    ``additional_context``. Records from slack_logger's own loggers are
+    always ignored, so delivery failures can't feed back into Slack.
+    """
+
+    def __init__(
+        self,
+        slack_logger: Optional[SlackLogger] = None,
+        level: int = logging.ERROR,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        async_send: bool = True,
+        **logger_kwargs: Any
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            slack_logger: Logger to forward to. If not provided, one is built
+                         from ``logger_kwargs`` (webhook_url, service_name, ...).
+            level: Minimum record level sent to Slack. Defaults to ERROR.
+            include: Logger names (and their children) to forward. Defaults
+                    to all loggers.
+            exclude: Logger names (and their children) never forwarded
+            async_send: If True (default), queue records for background
+                       delivery instead of blocking the logging call
+            **logger_kwargs: SlackLogger arguments used when slack_logger
+                            is not provided
+        """
+        super().__init__(level)
+        self.slack_logger = slack_logger or SlackLogger(**logger_kwargs)
+        self.async_send = async_send
+        self._include = tuple(include) if include else None
+        self._exclude = ("slack_logger",) + tuple(exclude or ())
+        self._name_verdicts: Dict[str, bool] = {}
+        self._emitting = threading.local()
+
+    @staticmethod
+    def _matches(name: str, prefixes: Iterable[str]) -> bool:
+        return any(name == prefix or name.startswith(prefix + ".") for prefix in prefixes)
+
+    def _accepts(self, name: str) -> bool:
+        """Return whether records from logger ``name`` go to Slack."""
+        verdict = self._name_verdicts.get(name)
+        if verdict is None:
+            verdict = not self._matches(name, self._exclude) and (
+                self._include is None or self._matches(name, self._include)
+            )
+            self._name_verdicts[name] = verdict
+        return verdict
+
+    @staticmethod
+    def to_log_level(levelno: int) -> LogLevel:
+        """Map a logging level number to a Slack LogLevel."""
+        if levelno >= logging.CRITICAL:
+            return LogLevel.CRITICAL
+        if levelno >= logging.ERROR:
+            return LogLevel.ERROR
+        if levelno >= logging.WARNING:
+            return LogLevel.WARNING
+        return LogLevel.INFO
+
+    @staticmethod
+    def _extra(record: logging.LogRecord) -> Optional[Dict[str, Any]]:
+        context = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+        }
+        return context or None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Forward a record to Slack."""
+        if not self._accepts(record.name) or getattr(self._emitting, "active", False):
+            return
+        self._emitting.active = True
+        try:
+            exception = record.exc_info[1] if record.exc_info else None
+            self.slack_logger._log(
+                message=_RecordMessage(record),
+                level=self.to_log_level(record.levelno),
+                exception=exception,
+                additional_context=self._extra(record),
+                async_send=self.async_send,
+                template=str(record.msg)
+            )
+        except Exception:
+            self.handleError(record)
+        finally:
+            self._emitting.active = False
+
+    def flush(self) -> None:
+        """Wait (at most SLACK_LOGGER_FLUSH_TIMEOUT) for queued records to be delivered."""
+        self.slack_logger.flush(Config.get_flush_timeout())
+
+    def close(self) -> None:
+        """Flush pending records and release the handler."""
+        try:
+            self.flush()
+        finally:
+            super().close()
@@ -0,0 +1,247 @@
+"""
+Process-wide hooks reporting uncaught exceptions to Slack.
+"""
+
+import atexit
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+from .config import Config
+from .delivery import abandon_all_queues, close_all_queues
+from .logger import SlackLogger, close_all_loggers
+
+logger = logging.getLogger(__name__)
+
+_installed: Optional["ExceptionHooks"] = None
+_installed_lock = threading.Lock()
+
+
+class ExceptionHooks:
+    """
+    Routes uncaught exceptions into a SlackLogger.
+
+    ``install`` replaces ``sys.excepthook``, ``threading.excepthook``, the
+    exception handler of an asyncio loop and, optionally, the SIGTERM
+    handler. Each hook reports to Slack without waiting on the network
+    (``async_send=True``) and then calls the handler it replaced, so
+    tracebacks are still printed and other hooks keep working.
+
+    At interpreter exit, or on SIGTERM, pending messages are flushed within
+    ``flush_timeout`` seconds in total. The flush runs on a daemon thread
+    that is abandoned when the budget runs out, so an unreachable Slack
+    endpoint never holds up process exit.
+    """
+
+    def __init__(self, slack_logger: SlackLogger, flush_timeout: Optional[float] = None):
+        """
+        Initialize the hooks. Call ``install`` to activate them.
+
+        Args:
+            slack_logger: Logger uncaught exceptions are reported to
+            flush_timeout: Seconds pending messages may delay exit.
+                          Defaults to SLACK_LOGGER_FLUSH_TIMEOUT.
+        """
+        self.slack_logger = slack_logger
+        self.flush_timeout = flush_timeout if flush_timeout is not None else Config.get_flush_timeout()
+        self._previous_excepthook = None
+        self._previous_threading_hook = None
+        self._previous_signal = None
+        self._loop = None
+        self._previous_loop_handler = None
+        self._shut_down = False
+        self._shutdown_lock = threading.Lock()
+
+    def install(self, loop=None, sigterm: bool = True) -> "ExceptionHooks":
+        """
+        Install the hooks.
+
+        Args:
+            loop: asyncio event loop to hook. Defaults to the loop running in
+                 the calling thread, if any; without one, asyncio is not
+                 hooked.
+            sigterm: Also flush on SIGTERM before handing the signal to the
+                    previous handler. Only possible from the main thread.
+
+        Returns:
+            self
+        """
+        self._previous_excepthook = sys.excepthook
+        sys.excepthook = self._excepthook
+
+        if hasattr(threading, "excepthook"):
+            self._previous_threading_hook = threading.excepthook
+            threading.excepthook = self._threading_hook
+
+        if loop is None and "asyncio" in sys.modules:
+            # asyncio is only imported by processes that already use it
+            import asyncio
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        if loop is not None:
+            self._loop = loop
+            self._previous_loop_handler = loop.get_exception_handler()
+            loop.set_exception_handler(self._loop_handler)
+
+        if sigterm and threading.current_thread() is threading.main_thread():
+            self._previous_signal = signal.signal(signal.SIGTERM, self._sigterm)
+
+        atexit.register(self.shutdown)
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the handlers replaced by ``install``, where still in place."""
+        if sys.excepthook == self._excepthook:
+            sys.excepthook = self._previous_excepthook
+        if self._previous_threading_hook is not None and threading.excepthook == self._threading_hook:
+            threading.excepthook = self._previous_threading_hook
+        if self._loop is not None and self._loop.get_exception_handler() == self._loop_handler:
+            self._loop.set_exception_handler(self._previous_loop_handler)
+        if signal.getsignal(signal.SIGTERM) == self._sigterm:
+            previous = self._previous_signal
+            signal.signal(signal.SIGTERM, previous if previous is not None else signal.SIG_DFL)
+        self._loop = None
+        self._previous_signal = None
+        atexit.unregister(self.shutdown)
+
+    def _report(self, level: str, message: str, exception: Optional[BaseException], context: Dict[str, Any]) -> None:
+        try:
+            getattr(self.slack_logger, level)(
+                message,
+                exception=exception,
+                additional_context=context,
+                async_send=True
+            )
+        except Exception as e:
+            logger.error(f"Failed to report uncaught exception to Slack: {e}", exc_info=True)
+
+    def _excepthook(self, exc_type, exc_value, exc_traceback) -> None:
+        if not issubclass(exc_type, KeyboardInterrupt):
+            if exc_value is not None and exc_value.__traceback__ is None:
+                exc_value = exc_value.with_traceback(exc_traceback)
+            self._report(
+                "critical",
+                "Uncaught exception in main thread",
+                exc_value,
+                {"thread": threading.current_thread().name, "pid": os.getpid()}
+            )
+        self._previous_excepthook(exc_type, exc_value, exc_traceback)
+
+    def _threading_hook(self, args) -> None:
+        if not issubclass(args.exc_type, SystemExit):
+            name = args.thread.name if args.thread is not None else "unknown"
+            self._report(
+                "error",
+                f"Uncaught exception in thread {name}",
+                args.exc_value,
+                {"thread": name, "pid": os.getpid()}
+            )
+        self._previous_threading_hook(args)
+
+    def _loop_handler(self, loop, context: Dict[str, Any]) -> None:
+        exception = context.get("exception")
+        details = {
+            key: repr(value)[:200]
+            for key, value in context.items()
+            if key in ("future", "task", "handle", "protocol", "transport")
+        }
+        self._report(
+            "error" if exception is not None else "warning",
+            context.get("message") or "Unhandled exception in asyncio event loop",
+            exception,
+            details
+        )
+        previous = self._previous_loop_handler
+        if previous is not None:
+            previous(loop, context)
+        else:
+            loop.default_exception_handler(context)
+
+    def _sigterm(self, signum, frame) -> None:
+        self.shutdown()
+        previous = self._previous_signal
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            # Terminate the way the signal would have without us; None is
+            # a handler that wasn't installed from Python, so the default
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+    def shutdown(self) -> bool:
+        """
+        Flush pending messages within ``flush_timeout`` seconds, once.
+
+        Closes the hooked logger, then every other open logger and
+        background queue, on a daemon thread. Whatever is still pending when the budget runs out
+        is abandoned.
+
+        Returns:
+            True if everything was delivered in time
+        """
+        with self._shutdown_lock:
+            if self._shut_down:
+                return True
+            self._shut_down = True
+
+        budget = self.flush_timeout
+        deadline = time.monotonic() + budget
+        result = []
+
+        def flush() -> None:
+            drained = self.slack_logger.close(budget)
+            drained = close_all_loggers(max(0.0, deadline - time.monotonic())) and drained
+            result.append(close_all_queues(max(0.0, deadline - time.monotonic())) and drained)
+
+        try:
+            thread = threading.Thread(target=flush, name="slack-logger-shutdown", daemon=True)
+            thread.start()
+        except RuntimeError:
+            # Threads can no longer be started; flush inline, bounded by the queues' own timeouts
+            flush()
+            return result[0]
+        thread.join(budget)
+        if thread.is_alive():
+            logger.warning(f"Slack logger shutdown exceeded {budget:g}s; abandoning pending messages")
+            abandon_all_queues()
+            return False
+        return bool(result and result[0])
+
+
+def install_hooks(
+    slack_logger: Optional[SlackLogger] = None,
+    loop=None,
+    flush_timeout: Optional[float] = None,
+    sigterm: bool = True,
+    **logger_kwargs: Any
+) -> ExceptionHooks:
+    """
+    Report uncaught exceptions in the main thread, other threads and asyncio to Slack.
+
+    Calling it again replaces the hooks installed before.
+
+    Args:
+        slack_logger: Logger to report to. If not provided, one is built
+                     from ``logger_kwargs`` (webhook_url, service_name, ...).
+        loop: asyncio event loop to hook. Defaults to the running loop, if any.
+        flush_timeout: Seconds pending messages may delay exit, in total.
+                      Defaults to SLACK_LOGGER_FLUSH_TIMEOUT.
+        sigterm: Also flush on SIGTERM, then hand the signal on
+        **logger_kwargs: SlackLogger arguments used when slack_logger is
+                        not provided
+
+    Returns:
+        The installed ExceptionHooks; call ``uninstall()`` to remove them
+    """
+    global _installed
+    hooks = ExceptionHooks(slack_logger or SlackLogger(**logger_kwargs), flush_timeout)
+    with _installed_lock:
+        if _installed is not None:
+            _installed.uninstall()
+        _installed = hooks.install(loop=loop, sigterm=sigterm)
+    return hooks
@@ -0,0 +1,156 @@
+"""
+Fitting payloads to Slack's size limits before they are sent.
+"""
+
+from typing import Any, Dict, List
+
+# Limits enforced by Slack; payloads exceeding them are rejected with a 400
+MAX_BLOCKS = 50
+MAX_HEADER_CHARS = 150
+MAX_SECTION_CHARS = 3000
+MAX_CONTEXT_ELEMENTS = 10
+MAX_TEXT_CHARS = 40000
+
+_FENCE = "```"
+
+
+def _trim(text: str, limit: int) -> str:
+    """Cut ``text`` to ``limit`` characters, marking the cut with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1] + "…"
+
+
+def split_text(text: str, limit: int = MAX_SECTION_CHARS) -> List[str]:
+    """
+    Split mrkdwn text into chunks of at most ``limit`` characters.
+
+    Chunks end at line breaks where possible. A code block (```) cut by a
+    chunk boundary is closed at the end of the chunk and reopened at the
+    start of the next one, so each chunk renders on its own.
+
+    Args:
+        text: Text to split
+        limit: Maximum characters per chunk
+
+    Returns:
+        The chunks, in order
+    """
+    if len(text) <= limit:
+        return [text]
+
+    chunks = []
+    in_fence = False
+    while text:
+        prefix = _FENCE if in_fence else ""
+        if len(prefix) + len(text) <= limit:
+            chunks.append(prefix + text)
+            break
+
+        # Leave room to close a code block at the end of the chunk
+        room = limit - len(prefix) - len(_FENCE)
+        cut = text.rfind("\n", 0, room)
+        if cut <= room // 2:
+            cut = room
+            # Don't split a fence marker
+            while cut > 0 and text[cut - 1] == "`":
+                cut -= 1
+            if cut == 0:
+                cut = room
+        chunk = prefix + text[:cut]
+        text = text[cut + 1:] if text[cut] == "\n" else text[cut:]
+
+        in_fence = chunk.count(_FENCE) % 2 == 1
+        if in_fence:
+            chunk += _FENCE
+        chunks.append(chunk)
+    return chunks
+
+
+def _fit_block(block: Dict[str, Any], out: List[Dict[str, Any]]) -> bool:
+    """
+    Append ``block`` to ``out``, trimmed or split to the limits.
+
+    Blocks are copied before being changed; payload templates share them.
+
+    Returns:
+        True if the block had to be changed
+    """
+    block_type = block.get("type")
+    text = block.get("text")
+    if block_type == "header" and text and len(text.get("text", "")) > MAX_HEADER_CHARS:
+        out.append(dict(block, text=dict(text, text=_trim(text["text"], MAX_HEADER_CHARS))))
+        return True
+    if block_type == "section" and text and len(text.get("text", "")) > MAX_SECTION_CHARS:
+        for chunk in split_text(text["text"], MAX_SECTION_CHARS):
+            out.append(dict(block, text=dict(text, text=chunk)))
+        return True
+    if block_type == "context":
+        elements = block.get("elements", ())
+        if len(elements) > MAX_CONTEXT_ELEMENTS or any(
+            len(element.get("text", "")) > MAX_SECTION_CHARS for element in elements
+        ):
+            elements = [
+                dict(element, text=_trim(element["text"], MAX_SECTION_CHARS))
+                if len(element.get("text", "")) > MAX_SECTION_CHARS else element
+                for element in elements[:MAX_CONTEXT_ELEMENTS]
+            ]
+            out.append(dict(block, elements=elements))
+            return True
+    out.append(block)
+    return False
+
+
+def fit_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Fit a payload to Slack's limits.
+
+    Headers are trimmed to 150 characters, section texts over 3000
+    characters are split into consecutive sections and context blocks are
+    trimmed. If the result has more than 50 blocks, it is split into a
+    first message and continuation messages, each starting with a
+    "continued" marker. Payloads within the limits are returned unchanged.
+
+    Args:
+        payload: Slack message payload
+
+    Returns:
+        One or more payloads, in delivery order
+    """
+    text = payload.get("text")
+    oversized_text = isinstance(text, str) and len(text) > MAX_TEXT_CHARS
+    blocks = payload.get("blocks")
+    if not blocks:
+        if oversized_text:
+            return [dict(payload, text=_trim(text, MAX_TEXT_CHARS))]
+        return [payload]
+
+    fitted: List[Dict[str, Any]] = []
+    changed = False
+    for block in blocks:
+        changed = _fit_block(block, fitted) or changed
+
+    if len(fitted) <= MAX_BLOCKS:
+        if not changed and not oversized_text:
+            return [payload]
+        fitted_payload = dict(payload, blocks=fitted)
+        if oversized_text:
+            fitted_payload["text"] = _trim(text, MAX_TEXT_CHARS)
+        return [fitted_payload]
+
+    # One block of every message is left for the continuation marker
+    per_message = MAX_BLOCKS - 1
+    total = (len(fitted) + per_message - 1) // per_message
+    fallback = _trim(text or "", MAX_TEXT_CHARS - 32)
+    messages = []
+    for index in range(total):
+        part = fitted[index * per_message:(index + 1) * per_message]
+        if index:
+            part.insert(0, {
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": f"_continued ({index + 1}/{total})_"}]
+            })
+            messages.append(dict(payload, blocks=part, text=f"{fallback} (continued {index + 1}/{total})"))
+        else:
+            messages.append(dict(payload, blocks=part, text=fallback))
+    return messages
@@ -2,14 +2,49 @@
 Main Slack Logger class for error logging.
 """
 
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import sys
+import threading
+import time
+import weakref
+from typing import Callable, List, Optional, Dict, Any, Sequence, Tuple, Union
 from .config import Config
-from .client import SlackWebhookClient
+from .batching import PayloadBatcher
+from .client import SendResult, SlackWebhookClient
+from .dedupe import DuplicateSuppressor, SuppressedEvent, fingerprint
+from .delivery import LEVEL_PRIORITY, DeliveryQueue, DropPolicy
+from .digest import Digest, DigestAggregator, render_digest
+from .envelope import Envelope
 from .formatter import SlackMessageFormatter, LogLevel
+from .limits import fit_payload
+from .metrics import Metrics
+from .retry import RetryPolicy
+from .routing import Route, RoutingTable
+from .sampling import AdaptiveSampler
+from .scrubber import Scrubber
+from .spool import Spool
 
 logger = logging.getLogger(__name__)
 
+# Where messages go while the webhook's circuit breaker is open
+_FALLBACKS = ("spool", "stderr", "drop")
+
+# Loggers still open at interpreter exit get closed by _close_all_loggers
+_live_loggers = weakref.WeakSet()
+
+
+def _sample_rate_block(sample_rate: float) -> Dict[str, Any]:
+    """Context block telling readers a message was kept by sampling."""
+    return {
+        "type": "context",
+        "elements": [{
+            "type": "mrkdwn",
+            "text": f"🎲 Sampled at {sample_rate * 100:.3g}% under load: stands for about "
+                    f"{1 / sample_rate:.0f} similar messages"
+        }]
+    }
+
 
 class SlackLogger:
     """
@@ -24,7 +59,28 @@ class SlackLogger:
         self,
         webhook_url: Optional[str] = None,
         service_name: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        drop_policy: Optional[Union[str, DropPolicy]] = None,
+        pool_size: Optional[int] = None,
+        dedupe_window: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        batch_linger: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        spool_dir: Optional[str] = None,
+        relay_socket: Optional[str] = None,
+        sample_queue_depth: Optional[int] = None,
+        sample_send_rate: Optional[float] = None,
+        fallback: Optional[Union[str, Callable[[Dict[str, Any]], None]]] = None,
+        metrics: Optional[bool] = None,
+        routes: Optional[Union[RoutingTable, Sequence[Route]]] = None,
+        digest_interval: Optional[float] = None,
+        digest_max_events: Optional[int] = None,
+        digest_bypass_critical: Optional[bool] = None,
+        bot_token: Optional[str] = None,
+        channel: Optional[str] = None,
+        scrubber: Optional[Union[bool, Scrubber]] = None
     ):
         """
         Initialize the Slack Logger.
@@ -36,19 +92,607 @@ class SlackLogger:
                          will try to get from SLACK_LOGGER_SERVICE_NAME environment
                          variable, or default to "unknown-service".
             timeout: HTTP request timeout in seconds. Defaults to 10.
+            queue_size: Maximum number of messages waiting for background
+                       delivery when using async_send. Defaults to 1000.
+            workers: Number of background delivery threads. Defaults to 1.
+            drop_policy: What to do when the queue is full: "drop_oldest",
+                        "drop_newest" or "block". Defaults to "drop_oldest".
+            pool_size: Keep-alive HTTP connections per webhook host, shared by
+                      all loggers posting to that host. Defaults to 10.
+            dedupe_window: Seconds during which repeats of the same exception
+                          (or message) are suppressed and counted; a single
+                          "N more occurrences" message follows when the window
+                          closes. Defaults to 0 (disabled).
+            batch_size: Maximum number of messages merged into one webhook
+                       post. Values above 1 enable batching, which routes
+                       every message through the background queue.
+                       Defaults to 1 (disabled).
+            batch_linger: Seconds a batch waits for more messages before it
+                         is sent. Defaults to 0.2.
+            retry_policy: Backoff and per-message deadline. Defaults to the
+                         SLACK_LOGGER_RETRY_* and SLACK_LOGGER_DEADLINE settings.
+            spool_dir: Directory of an on-disk spool. Every message is written
+                      there before delivery and acknowledged afterwards;
+                      messages left over from a previous run are replayed in
+                      the background on startup. Defaults to
+                      SLACK_LOGGER_SPOOL_DIR, or no spool.
+            relay_socket: Unix socket of a slack-logger-relay process. Messages
+                         are handed to the relay with one non-blocking write and
+                         only delivered directly when the relay is unavailable.
+                         Defaults to SLACK_LOGGER_RELAY_SOCKET, or no relay.
+            sample_queue_depth: Queue depth above which INFO and WARNING
+                               messages are sampled. Defaults to
+                               SLACK_LOGGER_SAMPLE_QUEUE_DEPTH, or 0 (ignored).
+            sample_send_rate: Messages per second above which INFO and
+                             WARNING messages are sampled. Defaults to
+                             SLACK_LOGGER_SAMPLE_SEND_RATE, or 0 (ignored).
+            fallback: Where messages go while the webhook's circuit breaker
+                     is open: "spool" (kept in the spool and replayed once
+                     Slack recovers), "stderr", "drop", or a callable taking
+                     the payload. Defaults to SLACK_LOGGER_FALLBACK, or
+                     "spool" when a spool is configured and "stderr" otherwise.
+            metrics: Record delivery counters, stage timings and gauges,
+                    available through ``stats()`` and ``render_prometheus``.
+                    Defaults to SLACK_LOGGER_METRICS, or disabled.
+            routes: Routing table (or list of Route) sending messages to
+                   other webhooks by level, service or additional_context.
+                   A message goes to every matching route's webhooks at once;
+                   messages no route matches go to webhook_url. Defaults to
+                   SLACK_LOGGER_ROUTES, or no routing.
+            digest_interval: Seconds over which messages are collected into
+                            one digest post instead of being sent one by one.
+                            Events are grouped by level and fingerprint and
+                            counted; each group keeps one sample exception
+                            and context. Defaults to SLACK_LOGGER_DIGEST_INTERVAL,
+                            or 0 (disabled).
+            digest_max_events: Number of events that sends the digest before
+                              the interval is over. Defaults to
+                              SLACK_LOGGER_DIGEST_MAX_EVENTS, or 0 (no limit).
+            digest_bypass_critical: Send CRITICAL messages at once instead of
+                                   digesting them. Defaults to
+                                   SLACK_LOGGER_DIGEST_BYPASS_CRITICAL, or True.
+            bot_token: Bot token posting through the Web API instead of the
+                      webhook. The first occurrence of an error becomes a
+                      parent message whose occurrence counter is edited in
+                      place; new variants are posted as thread replies.
+                      webhook_url is not needed and ignored. Defaults to
+                      SLACK_LOGGER_BOT_TOKEN, or webhook delivery.
+            channel: Channel the Web API posts to; required with bot_token.
+                    Defaults to SLACK_LOGGER_CHANNEL.
+            scrubber: Redacts tokens, passwords and email addresses from the
+                     message, additional_context, exception message and
+                     stack trace before anything is sent. True uses the
+                     default rules plus SLACK_LOGGER_SCRUB_KEYS and
+                     SLACK_LOGGER_SCRUB_PATTERNS, False disables it, or pass
+                     a Scrubber. Defaults to SLACK_LOGGER_SCRUB, or True.
         
         Raises:
-            ValueError: If webhook_url is not provided and not found in environment.
+            ValueError: If webhook_url is not provided and not found in environment
+                       (and no bot_token is), bot_token has no channel, the fallback is unknown or needs a missing spool,
+                       the routes are invalid, or a scrub pattern is not a valid regular expression.
+            RuntimeError: If another open spool (of this or another process) uses spool_dir.
         """
+        bot_token = Config.get_bot_token(bot_token)
         self.webhook_url = Config.get_webhook_url(webhook_url)
-        if not self.webhook_url:
+        if not self.webhook_url and not bot_token:
             raise ValueError(
                 "webhook_url must be provided either as parameter or "
                 "SLACK_WEBHOOK_URL environment variable"
             )
+        channel = Config.get_channel(channel)
+        if bot_token and not channel:
+            raise ValueError(
+                "channel must be provided either as parameter or "
+                "SLACK_LOGGER_CHANNEL environment variable when using bot_token"
+            )
         
         self.service_name = Config.get_service_name(service_name)
-        self.client = SlackWebhookClient(self.webhook_url, timeout=timeout)
+        # Header, divider and fallback prefix are built once per level
+        self._templates = {
+            level: SlackMessageFormatter.compile(self.service_name, level)
+            for level in LogLevel
+        }
+        self.scrubber = Config.get_scrubber(scrubber)
+        self.metrics: Optional[Metrics] = None
+        if Config.get_metrics_enabled(metrics):
+            self.metrics = Metrics(self.service_name)
+            self.metrics.gauge("queue_depth", lambda: len(self._queue) if self._queue is not None else 0)
+        self._threaded = bool(bot_token)
+        if bot_token:
+            # Imported here so webhook-only loggers never load it
+            from .webapi import SlackWebAPIClient
+            self.client = SlackWebAPIClient(
+                bot_token,
+                channel,
+                api_url=Config.get_api_url(),
+                timeout=timeout,
+                pool_size=pool_size,
+                retry_policy=retry_policy,
+                metrics=self.metrics,
+                **Config.get_thread_settings()
+            )
+            self.webhook_url = self.client.webhook_url
+        else:
+            self.client = SlackWebhookClient(
+                self.webhook_url,
+                timeout=timeout,
+                pool_size=pool_size,
+                retry_policy=retry_policy,
+                metrics=self.metrics
+            )
+        
+        if routes is None and Config.get_routes():
+            routes = RoutingTable.from_json(Config.get_routes())
+        if routes is not None and not isinstance(routes, RoutingTable):
+            routes = RoutingTable(routes)
+        self.router: Optional[RoutingTable] = routes if routes is not None and routes.routes else None
+        # One client per destination, each with its own rate limiter and breaker
+        self._client_settings = dict(
+            timeout=timeout,
+            pool_size=pool_size,
+            retry_policy=retry_policy,
+            metrics=self.metrics
+        )
+        self._clients: Dict[str, SlackWebhookClient] = {self.webhook_url: self.client}
+        if self.router is not None:
+            for url in self.router.webhooks:
+                if url not in self._clients:
+                    self._clients[url] = SlackWebhookClient(url, **self._client_settings)
+        self._executor = None
+        
+        self.queue_size = queue_size or Config.get_queue_size()
+        self.workers = workers or Config.get_worker_count()
+        self.drop_policy = DropPolicy.parse(drop_policy or Config.get_drop_policy())
+        
+        batch_size = batch_size or Config.get_batch_size()
+        self._batcher: Optional[PayloadBatcher] = None
+        if batch_size > 1:
+            self._batcher = PayloadBatcher(
+                max_batch=batch_size,
+                linger=batch_linger if batch_linger is not None else Config.get_batch_linger(),
+                max_bytes=Config.get_batch_max_bytes()
+            )
+        self._queue: Optional[DeliveryQueue] = None
+        self._queue_lock = threading.Lock()
+        
+        sampler = AdaptiveSampler(
+            queue_depth=sample_queue_depth if sample_queue_depth is not None else Config.get_sample_queue_depth(),
+            send_rate=sample_send_rate if sample_send_rate is not None else Config.get_sample_send_rate(),
+            min_rate=Config.get_sample_min_rate(),
+            min_priority=LEVEL_PRIORITY[LogLevel.ERROR]
+        )
+        self._sampler: Optional[AdaptiveSampler] = sampler if sampler.enabled else None
+        
+        relay_socket = Config.get_relay_socket(relay_socket)
+        self.relay = None
+        if relay_socket:
+            # Imported here so processes without a relay never load asyncio
+            from .relay import RelayTransport
+            self.relay = RelayTransport(relay_socket)
+        
+        spool_dir = Config.get_spool_dir(spool_dir)
+        self.spool: Optional[Spool] = None
+        self._deferred = False
+        self._replay_lock = threading.Lock()
+        # Failed replays in a row, and when the next one may start
+        self._replay_failures = 0
+        self._replay_due = 0.0
+        if spool_dir:
+            self.spool = Spool(
+                spool_dir,
+                fsync=Config.get_spool_fsync(),
+                max_bytes=Config.get_spool_max_bytes()
+            )
+            if len(self.spool):
+                self._start_replay()
+        
+        if not callable(fallback):
+            fallback = Config.get_fallback(fallback)
+            if fallback is None:
+                fallback = "spool" if self.spool is not None else "stderr"
+            fallback = fallback.strip().lower()
+            if fallback not in _FALLBACKS:
+                raise ValueError(
+                    f"Unknown fallback {fallback!r}, expected a callable or one of: {', '.join(_FALLBACKS)}"
+                )
+            if fallback == "spool" and self.spool is None:
+                raise ValueError("fallback 'spool' requires spool_dir or SLACK_LOGGER_SPOOL_DIR")
+        self.fallback = fallback
+        
+        if dedupe_window is None:
+            dedupe_window = Config.get_dedupe_window()
+        self._suppressor: Optional[DuplicateSuppressor] = None
+        if dedupe_window > 0:
+            self._suppressor = DuplicateSuppressor(
+                dedupe_window,
+                self._report_suppressed,
+                max_entries=Config.get_dedupe_max_entries()
+            )
+        
+        if digest_interval is None:
+            digest_interval = Config.get_digest_interval()
+        self._digest: Optional[DigestAggregator] = None
+        if digest_interval > 0:
+            self._digest = DigestAggregator(
+                digest_interval,
+                self._report_digest,
+                max_events=digest_max_events if digest_max_events is not None else Config.get_digest_max_events(),
+                max_groups=Config.get_digest_max_groups()
+            )
+        self.digest_bypass_critical = Config.get_digest_bypass_critical(digest_bypass_critical)
+        _live_loggers.add(self)
+    
+    def _get_queue(self) -> DeliveryQueue:
+        """Return the background delivery queue, starting it on first use."""
+        queue = self._queue
+        if queue is None:
+            with self._queue_lock:
+                queue = self._queue
+                if queue is None:
+                    queue = DeliveryQueue(
+                        self._deliver,
+                        max_size=self.queue_size,
+                        workers=self.workers,
+                        drop_policy=self.drop_policy,
+                        block_timeout=Config.get_block_timeout(),
+                        flush_timeout=Config.get_flush_timeout(),
+                        batcher=self._batcher,
+                        name=f"slack-logger-{self.service_name}",
+                        metrics=self.metrics
+                    )
+                    self._queue = queue
+        return queue
+    
+    def _clients_for(self, envelope: Envelope) -> Tuple[SlackWebhookClient, ...]:
+        """Clients of the envelope's destinations."""
+        if not envelope.destinations:
+            return (self.client,)
+        return tuple(self._clients[url] for url in envelope.destinations)
+    
+    def _client_for(self, url: Optional[str]) -> SlackWebhookClient:
+        """
+        Client of one destination, None being the logger's own webhook.
+        
+        Spooled messages may be routed to webhooks the current routes no
+        longer list; their clients are created on first use.
+        """
+        if url is None:
+            return self.client
+        client = self._clients.get(url)
+        if client is None:
+            with self._queue_lock:
+                client = self._clients.get(url)
+                if client is None:
+                    client = SlackWebhookClient(url, **self._client_settings)
+                    self._clients[url] = client
+        return client
+    
+    def _get_executor(self):
+        """Return the fan-out thread pool, starting it on first use."""
+        executor = self._executor
+        if executor is None:
+            with self._queue_lock:
+                executor = self._executor
+                if executor is None:
+                    # Imported here so loggers without routing never load it
+                    from concurrent.futures import ThreadPoolExecutor
+                    executor = ThreadPoolExecutor(
+                        max_workers=(len(self._clients) - 1) * max(self.workers, 4),
+                        thread_name_prefix=f"slack-logger-{self.service_name}-fanout"
+                    )
+                    self._executor = executor
+        return executor
+    
+    def _send_to(
+        self,
+        client: SlackWebhookClient,
+        payload: Dict[str, Any],
+        thread_key: Optional[Tuple[str, str]] = None
+    ) -> SendResult:
+        """Send a payload to one destination, threaded if it is the Web API client."""
+        if thread_key is not None and client is self.client and self._threaded:
+            result = client.deliver(payload, thread_key)
+        else:
+            result = client.deliver(payload)
+        if result is SendResult.SENT:
+            if self.metrics is not None:
+                self.metrics.inc("sent")
+        elif result is SendResult.FAILED or result is SendResult.REJECTED:
+            if self.metrics is not None:
+                self.metrics.drop("failed")
+        return result
+    
+    def _fan_out(
+        self,
+        clients: Sequence[SlackWebhookClient],
+        payload: Dict[str, Any],
+        thread_key: Optional[Tuple[str, str]] = None
+    ) -> List[SendResult]:
+        """Send to every destination concurrently; takes about as long as the slowest."""
+        executor = self._get_executor()
+        futures = [executor.submit(self._send_to, client, payload, thread_key) for client in clients[1:]]
+        outcomes = [self._send_to(clients[0], payload, thread_key)]
+        outcomes.extend(future.result() for future in futures)
+        return outcomes
+    
+    def _deliver(self, envelope: Envelope) -> bool:
+        """Send an envelope's payload to its destinations and acknowledge its spool records."""
+        clients = self._clients_for(envelope)
+        if len(clients) == 1:
+            outcomes = [self._send_to(clients[0], envelope.payload, envelope.thread_key)]
+        else:
+            outcomes = self._fan_out(clients, envelope.payload, envelope.thread_key)
+        if any(outcome.retryable for outcome in outcomes):
+            if len(outcomes) > 1:
+                envelope, outcomes = self._narrow(envelope, outcomes)
+            # Destinations that can't take it right now go to the fallback
+            for reason in (SendResult.CIRCUIT_OPEN, SendResult.RATE_LIMITED):
+                if reason in outcomes:
+                    return self._fall_back(envelope, reason.value)
+            return False
+        # Delivered, or rejected by Slack for good: either way it's done
+        if self.spool is not None:
+            for spool_id in envelope.spool_ids:
+                self.spool.ack(spool_id)
+            if self._deferred and time.monotonic() >= self._replay_due:
+                self._start_replay()
+        return all(outcome is SendResult.SENT for outcome in outcomes)
+    
+    def _narrow(self, envelope: Envelope, outcomes: List[SendResult]) -> Tuple[Envelope, List[SendResult]]:
+        """
+        Drop the destinations that are done with a fanned-out envelope.
+        
+        Its spool record is rewritten for the remaining destinations, so
+        neither the fallback nor a replay posts it twice to the others.
+        
+        Returns:
+            The narrowed envelope and the outcomes of its destinations
+        """
+        remaining = [(url, outcome) for url, outcome in zip(envelope.destinations, outcomes) if outcome.retryable]
+        destinations = tuple(url for url, _ in remaining)
+        spool_ids = envelope.spool_ids
+        if self.spool is not None and spool_ids:
+            spool_ids = (self.spool.reroute(spool_ids, envelope.payload, destinations),)
+        narrowed = Envelope(
+            envelope.payload,
+            spool_ids,
+            envelope.priority,
+            envelope.sample_rate,
+            destinations,
+            envelope.thread_key
+        )
+        return narrowed, [outcome for _, outcome in remaining]
+    
+    def _fall_back(self, envelope: Envelope, reason: str = "circuit_open") -> bool:
+        """
+        Hand an envelope to the fallback while the circuit is open or Slack is rate limiting.
+        
+        Args:
+            envelope: The undeliverable envelope
+            reason: Drop reason counted if the fallback doesn't keep it
+        
+        Returns:
+            True if the message was kept for later delivery (spool fallback)
+        """
+        fallback = self.fallback
+        if fallback == "spool":
+            self.spool.defer(envelope.spool_ids, envelope.payload, envelope.destinations)
+            self._deferred = True
+            return True
+        if self.metrics is not None:
+            self.metrics.drop(reason)
+        if fallback == "stderr":
+            sys.stderr.write(f"[slack-logger] {envelope.payload.get('text', '')}\n")
+        elif fallback != "drop":
+            try:
+                fallback(envelope.payload)
+            except Exception as e:
+                logger.error(f"Slack logger fallback failed: {e}", exc_info=True)
+        return False
+    
+    def _submit(
+        self,
+        payload: Dict[str, Any],
+        async_send: bool,
+        priority: int = 0,
+        sample_rate: float = 1.0,
+        destinations: Tuple[str, ...] = (),
+        thread_key: Optional[Tuple[str, str]] = None
+    ) -> bool:
+        """Spool a formatted payload, then send it or queue it."""
+        spool_ids = (self.spool.append(payload, destinations),) if self.spool is not None else ()
+        envelope = Envelope(payload, spool_ids, priority, sample_rate, destinations, thread_key)
+        # While Slack is failing, skip the queue and the network entirely
+        if all(
+            client.breaker is not None and client.breaker.rejecting
+            for client in self._clients_for(envelope)
+        ):
+            return self._fall_back(envelope)
+        if async_send or self._batcher is not None:
+            return self._get_queue().put(envelope)
+        return self._deliver(envelope)
+    
+    def _start_replay(self) -> None:
+        """Replay deferred messages in the background, unless already replaying."""
+        if self._replay_lock.locked():
+            return
+        threading.Thread(
+            target=self._replay_spool,
+            name=f"slack-logger-{self.service_name}-replay",
+            daemon=True
+        ).start()
+    
+    def _replay_spool(self) -> None:
+        """Re-deliver messages a previous run left in the spool, or deferred ones."""
+        if not self._replay_lock.acquire(blocking=False):
+            return
+        try:
+            self._deferred = False
+            delivered = self.spool.replay(
+                lambda payload, url: self._client_for(url).deliver(payload),
+                rate=Config.get_rate_limit()
+            )
+            if len(self.spool.pending()):
+                # Stopped at a failure; try again on a success after a backoff
+                self._replay_due = time.monotonic() + self.client.retry_policy.backoff(self._replay_failures)
+                self._replay_failures += 1
+                self._deferred = True
+            else:
+                self._replay_failures = 0
+            logger.info(f"Replayed {delivered} spooled Slack messages")
+        except Exception as e:
+            logger.error(f"Failed to replay spooled Slack messages: {e}", exc_info=True)
+        finally:
+            self._replay_lock.release()
+    
+    def _report_suppressed(self, event: SuppressedEvent) -> None:
+        """Queue the follow-up message for a closed suppression window."""
+        payload = self._templates[event.level].render(
+            f"{event.suppressed} more occurrences of: {event.message}",
+            additional_context={
+                "fingerprint": event.key.split(":", 1)[-1],
+                "window_seconds": self._suppressor.window
+            },
+            scrubber=self.scrubber
+        )
+        destinations = self.router.resolve(event.level, self.service_name) if self.router is not None else ()
+        for part in fit_payload(payload):
+            self._submit(part, async_send=True, priority=LEVEL_PRIORITY[event.level], destinations=destinations)
+    
+    def _report_digest(self, digest: Digest) -> None:
+        """Queue the summary post(s) for a closed digest window."""
+        # Each group is routed by its level and sample context; groups
+        # sharing destinations are summarized together
+        partitions: Dict[Tuple[str, ...], List] = {}
+        for entry in digest.entries:
+            destinations = ()
+            if self.router is not None:
+                destinations = self.router.resolve(entry.level, self.service_name, entry.context)
+            partitions.setdefault(destinations, []).append(entry)
+        if not partitions:
+            partitions[()] = []
+        
+        for index, (destinations, entries) in enumerate(partitions.items()):
+            part_digest = Digest(
+                entries,
+                sum(entry.count for entry in entries) + (digest.overflow if index == 0 else 0),
+                digest.overflow if index == 0 else 0,
+                digest.window_start,
+                digest.window_end
+            )
+            level = part_digest.level
+            payload = render_digest(self._templates[level], part_digest, scrubber=self.scrubber)
+            for part in fit_payload(payload):
+                self._submit(part, async_send=True, priority=LEVEL_PRIORITY[level], destinations=destinations)
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Return keep-alive connection counters for this logger's webhook host.
+        
+        Returns:
+            Dictionary with requests sent, connections opened and reused
+        """
+        return self.client.transport.stats()
+    
+    def rate_limit_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the state of this webhook's rate limiter.
+        
+        Returns:
+            Dictionary with tokens, remaining 429 pause and counters, or None
+            if rate limiting is disabled
+        """
+        if self.client.rate_limiter is None:
+            return None
+        return self.client.rate_limiter.state()
+    
+    def sampling_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the state of adaptive sampling.
+        
+        Returns:
+            Dictionary with the current sample rate, smoothed message rate
+            and messages sampled out, or None if sampling is disabled
+        """
+        if self._sampler is None:
+            return None
+        return self._sampler.state()
+    
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Return delivery metrics.
+        
+        Returns:
+            Dictionary with the enqueued, sent, retried, suppressed and
+            digested counters, dropped messages by reason, queue depth, in-flight
+            requests and per-stage timings (format, serialize, http), or
+            None if metrics are disabled
+        """
+        if self.metrics is None:
+            return None
+        return self.metrics.snapshot()
+    
+    def circuit_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the state of this webhook's circuit breaker.
+        
+        Returns:
+            Dictionary with the state ("closed", "open" or "half_open"),
+            failure counters, seconds until the next probe and rejection
+            counts, or None if the breaker is disabled
+        """
+        if self.client.breaker is None:
+            return None
+        return self.client.breaker.snapshot()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for messages queued with async_send=True to be delivered.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if the queue drained within the timeout
+        """
+        queue = self._queue
+        if queue is None:
+            return True
+        return queue.flush(timeout)
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Deliver pending messages and stop the background workers.
+        
+        Called automatically at interpreter exit with SLACK_LOGGER_FLUSH_TIMEOUT
+        as the time budget.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if all pending messages were handled
+        """
+        _live_loggers.discard(self)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        if self._digest is not None:
+            self._digest.flush()
+        if self._suppressor is not None:
+            self._suppressor.flush()
+        with self._queue_lock:
+            queue, self._queue = self._queue, None
+        drained = queue.close(timeout) if queue is not None else True
+        if self._threaded:
+            # Bring parents' occurrence counters up to date
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            drained = self.client.flush_updates(remaining) and drained
+        with self._queue_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self.spool is not None:
+            self.spool.close()
+        return drained
     
     def _log(
         self,
@@ -56,35 +700,121 @@ class SlackLogger:
         level: LogLevel,
         exception: Optional[Exception] = None,
         additional_context: Optional[Dict[str, Any]] = None,
-        async_send: bool = False
+        async_send: bool = False,
+        template: Optional[str] = None
     ) -> bool:
         """
         Internal method to log a message.
         
         Args:
-            message: The message to log
+            message: The message to log. Any object is accepted; it is
+                    converted with str() only once the message is known
+                    not to be a suppressed duplicate.
             level: Log level
             exception: Optional exception object
             additional_context: Optional dictionary with additional context
-            async_send: If True, send asynchronously (fire and forget)
+            async_send: If True, queue for background delivery (fire and forget)
+            template: Unformatted message (e.g. a LogRecord's msg) used for
+                     fingerprinting instead of the message itself
             
         Returns:
-            True if sent successfully, False otherwise
+            True if sent successfully (or queued, when async_send is True,
+            or suppressed as a duplicate, or added to the digest), False otherwise
         """
         try:
-            payload = SlackMessageFormatter.format_message(
-                message=message,
-                level=level,
-                service_name=self.service_name,
+            digest = self._digest
+            if digest is not None and level is LogLevel.CRITICAL and self.digest_bypass_critical:
+                digest = None
+            event_fingerprint = None
+            if self._suppressor is not None or self.relay is not None or digest is not None or self._threaded:
+                if template is None:
+                    template = message = str(message)
+                if exception is not None and digest is None:
+                    # One traceback walk serves the fingerprint and the render,
+                    # and nothing past this point holds the exception's frames
+                    exception = SlackMessageFormatter.TRACEBACK_RENDERER.capture(exception, fingerprint=True)
+                event_fingerprint = fingerprint(template, exception)
+            if digest is not None:
+                # Only a group's first event keeps a snapshot of the exception
+                digest.add((level, event_fingerprint), level, template, exception, additional_context)
+                if self.metrics is not None:
+                    self.metrics.inc("digested")
+                return True
+            if self._suppressor is not None:
+                key = f"{level.value}:{event_fingerprint}"
+                if not self._suppressor.should_send(key, template, level):
+                    if self.metrics is not None:
+                        self.metrics.inc("suppressed")
+                    return True
+            
+            # Under load, INFO and WARNING are sampled; CRITICAL and ERROR never are
+            priority = LEVEL_PRIORITY[level]
+            sample_rate = 1.0
+            if self._sampler is not None:
+                queue = self._queue
+                sample_rate = self._sampler.sample(priority, len(queue) if queue is not None else 0)
+                if sample_rate is None:
+                    if self.metrics is not None:
+                        self.metrics.drop("sampled")
+                    return True
+            
+            metrics = self.metrics
+            if metrics is not None:
+                started = time.perf_counter()
+            message = str(message)
+            payload = self._templates[level].render(
+                message,
                 exception=exception,
-                additional_context=additional_context
+                additional_context=additional_context,
+                scrubber=self.scrubber
             )
+            if sample_rate < 1.0:
+                payload["blocks"].append(_sample_rate_block(sample_rate))
+            # Oversized payloads continue in follow-up messages
+            parts = fit_payload(payload)
+            if metrics is not None:
+                metrics.observe("format", time.perf_counter() - started)
             
-            if async_send:
-                self.client.send_async(payload)
-                return True
-            else:
-                return self.client.send(payload)
+            destinations = ()
+            if self.router is not None:
+                destinations = self.router.resolve(level, self.service_name, additional_context)
+            
+            thread_key = None
+            if self._threaded:
+                from .webapi import variant_key
+                thread_key = (event_fingerprint, variant_key(exception.message if exception is not None else message))
+            
+            sent = True
+            for index, part in enumerate(parts):
+                part_destinations = destinations
+                if self.relay is not None:
+                    if index == 0:
+                        relay_message = self.scrubber.scrub_text(message) if self.scrubber is not None else message
+                    # Only the first part is subject to the relay's duplicate check
+                    # The relay only posts to webhooks, never to the Web API
+                    remaining = tuple(
+                        url for url in destinations or (self.webhook_url,)
+                        if (self._threaded and url == self.webhook_url) or not self.relay.send(
+                            url,
+                            part,
+                            fingerprint=event_fingerprint if index == 0 else None,
+                            level=level,
+                            message=relay_message,
+                            service_name=self.service_name
+                        )
+                    )
+                    if not remaining:
+                        continue
+                    part_destinations = remaining if destinations else ()
+                sent = self._submit(
+                    part,
+                    async_send,
+                    priority,
+                    sample_rate,
+                    part_destinations,
+                    thread_key if index == 0 else None
+                ) and sent
+            return sent
         except Exception as e:
             # Prevent logging errors from breaking the application
             logger.error(f"Failed to send log to Slack: {e}", exc_info=True)
@@ -223,6 +953,38 @@ class SlackLogger:
         )
 
 
+def close_all_loggers(timeout: Optional[float] = None) -> bool:
+    """
+    Close every open SlackLogger within one shared time budget.
+
+    Closing flushes open digest and duplicate-suppression windows, delivers
+    queued messages, brings Web API counters up to date and closes spools.
 
+    Args:
+        timeout: Seconds for all loggers together. Defaults to
+                SLACK_LOGGER_FLUSH_TIMEOUT.
+
+    Returns:
+        True if every logger delivered its pending messages in time
+    """
+    loggers = list(_live_loggers)
+    if not loggers:
+        return True
+    if timeout is None:
+        timeout = Config.get_flush_timeout()
+    deadline = time.monotonic() + timeout
+    closed = True
+    for slack_logger in loggers:
+        try:
+            closed = slack_logger.close(max(0.0, deadline - time.monotonic())) and closed
+        except Exception:
+            closed = False
+    return closed
 
 
+# Registered after delivery's _flush_all_queues, so it runs first: closing a
+# logger can still queue digest and "N more occurrences" messages
+@atexit.register
+def _close_all_loggers() -> None:
+    """Give open loggers a bounded chance to flush at interpreter exit."""
+    close_all_loggers()
@@ -0,0 +1,240 @@
+"""
+Delivery counters, stage latency histograms and gauges.
+"""
+
+import bisect
+import logging
+import threading
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Timed stages: rendering a payload, encoding it, and one HTTP attempt
+STAGES = ("format", "serialize", "http")
+
+COUNTERS = ("enqueued", "sent", "retried", "suppressed", "digested")
+
+# Why a message never reached Slack
+DROP_REASONS = ("queue_full", "queue_closed", "sampled", "circuit_open", "rate_limited", "failed")
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration. Caller holds the owning Metrics' lock."""
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket holding it.
+
+        Returns:
+            Seconds, 0.0 without observations, or inf if the quantile
+            falls past the largest bucket
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return BUCKETS[index] if index < len(BUCKETS) else float("inf")
+        return float("inf")
+
+
+class Metrics:
+    """
+    Counters, stage histograms and gauges for one logger.
+
+    Components hold an ``Optional[Metrics]`` and skip all bookkeeping,
+    including clock reads, when it is None, so disabled metrics cost one
+    attribute check per message. Timing hooks registered with ``add_hook``
+    are called as ``hook(stage, seconds)`` after every observation.
+    """
+
+    def __init__(self, service_name: str = ""):
+        """
+        Initialize empty metrics.
+
+        Args:
+            service_name: Value of the ``service`` label in Prometheus output
+        """
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._dropped = dict.fromkeys(DROP_REASONS, 0)
+        self._histograms = {stage: Histogram() for stage in STAGES}
+        self._in_flight = 0
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._hooks: List[Callable[[str, float], None]] = []
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        """Increment one of COUNTERS."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def drop(self, reason: str, amount: int = 1) -> None:
+        """Count messages dropped for one of DROP_REASONS."""
+        with self._lock:
+            self._dropped[reason] += amount
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record the duration of one of STAGES and call the timing hooks."""
+        with self._lock:
+            self._histograms[stage].observe(seconds)
+        for hook in self._hooks:
+            try:
+                hook(stage, seconds)
+            except Exception as e:
+                logger.error(f"Slack logger timing hook failed: {e}", exc_info=True)
+
+    def request_started(self) -> None:
+        """Count an HTTP request as in flight."""
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self) -> None:
+        """Count an HTTP request as no longer in flight."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def gauge(self, name: str, read: Callable[[], float]) -> None:
+        """
+        Register a gauge read when a snapshot is taken.
+
+        Args:
+            name: Gauge name, e.g. "queue_depth"
+            read: Callable returning the current value
+        """
+        self._gauges[name] = read
+
+    def add_hook(self, hook: Callable[[str, float], None]) -> None:
+        """
+        Call ``hook(stage, seconds)`` for every timed stage.
+
+        Hooks run on the thread doing the work, so they should be cheap.
+
+        Args:
+            hook: Callable taking the stage name and its duration in seconds
+        """
+        self._hooks = self._hooks + [hook]
+
+    def remove_hook(self, hook: Callable[[str, float], None]) -> None:
+        """Stop calling a hook registered with ``add_hook``."""
+        self._hooks = [h for h in self._hooks if h is not hook]
+
+    def _gauge_values(self) -> Dict[str, float]:
+        values = {"in_flight": self._in_flight}
+        for name, read in self._gauges.items():
+            try:
+                values[name] = read()
+            except Exception:
+                values[name] = 0
+        return values
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current metrics.
+
+        Returns:
+            Dictionary with the counters, ``dropped`` by reason, gauges, and
+            per-stage ``count``, ``sum``, ``mean``, ``p50`` and ``p99`` in
+            seconds (quantiles are bucket upper bounds)
+        """
+        with self._lock:
+            result: Dict[str, Any] = dict(self._counters)
+            result["dropped"] = dict(self._dropped)
+            stages = {}
+            for stage, histogram in self._histograms.items():
+                stages[stage] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                    "p50": histogram.quantile(0.5),
+                    "p99": histogram.quantile(0.99),
+                }
+            result["stages"] = stages
+        result.update(self._gauge_values())
+        return result
+
+    def _prometheus_lines(self, prefix: str) -> Dict[str, List[str]]:
+        """Sample lines per metric family."""
+        service = self.service_name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        label = f'service="{service}"'
+        families: Dict[str, List[str]] = {}
+        with self._lock:
+            for name, value in self._counters.items():
+                families[f"{prefix}_{name}_total"] = [f"{prefix}_{name}_total{{{label}}} {value}"]
+            families[f"{prefix}_dropped_total"] = [
+                f'{prefix}_dropped_total{{{label},reason="{reason}"}} {value}'
+                for reason, value in self._dropped.items()
+            ]
+            lines = []
+            name = f"{prefix}_stage_duration_seconds"
+            for stage, histogram in self._histograms.items():
+                cumulative = 0
+                for bound, count in zip(BUCKETS, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{label},stage="{stage}",le="{bound:g}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{label},stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{{label},stage="{stage}"}} {histogram.sum!r}')
+                lines.append(f'{name}_count{{{label},stage="{stage}"}} {histogram.count}')
+            families[name] = lines
+        for gauge, value in self._gauge_values().items():
+            families[f"{prefix}_{gauge}"] = [f"{prefix}_{gauge}{{{label}}} {value}"]
+        return families
+
+
+_HELP = {
+    "enqueued_total": ("counter", "Messages accepted by the background delivery queue."),
+    "sent_total": ("counter", "Webhook posts delivered (a merged batch counts once)."),
+    "retried_total": ("counter", "HTTP attempts after the first one for a message."),
+    "suppressed_total": ("counter", "Messages suppressed as duplicates."),
+    "digested_total": ("counter", "Messages counted into a digest instead of being sent."),
+    "dropped_total": ("counter", "Messages that never reached Slack, by reason."),
+    "stage_duration_seconds": ("histogram", "Time spent per stage: format, serialize, http."),
+    "in_flight": ("gauge", "HTTP requests currently in flight."),
+    "queue_depth": ("gauge", "Messages waiting in the background delivery queue."),
+}
+
+
+def render_prometheus(*registries: Metrics, prefix: str = "slack_logger") -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    Args:
+        *registries: Metrics of one or more loggers (``SlackLogger.metrics``)
+        prefix: Prefix of every metric name
+
+    Returns:
+        Exposition text, ready to serve on a /metrics endpoint
+    """
+    families: Dict[str, List[str]] = {}
+    for registry in registries:
+        for name, lines in registry._prometheus_lines(prefix).items():
+            families.setdefault(name, []).extend(lines)
+
+    output = []
+    for name, lines in families.items():
+        kind, text = _HELP.get(name[len(prefix) + 1:], ("gauge", name))
+        output.append(f"# HELP {name} {text}")
+        output.append(f"# TYPE {name} {kind}")
+        output.extend(lines)
+    return "\n".join(output) + "\n"
@@ -0,0 +1,168 @@
+"""
+Client-side rate limiting for Slack webhooks.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+
+def parse_retry_after(headers: Mapping[str, str], default: float = 1.0) -> float:
+    """
+    Return the Retry-After delay of a 429 response in seconds.
+
+    Args:
+        headers: Response headers
+        default: Delay used when the header is missing or not a number
+
+    Returns:
+        Delay in seconds
+    """
+    try:
+        return max(0.0, float(headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """
+    Token bucket that paces sends to one webhook.
+
+    ``reserve`` never sleeps: it books a slot and returns how long the
+    caller has to wait for it, so blocking (``time.sleep``) and asyncio
+    (``asyncio.sleep``) callers share the same bucket. A 429 from Slack
+    ``pause``s the bucket, which pushes back every sender of that webhook
+    instead of only the one that received it.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: float = 10):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second (sustained messages per second)
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.rejected = 0
+        self.throttled = 0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last update. Caller holds the lock."""
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve one token.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds, or None for no limit
+
+        Returns:
+            Seconds the caller must wait before sending, or None if the wait
+            would exceed ``max_wait`` (no token is consumed in that case)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 1:
+                wait += (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                return None
+            self._tokens -= 1
+            self.acquired += 1
+            return wait
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout: Longest acceptable wait in seconds, or None for no limit
+
+        Returns:
+            True if a token was acquired, False if it would take too long
+        """
+        wait = self.reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for ``seconds`` (e.g. after HTTP 429).
+
+        Args:
+            seconds: Pause duration, usually the Retry-After value
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            resume = now + max(0.0, seconds)
+            if resume > self._updated:
+                self._updated = resume
+            self._tokens = min(self._tokens, 0.0)
+            self.throttled += 1
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the bucket for monitoring.
+
+        Returns:
+            Dictionary with rate, capacity, available tokens, remaining pause
+            and acquired/rejected/throttled counters
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "tokens": round(self._tokens, 3),
+                "paused_for": round(max(0.0, self._updated - now), 3),
+                "acquired": self.acquired,
+                "rejected": self.rejected,
+                "throttled": self.throttled,
+            }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(webhook_url: str, rate: float = 1.0, capacity: float = 10) -> TokenBucket:
+    """
+    Return the shared token bucket for ``webhook_url``.
+
+    Every client posting to the same webhook shares one bucket. Rate and
+    capacity are fixed by the first caller for that webhook.
+
+    Args:
+        webhook_url: Slack incoming webhook URL
+        rate: Messages per second, used if the bucket has to be created
+        capacity: Burst size, used if the bucket has to be created
+
+    Returns:
+        Shared TokenBucket instance
+    """
+    bucket = _buckets.get(webhook_url)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(webhook_url)
+            if bucket is None:
+                bucket = TokenBucket(rate, capacity)
+                _buckets[webhook_url] = bucket
+    return bucket
+
@@ -0,0 +1,411 @@
+"""
+Host-local relay: one process that delivers Slack messages for many workers.
+
+Worker processes (gunicorn, Celery, ...) hand already-formatted payloads to
+the relay with a single non-blocking write on a Unix domain socket. The
+relay owns the connections, rate limits, duplicate suppression, batching and
+retries for the whole host.
+
+Run it with the ``slack-logger-relay`` command and point the workers at it
+with ``SlackLogger(relay_socket=...)`` or SLACK_LOGGER_RELAY_SOCKET.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from .batching import PayloadBatcher
+from .client import SlackWebhookClient
+from .config import Config
+from .dedupe import DuplicateSuppressor, SuppressedEvent
+from .envelope import Envelope
+from .formatter import SlackMessageFormatter, LogLevel
+from .limits import fit_payload
+
+logger = logging.getLogger(__name__)
+
+# Frames are a 4-byte big-endian length followed by a JSON document
+_FRAME_HEADER = struct.Struct("!I")
+_MAX_FRAME = 4 * 1024 * 1024
+
+
+class RelayTransport:
+    """
+    Worker-side handoff to a relay over a Unix stream socket.
+
+    Each message is one length-prefixed frame written with a single
+    non-blocking ``send``. When the relay is not running or the socket
+    buffer is full, ``send`` returns False immediately so the caller can
+    deliver the message itself. A frame the kernel only partly accepted is
+    completed before the next one is written.
+    """
+
+    # Don't try to reconnect to a missing relay more often than this
+    RECONNECT_INTERVAL = 1.0
+
+    def __init__(self, socket_path: str):
+        """
+        Initialize the transport.
+
+        Args:
+            socket_path: Path of the relay's Unix domain socket
+        """
+        self.socket_path = socket_path
+        self._socket = None
+        self._pid = None
+        self._backlog = b""
+        self._next_connect = 0.0
+        self._lock = threading.Lock()
+
+    def _get_socket(self) -> Optional[socket.socket]:
+        """Return a connected socket, or None if the relay is unreachable."""
+        # Pre-forked workers must not share the parent's connection
+        pid = os.getpid()
+        if self._socket is not None and self._pid == pid:
+            return self._socket
+        self._socket, self._backlog = None, b""
+        now = time.monotonic()
+        if now < self._next_connect:
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            self._next_connect = now + self.RECONNECT_INTERVAL
+            return None
+        sock.setblocking(False)
+        self._socket, self._pid = sock, pid
+        return sock
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+        self._socket, self._backlog = None, b""
+        self._next_connect = time.monotonic() + self.RECONNECT_INTERVAL
+
+    def send(
+        self,
+        webhook_url: str,
+        payload: Dict[str, Any],
+        fingerprint: Optional[str] = None,
+        level: Optional[LogLevel] = None,
+        message: Optional[str] = None,
+        service_name: Optional[str] = None
+    ) -> bool:
+        """
+        Hand a formatted payload to the relay.
+
+        Args:
+            webhook_url: Destination webhook
+            payload: Slack message payload
+            fingerprint: Event fingerprint used for duplicate suppression
+            level: Log level, used in duplicate summaries
+            message: Original message, used in duplicate summaries
+            service_name: Service name, used in duplicate summaries
+
+        Returns:
+            True if the relay accepted the message, False otherwise
+        """
+        data = json.dumps({
+            "webhook_url": webhook_url,
+            "payload": payload,
+            "fingerprint": fingerprint,
+            "level": level.value if level is not None else None,
+            "message": message,
+            "service": service_name,
+        }, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        frame = _FRAME_HEADER.pack(len(data)) + data
+
+        with self._lock:
+            sock = self._get_socket()
+            if sock is None:
+                return False
+            try:
+                if self._backlog:
+                    sent = sock.send(self._backlog)
+                    self._backlog = self._backlog[sent:]
+                    if self._backlog:
+                        return False
+                sent = sock.send(frame)
+            except BlockingIOError:
+                return False
+            except OSError as e:
+                logger.debug(f"Slack relay at {self.socket_path} unavailable: {e}")
+                self._disconnect()
+                return False
+            self._backlog = frame[sent:]
+            return True
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._disconnect()
+
+
+class _Channel:
+    """
+    Queue and delivery task for one webhook.
+
+    Posts go through the pooled synchronous client on a thread of the
+    channel's own, one at a time, so the relay needs no async HTTP library
+    and a slow webhook never holds up the event loop or other webhooks.
+    """
+
+    def __init__(self, relay: "RelayServer", webhook_url: str):
+        self.relay = relay
+        self.client = SlackWebhookClient(webhook_url)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack-relay")
+        self.queue: asyncio.Queue = asyncio.Queue(relay.queue_size)
+        self.task = asyncio.ensure_future(self._run())
+
+    async def _next_batch(self) -> List[Envelope]:
+        batch = [await self.queue.get()]
+        batcher = self.relay.batcher
+        if batcher is None:
+            return batch
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + batcher.linger
+        while len(batch) < batcher.max_batch:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        stats = self.relay.stats
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = await self._next_batch()
+            try:
+                merged = self.relay.batcher.merge(batch) if len(batch) > 1 else batch
+                for envelope in merged:
+                    if await loop.run_in_executor(self.executor, self.client.send, envelope.payload):
+                        stats["sent"] += 1
+                    else:
+                        stats["failed"] += 1
+            except Exception as e:
+                logger.error(f"Slack relay failed to deliver message: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+
+class RelayServer:
+    """
+    Asyncio server that receives payloads from workers and delivers them.
+
+    Every webhook gets its own bounded queue and delivery task; the client
+    shares the process-wide connection pool and rate limiter for that
+    webhook, so the whole host stays within Slack's per-channel budget.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        default_webhook_url: Optional[str] = None,
+        queue_size: int = 10000,
+        batch_size: int = 20,
+        batch_linger: float = 0.2,
+        dedupe_window: float = 60.0
+    ):
+        """
+        Initialize the relay.
+
+        Args:
+            socket_path: Path of the Unix domain socket to listen on
+            default_webhook_url: Webhook for messages that don't name one
+            queue_size: Maximum queued payloads per webhook
+            batch_size: Maximum payloads merged into one post (1 disables)
+            batch_linger: Seconds a batch waits for more payloads
+            dedupe_window: Duplicate suppression window in seconds (0 disables)
+        """
+        self.socket_path = socket_path
+        self.default_webhook_url = default_webhook_url
+        self.queue_size = queue_size
+        self.batcher = PayloadBatcher(max_batch=batch_size, linger=batch_linger) if batch_size > 1 else None
+        self.suppressor = None
+        if dedupe_window > 0:
+            self.suppressor = DuplicateSuppressor(dedupe_window, self._report_suppressed)
+        self.stats = {"received": 0, "suppressed": 0, "dropped": 0, "sent": 0, "failed": 0}
+        self._channels: Dict[str, _Channel] = {}
+        self._server = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self) -> None:
+        """Bind the socket and start accepting workers."""
+        self._loop = asyncio.get_event_loop()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+        logger.info(f"Slack relay listening on {self.socket_path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read frames from one worker until it disconnects."""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                header = await reader.readexactly(_FRAME_HEADER.size)
+                (length,) = _FRAME_HEADER.unpack(header)
+                if length > _MAX_FRAME:
+                    logger.warning(f"Slack relay received an oversized frame ({length} bytes), closing connection")
+                    break
+                data = await reader.readexactly(length)
+                try:
+                    self.handle(data)
+                except Exception as e:
+                    logger.error(f"Slack relay failed to handle message: {e}", exc_info=True)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop receiving, deliver what is queued within ``timeout`` and close.
+
+        Args:
+            timeout: Seconds to spend draining queues
+        """
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections.values()):
+                writer.close()
+            if self._connections:
+                await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self.suppressor is not None:
+            self.suppressor.flush()
+            # Let the summaries scheduled by flush() reach the queues
+            await asyncio.sleep(0)
+        channels = list(self._channels.values())
+        if channels:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(channel.queue.join() for channel in channels)),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Slack relay stopped with undelivered messages")
+        for channel in channels:
+            channel.task.cancel()
+            # A post still in flight finishes on its thread
+            channel.executor.shutdown(wait=False)
+        if channels:
+            await asyncio.gather(*(channel.task for channel in channels), return_exceptions=True)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def handle(self, data: bytes) -> None:
+        """Process one message from a worker."""
+        self.stats["received"] += 1
+        try:
+            message = json.loads(data)
+            payload = message["payload"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Slack relay received a malformed message")
+            self.stats["dropped"] += 1
+            return
+
+        webhook_url = message.get("webhook_url") or self.default_webhook_url
+        if not webhook_url:
+            self.stats["dropped"] += 1
+            return
+
+        fingerprint = message.get("fingerprint")
+        if self.suppressor is not None and fingerprint:
+            level = message.get("level") or LogLevel.ERROR.value
+            key = (webhook_url, message.get("service"), level, fingerprint)
+            if not self.suppressor.should_send(key, message.get("message") or "", LogLevel(level)):
+                self.stats["suppressed"] += 1
+                return
+
+        self._enqueue(webhook_url, payload)
+
+    def _enqueue(self, webhook_url: str, payload: Dict[str, Any]) -> None:
+        channel = self._channels.get(webhook_url)
+        if channel is None:
+            channel = self._channels[webhook_url] = _Channel(self, webhook_url)
+        for part in fit_payload(payload):
+            try:
+                channel.queue.put_nowait(Envelope(part))
+            except asyncio.QueueFull:
+                self.stats["dropped"] += 1
+
+    def _report_suppressed(self, event: SuppressedEvent) -> None:
+        """Queue a duplicate summary (called from the suppressor's thread)."""
+        webhook_url, service_name, _, fingerprint = event.key
+        payload = SlackMessageFormatter.format_message(
+            message=f"{event.suppressed} more occurrences of: {event.message}",
+            level=event.level,
+            service_name=service_name or Config.get_service_name(),
+            additional_context={
+                "fingerprint": fingerprint,
+                "window_seconds": self.suppressor.window
+            }
+        )
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._enqueue, webhook_url, payload)
+
+
+async def _serve(relay: RelayServer, shutdown_timeout: float) -> None:
+    await relay.start()
+    stop = asyncio.Event()
+    loop = asyncio.get_event_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    await relay.stop(shutdown_timeout)
+    logger.info(f"Slack relay stopped: {relay.stats}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``slack-logger-relay`` command."""
+    parser = argparse.ArgumentParser(prog="slack-logger-relay", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--socket", default=Config.get_relay_socket(), help="Unix socket path (default: SLACK_LOGGER_RELAY_SOCKET)")
+    parser.add_argument("--webhook-url", default=Config.get_webhook_url(), help="default webhook (default: SLACK_WEBHOOK_URL)")
+    parser.add_argument("--queue-size", type=int, default=10000, help="max queued messages per webhook")
+    parser.add_argument("--batch-size", type=int, default=20, help="max messages merged per post, 1 disables")
+    parser.add_argument("--batch-linger", type=float, default=0.2, help="seconds a batch waits for more messages")
+    parser.add_argument("--dedupe-window", type=float, default=60.0, help="duplicate suppression window, 0 disables")
+    parser.add_argument("--shutdown-timeout", type=float, default=5.0, help="seconds to drain queues on shutdown")
+    args = parser.parse_args(argv)
+
+    if not args.socket:
+        parser.error("--socket or SLACK_LOGGER_RELAY_SOCKET is required")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    relay = RelayServer(
+        args.socket,
+        default_webhook_url=args.webhook_url,
+        queue_size=args.queue_size,
+        batch_size=args.batch_size,
+        batch_linger=args.batch_linger,
+        dedupe_window=args.dedupe_window
+    )
+    asyncio.run(_serve(relay, args.shutdown_timeout))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Retry policy with exponential backoff, full jitter and an overall deadline.
+"""
+
+import random
+import time
+
+
+class Deadline:
+    """Point in time after which a message is no longer worth sending."""
+
+    __slots__ = ("expires",)
+
+    def __init__(self, seconds: float):
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+
+class RetryPolicy:
+    """
+    How often and how long to retry a webhook post.
+
+    The delay before retry ``n`` (0-based) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** n)]`` ("full jitter"), so clients
+    that failed together don't retry together. All attempts of one message
+    share a single ``deadline``: each attempt's timeout is capped by the
+    budget left, and a retry whose delay would not leave any budget is not
+    attempted at all.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        deadline: float = 30.0
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Maximum number of attempts per message
+            base_delay: Backoff before the first retry, in seconds
+            max_delay: Cap for a single backoff, in seconds
+            deadline: Overall time budget per message, in seconds
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(0.0, float(max_delay))
+        self.deadline = max(0.0, float(deadline))
+
+    def start(self) -> Deadline:
+        """Start the clock for one message."""
+        return Deadline(self.deadline)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the delay before the retry following ``attempt``.
+
+        Args:
+            attempt: 0-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** min(attempt, 32)))
+        return random.uniform(0, ceiling)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, deadline={self.deadline})"
+        )
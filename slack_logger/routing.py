@@ -0,0 +1,212 @@
+"""
+Routing of messages to one or more webhooks by level, service and context.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from .formatter import LogLevel
+
+_LEVEL_ORDER = {level: index for index, level in enumerate(LogLevel)}
+
+
+def _parse_level(level: Union[str, LogLevel]) -> LogLevel:
+    """Convert a level name (e.g. "error") to a LogLevel."""
+    if isinstance(level, LogLevel):
+        return level
+    try:
+        return LogLevel(str(level).strip().lower())
+    except ValueError:
+        choices = ", ".join(level.value for level in LogLevel)
+        raise ValueError(f"Unknown log level {level!r}, expected one of: {choices}")
+
+
+class _Any:
+    """Context predicate matching any value, as long as the key is present."""
+
+    def __repr__(self) -> str:
+        return "Route.ANY"
+
+
+class Route:
+    """
+    One routing rule: where matching messages are delivered.
+
+    A message matches when every given condition holds; conditions left
+    as None match everything. ``context`` maps an additional_context key
+    to a value compared with ``==``, a callable taking the value and
+    returning a bool, or ``Route.ANY`` (the key only has to be present).
+    """
+
+    ANY = _Any()
+
+    def __init__(
+        self,
+        webhooks: Union[str, Sequence[str]],
+        levels: Optional[Iterable[Union[str, LogLevel]]] = None,
+        min_level: Optional[Union[str, LogLevel]] = None,
+        services: Optional[Iterable[str]] = None,
+        context: Optional[Mapping[str, Any]] = None
+    ):
+        """
+        Initialize the route.
+
+        Args:
+            webhooks: Webhook URL, or several, that matching messages go to
+            levels: Levels that match
+            min_level: Lowest level that matches
+            services: Service names that match
+            context: additional_context predicates, by key
+
+        Raises:
+            ValueError: If no webhook is given or a level is unknown.
+        """
+        self.webhooks: Tuple[str, ...] = (webhooks,) if isinstance(webhooks, str) else tuple(webhooks)
+        if not self.webhooks:
+            raise ValueError("A route needs at least one webhook URL")
+        self.levels = frozenset(_parse_level(level) for level in levels) if levels is not None else None
+        self.min_level = _parse_level(min_level) if min_level is not None else None
+        self.services = frozenset(services) if services is not None else None
+        self.context: Dict[str, Any] = dict(context or {})
+
+    def matches_static(self, level: LogLevel, service_name: str) -> bool:
+        """True if the level and service conditions hold."""
+        if self.levels is not None and level not in self.levels:
+            return False
+        if self.min_level is not None and _LEVEL_ORDER[level] < _LEVEL_ORDER[self.min_level]:
+            return False
+        return self.services is None or service_name in self.services
+
+    def matches_context(self, context: Optional[Mapping[str, Any]]) -> bool:
+        """True if every context predicate holds for ``context``."""
+        if not self.context:
+            return True
+        if not context:
+            return False
+        for key, expected in self.context.items():
+            if key not in context:
+                return False
+            if expected is Route.ANY:
+                continue
+            value = context[key]
+            if callable(expected):
+                try:
+                    if not expected(value):
+                        return False
+                except Exception:
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    @classmethod
+    def from_dict(cls, spec: Mapping[str, Any]) -> "Route":
+        """
+        Build a route from a JSON-style mapping.
+
+        Accepts the keys ``webhook`` or ``webhooks``, ``levels``,
+        ``min_level``, ``services`` and ``context``. A context value of
+        ``"*"`` matches any value.
+        """
+        webhooks = spec.get("webhooks", spec.get("webhook"))
+        if not webhooks:
+            raise ValueError(f"Route {dict(spec)!r} has no webhook")
+        context = {
+            key: cls.ANY if value == "*" else value
+            for key, value in (spec.get("context") or {}).items()
+        }
+        return cls(
+            webhooks,
+            levels=spec.get("levels"),
+            min_level=spec.get("min_level"),
+            services=spec.get("services"),
+            context=context or None
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Route(webhooks={list(self.webhooks)!r}, levels={self.levels!r}, "
+            f"min_level={self.min_level!r}, services={self.services!r}, context={self.context!r})"
+        )
+
+
+class RoutingTable:
+    """
+    Resolves the webhooks a message is delivered to.
+
+    Every matching route contributes its webhooks, in route order and
+    without duplicates. Level and service conditions are evaluated once per
+    (level, service) pair and cached, so a lookup only checks the context
+    predicates of routes that have them.
+    """
+
+    def __init__(self, routes: Sequence[Route]):
+        """
+        Initialize the table.
+
+        Args:
+            routes: Routes in priority order
+        """
+        self.routes: Tuple[Route, ...] = tuple(routes)
+        self._lock = threading.Lock()
+        # (level, service) -> routes whose level and service conditions hold
+        self._static: Dict[Tuple[LogLevel, str], Tuple[Route, ...]] = {}
+
+    @classmethod
+    def from_json(cls, text: str) -> "RoutingTable":
+        """
+        Build a table from a JSON list of route mappings (see Route.from_dict).
+
+        Raises:
+            ValueError: If the JSON is malformed or a route is invalid.
+        """
+        specs = json.loads(text)
+        if not isinstance(specs, list):
+            raise ValueError("Routes must be a JSON list")
+        return cls([Route.from_dict(spec) for spec in specs])
+
+    @property
+    def webhooks(self) -> List[str]:
+        """Every webhook any route can deliver to."""
+        seen: Dict[str, None] = {}
+        for route in self.routes:
+            for webhook in route.webhooks:
+                seen[webhook] = None
+        return list(seen)
+
+    def _candidates(self, level: LogLevel, service_name: str) -> Tuple[Route, ...]:
+        key = (level, service_name)
+        candidates = self._static.get(key)
+        if candidates is None:
+            candidates = tuple(route for route in self.routes if route.matches_static(level, service_name))
+            with self._lock:
+                self._static[key] = candidates
+        return candidates
+
+    def resolve(
+        self,
+        level: LogLevel,
+        service_name: str,
+        context: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[str, ...]:
+        """
+        Return the webhooks a message is delivered to.
+
+        Args:
+            level: Message level
+            service_name: Service the message comes from
+            context: The message's additional_context
+
+        Returns:
+            Webhook URLs in route order, or an empty tuple if no route matches
+        """
+        candidates = self._candidates(level, service_name)
+        if len(candidates) == 1 and not candidates[0].context:
+            return candidates[0].webhooks
+
+        seen: Dict[str, None] = {}
+        for route in candidates:
+            if route.matches_context(context):
+                for webhook in route.webhooks:
+                    seen[webhook] = None
+        return tuple(seen)
@@ -0,0 +1,116 @@
+"""
+Adaptive probabilistic sampling of low-priority messages under load.
+"""
+
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Time constant, in seconds, of the smoothed message rate
+_RATE_TIME_CONSTANT = 2.0
+
+
+class AdaptiveSampler:
+    """
+    Samples low-priority messages once the logger is under load.
+
+    Load is the larger of ``depth / queue_depth`` (delivery queue depth)
+    and ``rate / send_rate`` (messages offered per second, measured over
+    windows of at least one second and smoothed exponentially). While
+    load is at or below 1 everything is kept. Above it, messages with a
+    priority below ``min_priority`` are kept with probability ``1 / load``,
+    never less than ``min_rate``. The rate is recomputed on every call, so
+    sampling backs off on its own as soon as load subsides. A threshold of 0 disables that signal.
+    """
+
+    def __init__(
+        self,
+        queue_depth: int = 0,
+        send_rate: float = 0.0,
+        min_rate: float = 0.01,
+        min_priority: int = 2
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            queue_depth: Queue depth above which sampling starts (0 = ignore depth)
+            send_rate: Messages per second above which sampling starts
+                      (0 = ignore the rate)
+            min_rate: Lowest sample rate ever applied
+            min_priority: Messages at or above this priority are never sampled
+        """
+        self.queue_depth = max(0, int(queue_depth))
+        self.send_rate = max(0.0, float(send_rate))
+        self.min_rate = min(1.0, max(0.0, float(min_rate)))
+        self.min_priority = min_priority
+
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._rate = 0.0
+
+        self.sample_rate = 1.0
+        self.sampled_out = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if at least one load signal is configured."""
+        return bool(self.queue_depth or self.send_rate)
+
+    def _observe(self, now: float) -> float:
+        """Count one message and return the smoothed rate. Caller holds the lock."""
+        self._window_count += 1
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            # Longer (idle) windows weigh more, so the rate decays while quiet
+            weight = 1.0 - math.exp(-elapsed / _RATE_TIME_CONSTANT)
+            self._rate += weight * (self._window_count / elapsed - self._rate)
+            self._window_start = now
+            self._window_count = 0
+        return max(self._rate, self._window_count / max(elapsed, 1.0))
+
+    def sample(self, priority: int, depth: int = 0) -> Optional[float]:
+        """
+        Decide whether to keep a message.
+
+        Args:
+            priority: Message priority (see delivery.LEVEL_PRIORITY)
+            depth: Current delivery queue depth
+
+        Returns:
+            The sample rate the message was kept at (1.0 when not sampled),
+            or None if it was sampled out
+        """
+        with self._lock:
+            rate = self._observe(time.monotonic())
+            load = 0.0
+            if self.queue_depth:
+                load = depth / self.queue_depth
+            if self.send_rate:
+                load = max(load, rate / self.send_rate)
+            self.sample_rate = 1.0 if load <= 1.0 else max(self.min_rate, 1.0 / load)
+
+            if priority >= self.min_priority or self.sample_rate >= 1.0:
+                return 1.0
+            if random.random() < self.sample_rate:
+                return self.sample_rate
+            self.sampled_out += 1
+            return None
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Return the sampler's current state.
+
+        Returns:
+            Dictionary with the current sample rate, smoothed message rate
+            and number of messages sampled out
+        """
+        with self._lock:
+            return {
+                "sample_rate": self.sample_rate,
+                "message_rate": round(self._rate, 3),
+                "sampled_out": self.sampled_out,
+            }
@@ -0,0 +1,60 @@
+"""
+Compact JSON encoding of Slack payloads straight to UTF-8 bytes.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_dumps: Optional[Callable[[Any], bytes]] = None
+
+
+def _stdlib_dumps(payload: Any) -> bytes:
+    try:
+        return _encoder.encode(payload).encode("utf-8")
+    except TypeError:
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _select_encoder() -> Callable[[Any], bytes]:
+    """Pick orjson if installed (see the "fast" extra), else the stdlib."""
+    global _dumps
+    try:
+        import orjson
+    except ImportError:
+        _dumps = _stdlib_dumps
+    else:
+        # Leave datetimes, dataclasses and non-str keys to str() like the
+        # stdlib path does, so both encoders produce the same document
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+        def _orjson_dumps(payload: Any) -> bytes:
+            try:
+                return orjson.dumps(payload, default=str, option=options)
+            except TypeError:
+                # e.g. integers beyond 64 bits
+                return _stdlib_dumps(payload)
+        _dumps = _orjson_dumps
+    return _dumps
+
+
+def encoder_name() -> str:
+    """Return the name of the JSON encoder in use ("orjson" or "json")."""
+    return "json" if (_dumps or _select_encoder()) is _stdlib_dumps else "orjson"
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Encode a payload as compact UTF-8 JSON.
+
+    Uses ``orjson`` when it is installed and the standard library encoder
+    otherwise; the choice is made, and orjson imported, on first use.
+    Values neither encoder understands are converted with str().
+
+    Args:
+        payload: JSON-compatible payload
+
+    Returns:
+        Encoded request body
+    """
+    return (_dumps or _select_encoder())(payload)
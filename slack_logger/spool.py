@@ -0,0 +1,387 @@
+"""
+Durable on-disk spool for payloads that have not been delivered yet.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from .client import SendResult
+from .ratelimit import TokenBucket
+from .serialization import dumps
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".spool"
+_LOCK_FILE = "lock"
+
+
+class FsyncPolicy(Enum):
+    """When spool writes are forced to stable storage."""
+    NONE = "none"        # write to the OS only; survives process crashes
+    BATCH = "batch"      # fsync at most once per fsync_interval
+    ALWAYS = "always"    # fsync after every record
+
+    @classmethod
+    def parse(cls, value: Union[str, "FsyncPolicy"]) -> "FsyncPolicy":
+        """
+        Convert a policy name (e.g. "batch") to an FsyncPolicy.
+
+        Raises:
+            ValueError: If the name is not a known policy.
+        """
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).strip().lower())
+        except ValueError:
+            choices = ", ".join(policy.value for policy in cls)
+            raise ValueError(f"Unknown fsync policy {value!r}, expected one of: {choices}")
+
+
+class Spool:
+    """
+    Append-only, segmented spool of Slack payloads.
+
+    Every payload is appended as ``P <id> <json>`` before delivery (or as
+    ``R <id> [[<webhook url>, ...], <json>]`` if it was routed to other
+    webhooks than the logger's own) and acknowledged with ``A <id>``
+    afterwards. Records go to the newest
+    segment file; a new segment starts once it reaches ``segment_bytes``.
+    Segments are deleted oldest first once every payload in them (and in
+    all older segments) is acknowledged. If the spool outgrows
+    ``max_bytes``, the oldest segment is discarded with its payloads.
+
+    On open, existing segments are scanned and unacknowledged payloads are
+    available through ``pending`` and ``replay``. A spool holds an
+    exclusive lock on the directory until it is closed, so two spools,
+    in one process or in two, never write to the same segments.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fsync: Union[str, FsyncPolicy] = FsyncPolicy.BATCH,
+        fsync_interval: float = 1.0,
+        segment_bytes: int = 1024 * 1024,
+        max_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        Open (or create) the spool in ``directory``.
+
+        Args:
+            directory: Directory holding the segment files
+            fsync: Fsync policy
+            fsync_interval: Seconds between fsyncs under the BATCH policy
+            segment_bytes: Size at which a new segment is started
+            max_bytes: Total size cap for all segments
+
+        Raises:
+            RuntimeError: If another open spool holds the directory.
+        """
+        self.directory = directory
+        self.fsync = FsyncPolicy.parse(fsync)
+        self.fsync_interval = fsync_interval
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # segment number -> [size in bytes, unacknowledged payload count]
+        self._segments: Dict[int, List[int]] = {}
+        # payload id -> segment number, for unacknowledged payloads
+        self._unacked: Dict[int, int] = {}
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        # payload id -> webhook URLs, for unacknowledged routed payloads
+        self._routes: Dict[int, Tuple[str, ...]] = {}
+        self._next_id = 1
+        self._last_fsync = time.monotonic()
+        self._file = None
+        self._segment = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = self._acquire()
+        self._load()
+        self._roll()
+
+    def __len__(self) -> int:
+        return len(self._unacked)
+
+    @property
+    def size(self) -> int:
+        """Total bytes used by all segments."""
+        return sum(size for size, _ in self._segments.values())
+
+    def _acquire(self):
+        """Lock the directory for this spool, or raise if it is taken."""
+        lock_file = open(os.path.join(self.directory, _LOCK_FILE), "ab")
+        if fcntl is None:
+            return lock_file
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise RuntimeError(
+                f"Spool directory {self.directory!r} is in use by another spool; "
+                f"use one spool directory per process"
+            )
+        return lock_file
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{segment:012d}{_SEGMENT_SUFFIX}")
+
+    def _load(self) -> None:
+        """Scan existing segments and rebuild the unacknowledged set."""
+        numbers = sorted(
+            int(name[:-len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(_SEGMENT_SUFFIX) and name[:-len(_SEGMENT_SUFFIX)].isdigit()
+        )
+        for segment in numbers:
+            path = self._path(segment)
+            self._segments[segment] = [os.path.getsize(path), 0]
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Torn write from a crash
+                        break
+                    try:
+                        kind, record_id, rest = (line.rstrip(b"\n").split(b" ", 2) + [b""])[:3]
+                        record_id = int(record_id)
+                        if kind == b"P" or kind == b"R":
+                            if kind == b"R":
+                                destinations, payload = json.loads(rest)
+                                self._routes[record_id] = tuple(destinations)
+                            else:
+                                payload = json.loads(rest)
+                            self._pending[record_id] = payload
+                            self._unacked[record_id] = segment
+                            self._segments[segment][1] += 1
+                        elif kind == b"A" and record_id in self._unacked:
+                            self._segments[self._unacked.pop(record_id)][1] -= 1
+                            del self._pending[record_id]
+                            self._routes.pop(record_id, None)
+                        self._next_id = max(self._next_id, record_id + 1)
+                    except ValueError:
+                        logger.warning(f"Skipping corrupt record in Slack spool segment {path}")
+            self._segment = segment
+        self._compact()
+
+    def _roll(self) -> None:
+        """Start a new segment. Caller holds the lock (or is __init__)."""
+        if self._file is not None:
+            self._file.close()
+        self._segment += 1
+        self._file = open(self._path(self._segment), "ab")
+        self._segments[self._segment] = [0, 0]
+        self._compact()
+
+    def _write(self, record: bytes) -> None:
+        """Append a record to the current segment. Caller holds the lock."""
+        if self._file is None:
+            self._roll()
+        self._file.write(record)
+        self._file.flush()
+        self._segments[self._segment][0] += len(record)
+
+        if self.fsync is FsyncPolicy.ALWAYS:
+            os.fsync(self._file.fileno())
+        elif self.fsync is FsyncPolicy.BATCH:
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+        if self._segments[self._segment][0] >= self.segment_bytes:
+            self._roll()
+
+    def _compact(self) -> None:
+        """Delete acknowledged segments and enforce the size cap."""
+        for segment in sorted(self._segments):
+            if segment == self._segment:
+                break
+            size, unacked = self._segments[segment]
+            if unacked > 0 and self.size <= self.max_bytes:
+                break
+            if unacked > 0:
+                logger.warning(
+                    f"Slack spool exceeds {self.max_bytes} bytes, discarding "
+                    f"{unacked} undelivered messages"
+                )
+                for record_id in [i for i, s in self._unacked.items() if s == segment]:
+                    del self._unacked[record_id]
+                    self._pending.pop(record_id, None)
+                    self._routes.pop(record_id, None)
+            del self._segments[segment]
+            try:
+                os.remove(self._path(segment))
+            except OSError:
+                pass
+
+    def append(self, payload: Dict[str, Any], destinations: Sequence[str] = ()) -> int:
+        """
+        Persist a payload before delivery.
+
+        Args:
+            payload: Slack message payload
+            destinations: Webhook URLs the payload is routed to; empty for
+                         the logger's own webhook
+
+        Returns:
+            Record id to pass to ``ack`` once the payload was delivered
+        """
+        if destinations:
+            destinations = tuple(destinations)
+            data = dumps([destinations, payload])
+        else:
+            data = dumps(payload)
+        with self._lock:
+            record_id = self._next_id
+            self._next_id += 1
+            segment = self._segment
+            self._write(b"%s %d %s\n" % (b"R" if destinations else b"P", record_id, data))
+            self._unacked[record_id] = segment
+            self._segments[segment][1] += 1
+            if destinations:
+                self._routes[record_id] = destinations
+        return record_id
+
+    def ack(self, record_id: int) -> None:
+        """
+        Mark a payload as delivered.
+
+        Args:
+            record_id: Id returned by ``append``
+        """
+        with self._lock:
+            segment = self._unacked.pop(record_id, None)
+            if segment is None:
+                return
+            self._pending.pop(record_id, None)
+            self._routes.pop(record_id, None)
+            if segment in self._segments:
+                self._segments[segment][1] -= 1
+            self._write(b"A %d\n" % record_id)
+            self._compact()
+
+    def defer(
+        self,
+        record_ids: Sequence[int],
+        payload: Dict[str, Any],
+        destinations: Sequence[str] = ()
+    ) -> None:
+        """
+        Keep an undelivered payload for the next ``replay`` in this run.
+
+        A payload spooled as a single record for the same destinations is
+        simply marked for replay. Otherwise (a payload merged from several
+        records, or one that reached some of its destinations) it is
+        spooled again as one record, and the originals are acknowledged.
+
+        Args:
+            record_ids: Ids returned by ``append`` for the payload
+            payload: Slack message payload to replay
+            destinations: Webhook URLs it still has to reach; empty for
+                         the logger's own webhook
+        """
+        if len(record_ids) == 1:
+            with self._lock:
+                if record_ids[0] in self._unacked and self._routes.get(record_ids[0], ()) == tuple(destinations):
+                    self._pending[record_ids[0]] = payload
+                    return
+        record_id = self.reroute(record_ids, payload, destinations)
+        with self._lock:
+            if record_id in self._unacked:
+                self._pending[record_id] = payload
+
+    def reroute(self, record_ids: Sequence[int], payload: Dict[str, Any], destinations: Sequence[str] = ()) -> int:
+        """
+        Spool a payload again for fewer destinations, acknowledging the originals.
+
+        Args:
+            record_ids: Ids returned by ``append`` for the payload
+            payload: Slack message payload
+            destinations: Webhook URLs it still has to reach
+
+        Returns:
+            Id of the new record
+        """
+        record_id = self.append(payload, destinations)
+        for old_id in record_ids:
+            self.ack(old_id)
+        return record_id
+
+    def pending(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Return payloads left unacknowledged by a previous run, or deferred
+        with ``defer``.
+
+        Returns:
+            (record id, payload) pairs, oldest first
+        """
+        with self._lock:
+            return sorted(self._pending.items())
+
+    def replay(
+        self,
+        send: Callable[[Dict[str, Any], Optional[str]], Union[bool, SendResult]],
+        rate: float = 1.0
+    ) -> int:
+        """
+        Re-deliver payloads left over from a previous run or deferred.
+
+        Each payload goes to every webhook it was routed to. A delivery
+        Slack rejects (a 4xx other than 429) can never succeed, so it is
+        logged and skipped. Any other failure stops the replay so the
+        remaining payloads stay spooled for the next attempt; a payload
+        that reached some of its webhooks is spooled again for the rest.
+
+        Args:
+            send: Callable taking a payload and a webhook URL (None for
+                 the logger's own webhook) that returns a SendResult, or
+                 True on success
+            rate: Maximum deliveries per second
+
+        Returns:
+            Number of payloads delivered
+        """
+        limiter = TokenBucket(rate, 1) if rate > 0 else None
+        delivered = 0
+        for record_id, payload in self.pending():
+            destinations = self._routes.get(record_id) or (None,)
+            sent = False
+            for index, destination in enumerate(destinations):
+                if limiter is not None:
+                    limiter.acquire()
+                result = send(payload, destination)
+                if result is SendResult.REJECTED:
+                    logger.error(f"Slack rejected spooled message {record_id}, discarding it")
+                elif result is True or result is SendResult.SENT:
+                    sent = True
+                else:
+                    if index:
+                        self.defer([record_id], payload, destinations[index:])
+                    return delivered
+            self.ack(record_id)
+            delivered += sent
+        return delivered
+
+    def close(self) -> None:
+        """Flush and close the current segment and release the directory."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+            if self._lock_file is not None:
+                # Closing the file releases the flock
+                self._lock_file.close()
+                self._lock_file = None
@@ -0,0 +1,281 @@
+"""
+Bounded, cached traceback rendering.
+"""
+
+import hashlib
+import linecache
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Optional, Tuple, Union
+
+_HEADER = "Traceback (most recent call last):\n"
+_CAUSE = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT = "\nDuring handling of the above exception, another exception occurred:\n\n"
+
+# Identical consecutive frames beyond this are collapsed, like the stdlib does
+_REPEAT_THRESHOLD = 3
+
+
+class ExceptionSnapshot:
+    """
+    Compact, frame-free record of an exception and its cause chain.
+
+    Holds the type names, the message and the innermost frames as
+    (code object, line number) pairs. Code objects live as long as their
+    module, so unlike a live ``__traceback__`` the snapshot keeps no frame
+    and none of its local variables alive.
+    """
+
+    __slots__ = (
+        "name", "qualified_name", "message", "frames", "frame_count",
+        "cause", "separator", "fingerprint",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        qualified_name: str,
+        message: str,
+        frames: Tuple[Tuple[object, int], ...],
+        frame_count: int,
+        cause: Optional["ExceptionSnapshot"] = None,
+        separator: str = "",
+        fingerprint: Optional[str] = None
+    ):
+        """
+        Initialize the snapshot. Use ``TracebackRenderer.capture`` to build one.
+
+        Args:
+            name: Exception class name
+            qualified_name: Module-qualified class name
+            message: str() of the exception
+            frames: Innermost (code, line number) pairs, outermost first
+            frame_count: Number of frames in the full traceback
+            cause: Snapshot of the cause or context, if any
+            separator: Text leading from ``cause`` to this exception
+            fingerprint: Digest of the type and every frame, if computed
+        """
+        self.name = name
+        self.qualified_name = qualified_name
+        self.message = message
+        self.frames = frames
+        self.frame_count = frame_count
+        self.cause = cause
+        self.separator = separator
+        self.fingerprint = fingerprint
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class TracebackRenderer:
+    """
+    Renders exception chains into at most ``max_chars`` characters.
+
+    Unlike ``traceback.format_exception`` followed by truncation, the
+    renderer starts from the innermost frame of the logged exception (the
+    one that actually failed) and works outwards, stopping as soon as the
+    budget is used up, so frames that would be cut anyway never touch
+    ``linecache``. Outer frames that don't fit are replaced by a single
+    "frames omitted" line. Causes and contexts are rendered with whatever
+    budget is left.
+
+    Rendered frame lines are memoized by (code object, line number) in an
+    LRU cache of ``cache_size`` entries. ``capture`` converts an exception
+    into an ExceptionSnapshot holding only the frames ``render`` can use,
+    so the exception can be released before rendering.
+    """
+
+    def __init__(self, max_chars: int = 3000, cache_size: int = 1024):
+        """
+        Initialize the renderer.
+
+        Args:
+            max_chars: Maximum length of the rendered traceback
+            cache_size: Maximum number of cached frame lines
+        """
+        self.max_chars = max_chars
+        self.cache_size = cache_size
+        # A frame line is never shorter than this, so deeper frames can't fit
+        self.max_frames = max(1, max_chars // 24)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _frame_text(self, code, lineno: int) -> str:
+        """Return the rendered lines for one frame, using the cache."""
+        key = (code, lineno)
+        with self._lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+                return text
+
+        text = f'  File "{code.co_filename}", line {lineno}, in {code.co_name}\n'
+        source = linecache.getline(code.co_filename, lineno).strip()
+        if source:
+            text += f"    {source}\n"
+
+        with self._lock:
+            self._cache[key] = text
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return text
+
+    def _capture_one(self, exception: BaseException, fingerprint: bool) -> ExceptionSnapshot:
+        """Snapshot one exception of a chain, without its cause."""
+        exc_type = type(exception)
+        qualified_name = f"{exc_type.__module__}.{exc_type.__qualname__}"
+        try:
+            message = str(exception)
+        except Exception:
+            message = "<exception str() failed>"
+
+        digest = hashlib.sha1(qualified_name.encode("utf-8", "replace")) if fingerprint else None
+        frames = deque(maxlen=self.max_frames)
+        total = 0
+        tb = exception.__traceback__
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            frames.append((code, tb.tb_lineno))
+            if digest is not None:
+                digest.update(
+                    f"|{os.path.basename(code.co_filename)}:{code.co_name}:{tb.tb_lineno}".encode("utf-8", "replace")
+                )
+            total += 1
+            tb = tb.tb_next
+        return ExceptionSnapshot(
+            exc_type.__name__,
+            qualified_name,
+            message,
+            tuple(frames),
+            total,
+            fingerprint=digest.hexdigest()[:16] if digest is not None else None
+        )
+
+    def capture(self, exception: BaseException, fingerprint: bool = False) -> ExceptionSnapshot:
+        """
+        Convert an exception and its cause chain into a snapshot.
+
+        Walks each traceback once and keeps only the innermost frames that
+        could ever be rendered.
+
+        Args:
+            exception: Exception to capture
+            fingerprint: Also compute the fingerprint of the outermost
+                        exception (type and every frame), as used by
+                        duplicate suppression
+
+        Returns:
+            ExceptionSnapshot of the exception, linked to its causes
+        """
+        head = self._capture_one(exception, fingerprint)
+        snapshot = head
+        seen = {id(exception)}
+        current = exception
+        while True:
+            if current.__cause__ is not None:
+                separator, current = _CAUSE, current.__cause__
+            elif current.__context__ is not None and not current.__suppress_context__:
+                separator, current = _CONTEXT, current.__context__
+            else:
+                break
+            if id(current) in seen:
+                break
+            seen.add(id(current))
+            snapshot.separator = separator
+            snapshot.cause = self._capture_one(current, False)
+            snapshot = snapshot.cause
+        return head
+
+    @staticmethod
+    def _exception_line(snapshot: ExceptionSnapshot, limit: int) -> str:
+        name = snapshot.qualified_name
+        for prefix in ("builtins.", "__main__."):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+                break
+        message = snapshot.message
+        line = f"{name}: {message}" if message else name
+        if len(line) > limit:
+            line = line[:max(0, limit - 16)] + "... (truncated)"
+        return line + "\n"
+
+    def _render_one(self, snapshot: ExceptionSnapshot, budget: int) -> str:
+        """Render one exception of the chain within ``budget`` characters."""
+        exc_line = self._exception_line(snapshot, max(32, budget // 2))
+
+        frames = snapshot.frames
+        total = snapshot.frame_count
+        if not frames:
+            return exc_line
+
+        remaining = budget - len(_HEADER) - len(exc_line)
+        rendered = []  # (text, frame count), innermost first
+        index = len(frames) - 1
+        while index >= 0:
+            frame = frames[index]
+            start = index
+            while start > 0 and frames[start - 1] == frame:
+                start -= 1
+            repeats = index - start + 1
+
+            text = self._frame_text(*frame)
+            if repeats > _REPEAT_THRESHOLD:
+                piece = text + f"  [Previous line repeated {repeats - 1} more times]\n"
+            else:
+                piece = text * repeats
+            if len(piece) > remaining and rendered:
+                break
+            rendered.append((piece, repeats))
+            remaining -= len(piece)
+            index = start - 1
+
+        omitted = index + 1 + (total - len(frames))
+        parts = [_HEADER]
+        if omitted:
+            note = f"  ... {omitted} outer frames omitted ...\n"
+            # Make room for the note by dropping outer frames
+            while remaining < len(note) and len(rendered) > 1:
+                piece, repeats = rendered.pop()
+                remaining += len(piece)
+                omitted += repeats
+                note = f"  ... {omitted} outer frames omitted ...\n"
+            parts.append(note)
+        parts.extend(piece for piece, _ in reversed(rendered))
+        parts.append(exc_line)
+        return "".join(parts)
+
+    def render(self, exception: Union[BaseException, ExceptionSnapshot]) -> str:
+        """
+        Render an exception and its cause chain.
+
+        Args:
+            exception: Exception, or its snapshot from ``capture``
+
+        Returns:
+            Traceback text of at most about ``max_chars`` characters
+        """
+        if not isinstance(exception, ExceptionSnapshot):
+            exception = self.capture(exception)
+
+        budget = self.max_chars
+        rendered = []
+        current: Optional[ExceptionSnapshot] = exception
+        while current is not None:
+            if budget <= len(_HEADER):
+                rendered.append(("... (earlier exceptions omitted)\n", current.separator))
+                break
+            text = self._render_one(current, budget)
+            budget -= len(text) + len(current.separator)
+            rendered.append((text, current.separator))
+            current = current.cause
+
+        # Oldest first, each followed by the separator leading to the next
+        parts = []
+        for index in range(len(rendered) - 1, -1, -1):
+            parts.append(rendered[index][0])
+            if index > 0:
+                parts.append(rendered[index - 1][1])
+        return "".join(parts)
+
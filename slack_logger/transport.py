@@ -0,0 +1,156 @@
+"""
+Pooled keep-alive HTTP transport shared by Slack webhook clients.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+
+def load_requests():
+    """
+    Import and return the ``requests`` module.
+
+    ``requests`` (with urllib3 and certifi) is most of this package's import
+    time, so it is only imported once the first message is sent.
+    """
+    import requests
+    return requests
+
+
+class HTTPTransport:
+    """
+    Thread-safe HTTP transport that keeps connections to a webhook host alive.
+
+    Wraps a ``requests.Session`` whose adapter holds up to ``pool_size``
+    idle connections, so repeated posts (and retries) skip the TCP and TLS
+    handshakes. Retries are handled by the caller, never by urllib3.
+    """
+
+    def __init__(self, pool_size: int = 10):
+        """
+        Initialize the transport.
+
+        The session is created, and ``requests`` imported, on the first post.
+
+        Args:
+            pool_size: Maximum number of connections kept open per host
+        """
+        self.pool_size = max(1, int(pool_size))
+        self._adapter = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _get_session(self):
+        """Return the session, creating it on first use."""
+        session = self._session
+        if session is None:
+            with self._lock:
+                session = self._session
+                if session is None:
+                    requests = load_requests()
+                    self._adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=self.pool_size,
+                        max_retries=0
+                    )
+                    session = requests.Session()
+                    session.mount("https://", self._adapter)
+                    session.mount("http://", self._adapter)
+                    self._session = session
+        return session
+
+    def post(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> "requests.Response":
+        """
+        POST to ``url`` over a pooled connection.
+
+        Args:
+            url: Target URL
+            json: Payload to JSON-encode
+            data: Pre-encoded request body
+            timeout: Request timeout in seconds
+            headers: Extra request headers
+
+        Returns:
+            The HTTP response (the body is always read so the connection
+            returns to the pool)
+        """
+        response = self._get_session().post(url, json=json, data=data, timeout=timeout, headers=headers)
+        # Reading the body releases the connection back to the pool
+        response.content
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return connection usage counters.
+
+        Returns:
+            Dictionary with ``requests``, ``connections_opened`` and
+            ``connections_reused`` summed over all pooled hosts
+        """
+        total_requests = 0
+        opened = 0
+        pools = self._adapter.poolmanager.pools if self._adapter is not None else {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            total_requests += pool.num_requests
+            opened += pool.num_connections
+        return {
+            "pool_size": self.pool_size,
+            "requests": total_requests,
+            "connections_opened": opened,
+            "connections_reused": max(0, total_requests - opened),
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+_transports: Dict[Tuple[str, str, Optional[int]], HTTPTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def _host_key(url: str) -> Tuple[str, str, Optional[int]]:
+    parts = urlsplit(url)
+    return parts.scheme.lower(), (parts.hostname or "").lower(), parts.port
+
+
+def get_transport(url: str, pool_size: int = 10) -> HTTPTransport:
+    """
+    Return the shared transport for the host of ``url``.
+
+    All clients posting to the same scheme, host and port share one pool.
+    The pool size is fixed by the first caller for that host.
+
+    Args:
+        url: Webhook URL
+        pool_size: Pool size used if the transport has to be created
+
+    Returns:
+        Shared HTTPTransport instance
+    """
+    key = _host_key(url)
+    transport = _transports.get(key)
+    if transport is None:
+        with _transports_lock:
+            transport = _transports.get(key)
+            if transport is None:
+                transport = HTTPTransport(pool_size)
+                _transports[key] = transport
+    return transport
@@ -0,0 +1,305 @@
+"""
+Slack Web API client that threads recurring errors under one parent message.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set, Tuple
+from .client import SendResult, SlackWebhookClient
+from .limits import MAX_BLOCKS
+from .metrics import Metrics
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://slack.com/api"
+
+# Numbers and hex ids don't make a message a new variant
+_VARIABLE_RE = re.compile(r"0x[0-9a-fA-F]+|\d+")
+
+# Errors meaning the parent message can no longer be edited
+_GONE_ERRORS = frozenset(("message_not_found", "channel_not_found", "cant_update_message", "is_archived"))
+
+
+def variant_key(text: str) -> str:
+    """
+    Normalize a message (or exception message) into a variant key.
+
+    Occurrences of one fingerprint whose keys differ are notable variants
+    and get a thread reply; the rest only bump the parent's counter.
+    """
+    return _VARIABLE_RE.sub("#", text)
+
+
+class _Thread:
+    """A posted parent message and the occurrences counted against it."""
+
+    __slots__ = ("channel", "ts", "payload", "count", "last_seen", "posted_count", "variants", "replies")
+
+    def __init__(self, channel: str, ts: str, payload: Dict[str, Any], variant: str):
+        self.channel = channel
+        self.ts = ts
+        self.payload = payload
+        self.count = 1
+        self.last_seen = time.time()
+        self.posted_count = 1
+        self.variants: Set[str] = {variant}
+        self.replies = 0
+
+
+class SlackWebAPIClient(SlackWebhookClient):
+    """
+    Client posting through the Web API (``chat.postMessage``, ``chat.update``).
+
+    ``send(payload)`` posts a new message. ``send(payload, thread_key)`` with
+    a (fingerprint, variant) pair posts the first occurrence of a fingerprint
+    as a parent message (occurrences arriving while it is being posted wait
+    for it); later occurrences edit the parent's occurrence counter in
+    place, at most once per ``update_interval`` seconds, and only variants
+    not seen before for that parent are posted as thread replies (up to
+    ``max_replies``). Parents are remembered in an LRU map of
+    ``cache_size`` fingerprints; a fingerprint that fell out of it starts a
+    new parent. Retries, rate limiting, the circuit breaker and metrics
+    work as for SlackWebhookClient.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        channel: str,
+        api_url: str = DEFAULT_API_URL,
+        timeout: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+        update_interval: float = 10.0,
+        cache_size: int = 1000,
+        max_replies: int = 10
+    ):
+        """
+        Initialize the Web API client.
+
+        Args:
+            token: Bot token (``xoxb-...``) with the ``chat:write`` scope
+            channel: Channel id or name to post to
+            api_url: Base URL of the Web API; point it at a local stub to test
+            timeout: HTTP request timeout in seconds
+            pool_size: Keep-alive connections to the API host
+            retry_policy: Backoff and deadline settings
+            metrics: Records serialize and HTTP timings, retries and
+                    in-flight requests. None disables recording.
+            update_interval: Minimum seconds between edits of one parent
+            cache_size: Maximum number of fingerprints mapped to a parent
+            max_replies: Maximum number of thread replies per parent
+        """
+        self.api_url = api_url.rstrip("/")
+        self.channel = channel
+        # The channel's URL keys the shared transport, rate limiter and breaker
+        super().__init__(
+            f"{self.api_url}/chat.postMessage#{channel}",
+            timeout=timeout,
+            pool_size=pool_size,
+            retry_policy=retry_policy,
+            metrics=metrics
+        )
+        self.update_interval = update_interval
+        self.cache_size = max(1, int(cache_size))
+        self.max_replies = max(0, int(max_replies))
+        self._headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Authorization": f"Bearer {token}",
+        }
+        self._threads: "OrderedDict[str, _Thread]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Fingerprints whose parent is being posted; other occurrences wait for it
+        self._posting: Set[str] = set()
+        self._posted = threading.Condition(self._lock)
+        # fingerprint -> time its parent's counter is due to be edited
+        self._pending: "OrderedDict[str, float]" = OrderedDict()
+        self._updater: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def _call(self, method: str, payload: Dict[str, Any]) -> Tuple[SendResult, Optional[Dict[str, Any]]]:
+        """
+        Call a Web API method.
+
+        Returns:
+            (SendResult, the response body if it reports ``ok``, else None).
+            A response that isn't ``ok`` is REJECTED.
+        """
+        result, response = self._send_body(f"{self.api_url}/{method}", self._encode(payload), self._headers)
+        if response is None:
+            return result, None
+        try:
+            data = response.json()
+        except ValueError:
+            logger.warning(f"Slack {method} returned a non-JSON response")
+            return SendResult.FAILED, None
+        if not data.get("ok"):
+            logger.warning(f"Slack {method} failed: {data.get('error', 'unknown error')}")
+            return SendResult.REJECTED, None
+        return SendResult.SENT, data
+
+    def send(self, payload: Dict[str, Any], thread_key: Optional[Tuple[str, str]] = None) -> bool:
+        """
+        Post a message, or count it against the parent of its fingerprint.
+
+        Args:
+            payload: Slack message payload (blocks or text)
+            thread_key: Optional (fingerprint, variant) pair; see variant_key
+
+        Returns:
+            True if the message was posted or counted, False otherwise
+        """
+        return self.deliver(payload, thread_key) is SendResult.SENT
+
+    def deliver(self, payload: Dict[str, Any], thread_key: Optional[Tuple[str, str]] = None) -> SendResult:
+        """
+        Post or count a message like ``send``, reporting why delivery failed.
+
+        Args:
+            payload: Slack message payload (blocks or text)
+            thread_key: Optional (fingerprint, variant) pair; see variant_key
+
+        Returns:
+            SendResult of the post; SENT for an occurrence only counted
+        """
+        if thread_key is None:
+            return self._call("chat.postMessage", dict(payload, channel=self.channel))[0]
+
+        key, variant = thread_key
+        reply = False
+        with self._lock:
+            while key in self._posting:
+                self._posted.wait()
+            thread = self._threads.get(key)
+            if thread is None:
+                self._posting.add(key)
+            else:
+                self._threads.move_to_end(key)
+                thread.count += 1
+                thread.last_seen = time.time()
+                if variant not in thread.variants and thread.replies < self.max_replies:
+                    thread.variants.add(variant)
+                    thread.replies += 1
+                    reply = True
+                self._schedule(key)
+
+        if thread is None:
+            posted = None
+            try:
+                result, data = self._call("chat.postMessage", dict(payload, channel=self.channel))
+                if data is not None and data.get("ts"):
+                    posted = _Thread(data.get("channel", self.channel), data["ts"], payload, variant)
+            finally:
+                with self._lock:
+                    self._posting.discard(key)
+                    if posted is not None:
+                        self._threads[key] = posted
+                        self._threads.move_to_end(key)
+                        while len(self._threads) > self.cache_size:
+                            evicted, _ = self._threads.popitem(last=False)
+                            self._pending.pop(evicted, None)
+                    self._posted.notify_all()
+            return result
+
+        if reply:
+            return self._call(
+                "chat.postMessage",
+                dict(payload, channel=thread.channel, thread_ts=thread.ts)
+            )[0]
+        return SendResult.SENT
+
+    def _schedule(self, key: str) -> None:
+        """Queue an edit of a parent's counter. Caller holds the lock."""
+        if key in self._pending:
+            return
+        self._pending[key] = time.monotonic() + self.update_interval
+        if self._updater is None:
+            self._updater = threading.Thread(target=self._run_updates, name="slack-logger-webapi", daemon=True)
+            self._updater.start()
+        self._wakeup.notify()
+
+    def _run_updates(self) -> None:
+        """Edit parents' counters as their throttle intervals expire."""
+        while True:
+            with self._lock:
+                while True:
+                    if self._pending:
+                        key, due = next(iter(self._pending.items()))
+                        delay = due - time.monotonic()
+                        if delay <= 0:
+                            del self._pending[key]
+                            thread = self._threads.get(key)
+                            break
+                    else:
+                        delay = None
+                    self._wakeup.wait(delay)
+            if thread is not None:
+                self._update(key, thread)
+
+    def flush_updates(self, timeout: Optional[float] = None) -> bool:
+        """
+        Edit every parent whose counter changed since its last edit, now.
+
+        Args:
+            timeout: Maximum seconds to spend, or None for no limit
+
+        Returns:
+            True if every pending edit was attempted within the timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            due = [(key, self._threads.get(key)) for key in self._pending]
+            self._pending.clear()
+        for key, thread in due:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            if thread is not None:
+                self._update(key, thread)
+        return True
+
+    def _update(self, key: str, thread: _Thread) -> None:
+        """Edit a parent's occurrence counter with chat.update."""
+        count = thread.count
+        if count == thread.posted_count:
+            return
+        last_seen = datetime.fromtimestamp(thread.last_seen, timezone.utc).strftime("%H:%M:%S")
+        counter = {
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": f"🔁 Occurred {count} times, last at {last_seen} UTC"}]
+        }
+        payload = thread.payload
+        # A parent already at Slack's block limit gives up its last block
+        blocks = list(payload.get("blocks", ()))[:MAX_BLOCKS - 1] + [counter]
+        body = dict(
+            payload,
+            channel=thread.channel,
+            ts=thread.ts,
+            blocks=blocks,
+            text=f"{payload.get('text', '')} (×{count})"
+        )
+        response = self._send_body(f"{self.api_url}/chat.update", self._encode(body), self._headers)[1]
+        if response is None:
+            return
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if data.get("ok"):
+            thread.posted_count = count
+            return
+        error = data.get("error", "unknown error")
+        logger.warning(f"Slack chat.update failed: {error}")
+        if error in _GONE_ERRORS:
+            # Start a new parent on the next occurrence
+            with self._lock:
+                if self._threads.get(key) is thread:
+                    del self._threads[key]
@@ -0,0 +1,32 @@
+"""
+Shared fixtures: a local stub webhook from the benchmarks.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from stub_server import StubWebhook  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def stub():
+    with StubWebhook() as server:
+        yield server
+
+
+def run_python(code, *args, env=None, timeout=30):
+    """Run ``code`` in a fresh interpreter with the package importable."""
+    import subprocess
+    return subprocess.run(
+        [sys.executable, "-c", code, *args],
+        env={**os.environ, "PYTHONPATH": ROOT, "SLACK_LOGGER_RATE_LIMIT": "0", **(env or {})},
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
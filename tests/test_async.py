@@ -0,0 +1,138 @@
+"""
+Tests for the asyncio client and logger, against a local asyncio stub.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from slack_logger.async_client import AsyncSlackWebhookClient  # noqa: E402
+from slack_logger.async_logger import AsyncSlackLogger  # noqa: E402
+from slack_logger.retry import RetryPolicy  # noqa: E402
+
+_REASONS = {200: "OK", 400: "Bad Request", 500: "Internal Server Error"}
+
+
+class _Stub:
+    """Minimal keep-alive HTTP server answering with scripted statuses."""
+
+    def __init__(self, statuses=(), stall=False):
+        self.statuses = list(statuses)
+        self.stall = stall
+        self.bodies = []
+        self.connections = 0
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/services/T/B/X"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                self.bodies.append(json.loads(await reader.readexactly(length)))
+                if self.stall:
+                    await asyncio.sleep(60)
+                status = self.statuses.pop(0) if self.statuses else 200
+                body = b"ok"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+_FAST_RETRIES = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.01, deadline=5)
+
+
+def _client(url):
+    return AsyncSlackWebhookClient(url, timeout=2, retry_policy=_FAST_RETRIES)
+
+
+def test_client_posts_payload():
+    async def scenario():
+        async with _Stub() as stub:
+            client = _client(stub.url)
+            assert await client.send({"text": "one"})
+            assert await client.send({"text": "two"})
+            await client.close()
+            return stub
+
+    stub = asyncio.run(scenario())
+    assert stub.bodies == [{"text": "one"}, {"text": "two"}]
+    # Both posts went over one pooled connection
+    assert stub.connections == 1
+
+
+def test_client_retries_server_errors():
+    async def scenario():
+        async with _Stub(statuses=[500, 200]) as stub:
+            client = _client(stub.url)
+            sent = await client.send({"text": "retry me"})
+            await client.close()
+            return sent, stub
+
+    sent, stub = asyncio.run(scenario())
+    assert sent
+    assert len(stub.bodies) == 2
+
+
+def test_client_does_not_retry_client_errors():
+    async def scenario():
+        async with _Stub(statuses=[400]) as stub:
+            client = _client(stub.url)
+            sent = await client.send({"text": "bad"})
+            await client.close()
+            return sent, stub
+
+    sent, stub = asyncio.run(scenario())
+    assert not sent
+    assert len(stub.bodies) == 1
+
+
+def test_logger_delivers_background_messages():
+    async def scenario():
+        async with _Stub() as stub:
+            async with AsyncSlackLogger(webhook_url=stub.url, service_name="svc", timeout=2) as logger:
+                for i in range(3):
+                    assert await logger.error(f"boom {i}", background=True)
+                assert await logger.drain(5)
+            return stub
+
+    stub = asyncio.run(scenario())
+    assert len(stub.bodies) == 3
+    assert all(body["blocks"] for body in stub.bodies)
+
+
+def test_close_cancels_and_awaits_stragglers():
+    async def scenario():
+        async with _Stub(stall=True) as stub:
+            logger = AsyncSlackLogger(webhook_url=stub.url, service_name="svc", timeout=30)
+            await logger.error("stuck", background=True)
+            tasks = set(logger._tasks)
+            assert not await logger.close(timeout=0.2)
+            # Cancelled deliveries have unwound by the time close returns
+            assert all(task.done() for task in tasks)
+            assert logger.pending == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,97 @@
+"""
+Tests for the circuit breaker's state transitions.
+"""
+
+import time
+
+from slack_logger.breaker import CircuitBreaker, CircuitState
+
+
+def _tripped(**kwargs):
+    kwargs.setdefault("failure_threshold", 3)
+    kwargs.setdefault("reset_timeout", 0.05)
+    breaker = CircuitBreaker(**kwargs)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.rejecting
+    assert not breaker.allow()
+    assert breaker.rejected == 1 and breaker.opened == 1
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, failure_rate=1.0, reset_timeout=60)
+    for _ in range(5):
+        breaker.record_failure()
+        breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_opens_on_failure_rate_over_window():
+    breaker = CircuitBreaker(failure_threshold=100, failure_rate=0.5, window=10, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_success()
+        breaker.record_failure()
+    # Fewer than half the window recorded yet
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = _tripped()
+    time.sleep(0.06)
+    assert not breaker.rejecting
+
+    assert breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.rejecting
+    assert not breaker.allow()
+
+
+def test_probe_success_closes():
+    breaker = _tripped()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_probe_failure_reopens():
+    breaker = _tripped()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.opened == 2
+
+
+def test_lost_probe_is_replaced():
+    breaker = _tripped()
+    time.sleep(0.06)
+    assert breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+def test_snapshot():
+    snapshot = _tripped(reset_timeout=60).snapshot()
+    assert snapshot["state"] == "open"
+    assert snapshot["consecutive_failures"] == 3
+    assert 0 < snapshot["retry_in"] <= 60
@@ -0,0 +1,36 @@
+"""
+Tests for the webhook client's handling of 429 responses.
+"""
+
+import time
+
+from slack_logger.client import SendResult, SlackWebhookClient
+from slack_logger.ratelimit import TokenBucket
+from slack_logger.retry import RetryPolicy
+
+from stub_server import StubWebhook
+
+
+def _client(url):
+    return SlackWebhookClient(url, timeout=2, retry_policy=RetryPolicy(base_delay=0.01, deadline=5))
+
+
+def test_rate_limited_without_limiter_does_not_sleep():
+    with StubWebhook(rate_limit_rate=1.0, retry_after=1) as stub:
+        client = _client(stub.url)
+        client.rate_limiter = None
+
+        started = time.monotonic()
+        assert client.deliver({"text": "x"}) is SendResult.RATE_LIMITED
+        assert time.monotonic() - started < 0.5
+        assert stub.counts["requests"] == 1
+
+
+def test_rate_limited_pauses_the_limiter():
+    with StubWebhook(rate_limit_rate=1.0, retry_after=5) as stub:
+        client = _client(stub.url)
+        client.rate_limiter = TokenBucket(rate=100, capacity=10)
+
+        assert client.deliver({"text": "x"}) is SendResult.RATE_LIMITED
+        assert client.rate_limiter.state()["paused_for"] > 4
+        assert stub.counts["requests"] == 1
@@ -0,0 +1,77 @@
+"""
+Tests for the cached configuration snapshot and Config.reload().
+"""
+
+import pytest
+
+from slack_logger.config import Config
+from slack_logger.logger import SlackLogger
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """Reload-safe config: the snapshot in use before the test comes back after it."""
+    saved = Config._snapshot
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.com/services/T/B/X")
+    monkeypatch.setenv("SLACK_LOGGER_RATE_LIMIT", "0")
+    Config.reload()
+    yield monkeypatch
+    Config._snapshot = saved
+
+
+def test_snapshot_is_cached_until_reload(config):
+    config.setenv("SLACK_LOGGER_QUEUE_SIZE", "123")
+    snapshot = Config.reload()
+    assert Config.current() is snapshot
+    assert Config.get_queue_size() == 123
+
+    # Changing the environment alone has no effect
+    config.setenv("SLACK_LOGGER_QUEUE_SIZE", "456")
+    assert Config.get_queue_size() == 123
+    assert Config.current() is snapshot
+
+    assert Config.reload() is not snapshot
+    assert Config.get_queue_size() == 456
+
+
+def test_reload_falls_back_to_defaults(config):
+    config.setenv("SLACK_LOGGER_DEDUPE_WINDOW", "30")
+    assert Config.reload().dedupe_window == 30
+
+    config.delenv("SLACK_LOGGER_DEDUPE_WINDOW")
+    assert Config.reload().dedupe_window == Config.DEFAULT_DEDUPE_WINDOW
+
+
+def test_snapshot_is_immutable(config):
+    with pytest.raises(AttributeError):
+        Config.current().queue_size = 1
+
+
+def test_invalid_value_keeps_previous_snapshot(config):
+    snapshot = Config.current()
+    config.setenv("SLACK_LOGGER_TIMEOUT", "soon")
+
+    with pytest.raises(ValueError):
+        Config.reload()
+    assert Config.current() is snapshot
+
+
+def test_existing_loggers_keep_their_settings(config):
+    config.setenv("SLACK_LOGGER_SERVICE_NAME", "before")
+    Config.reload()
+    logger = SlackLogger()
+
+    config.setenv("SLACK_LOGGER_SERVICE_NAME", "after")
+    Config.reload()
+    try:
+        assert logger.service_name == "before"
+        assert SlackLogger().service_name == "after"
+    finally:
+        logger.close()
+
+
+def test_explicit_arguments_win_over_the_snapshot(config):
+    config.setenv("SLACK_LOGGER_SERVICE_NAME", "from-env")
+    Config.reload()
+    assert Config.get_service_name() == "from-env"
+    assert Config.get_service_name("explicit") == "explicit"
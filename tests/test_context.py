@@ -0,0 +1,81 @@
+"""
+Tests for the size-bounded additional_context renderer.
+"""
+
+from slack_logger.context import ContextRenderer, safe_repr
+
+
+def test_nesting_stops_at_max_depth():
+    text = ContextRenderer(max_depth=2).render({"a": {"b": {"c": {"d": 1}}, "l": [[["deep"]]]}})
+
+    assert '"c": {…}' in text
+    assert "[…]" in text
+    assert '"d"' not in text and "deep" not in text
+
+
+def test_items_beyond_max_items_are_counted():
+    text = ContextRenderer(max_items=3).render({
+        "list": list(range(10)),
+        "dict": {f"k{i}": i for i in range(10)},
+        **{f"top{i}": i for i in range(5)},
+    })
+
+    assert '"… 7 more"' in text
+    assert '"…": "7 more"' in text
+    assert "• _… 4 more_" in text
+    assert "top0" in text and "top1" not in text
+
+
+def test_values_are_cut_at_max_value_chars():
+    text = ContextRenderer(max_value_chars=5).render({"top": "abcdefgh", "nested": ["abcdefgh"], "ok": "abcde"})
+
+    assert "`abcde…`" in text
+    assert '"abcde…"' in text
+    assert "`abcde`" in text
+    assert "abcdef" not in text
+
+
+def test_output_stays_within_max_chars():
+    renderer = ContextRenderer(max_chars=200)
+    text = renderer.render({f"key{i}": {"values": ["x" * 100] * 50} for i in range(1000)})
+
+    assert len(text) <= 200
+    assert text.endswith("_… context truncated_")
+
+
+def test_small_context_is_not_truncated():
+    text = ContextRenderer().render({"user_id": 42, "ok": True, "ratio": 0.5, "none": None})
+
+    assert text == (
+        "*Additional Context:*\n"
+        "• *user_id:* `42`\n"
+        "• *ok:* `True`\n"
+        "• *ratio:* `0.5`\n"
+        "• *none:* `None`\n"
+    )
+
+
+def test_cyclic_input_terminates():
+    cycle = {"name": "node"}
+    cycle["self"] = cycle
+    loop = [1]
+    loop.append(loop)
+
+    text = ContextRenderer(max_depth=4).render({"cycle": cycle, "loop": loop})
+
+    assert text.count('"name"') == 4
+    assert "{…}" in text and "[…]" in text
+
+
+def test_unrepresentable_values_never_raise():
+    class Broken:
+        def __str__(self):
+            raise RuntimeError("no str")
+
+        def __repr__(self):
+            raise RuntimeError("no repr")
+
+    text = ContextRenderer().render({"top": Broken(), "nested": [Broken()]})
+
+    assert text.count("<unrepresentable Broken>") == 2
+    assert safe_repr("x" * 300, limit=10) == "'xxxxxxxxx…"
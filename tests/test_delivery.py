@@ -0,0 +1,85 @@
+"""
+Tests for the background delivery queue.
+"""
+
+import threading
+
+import pytest
+
+from slack_logger.delivery import DeliveryQueue, DropPolicy
+from slack_logger.envelope import Envelope
+from slack_logger.metrics import Metrics
+
+
+class _Stalled:
+    """Sender that holds the worker until released, recording what it got."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.sent = []
+
+    def __call__(self, envelope):
+        self.started.set()
+        self.release.wait(5)
+        self.sent.append(envelope.payload["text"])
+        return True
+
+
+def _queue(policy, max_size=2, **kwargs):
+    sender = _Stalled()
+    queue = DeliveryQueue(sender, max_size=max_size, drop_policy=policy, metrics=Metrics(), **kwargs)
+    # Park the worker on a first envelope so later ones stay queued
+    queue.put(Envelope({"text": "busy"}))
+    assert sender.started.wait(5)
+    return queue, sender
+
+
+def _drain(queue, sender):
+    sender.release.set()
+    assert queue.close(5)
+    return sender.sent[1:]
+
+
+@pytest.mark.parametrize("policy, delivered", [
+    (DropPolicy.DROP_OLDEST, ["b", "c"]),
+    (DropPolicy.DROP_NEWEST, ["a", "b"]),
+])
+def test_drop_policies(policy, delivered):
+    queue, sender = _queue(policy)
+    results = [queue.put(Envelope({"text": text})) for text in "abc"]
+
+    assert results == [True, True, policy is DropPolicy.DROP_OLDEST]
+    assert queue.dropped == 1
+    assert queue.metrics.snapshot()["dropped"]["queue_full"] == 1
+    assert _drain(queue, sender) == delivered
+
+
+def test_block_times_out():
+    queue, sender = _queue(DropPolicy.BLOCK, max_size=1, block_timeout=0.05)
+    assert queue.put(Envelope({"text": "a"}))
+    assert not queue.put(Envelope({"text": "b"}))
+    assert _drain(queue, sender) == ["a"]
+
+
+def test_higher_priority_evicts_lower():
+    queue, sender = _queue(DropPolicy.DROP_NEWEST)
+    queue.put(Envelope({"text": "info"}, priority=0))
+    queue.put(Envelope({"text": "error"}, priority=2))
+
+    assert queue.put(Envelope({"text": "critical"}, priority=3))
+    assert not queue.put(Envelope({"text": "info 2"}, priority=0))
+    assert _drain(queue, sender) == ["critical", "error"]
+
+
+def test_put_after_close_is_dropped():
+    queue, sender = _queue(DropPolicy.DROP_OLDEST)
+    _drain(queue, sender)
+    assert not queue.put(Envelope({"text": "late"}))
+    assert queue.metrics.snapshot()["dropped"]["queue_closed"] == 1
+
+
+def test_parse_policy():
+    assert DropPolicy.parse(" Drop_Newest ") is DropPolicy.DROP_NEWEST
+    with pytest.raises(ValueError):
+        DropPolicy.parse("sometimes")
@@ -0,0 +1,78 @@
+"""
+Tests for compiled message templates.
+"""
+
+import copy
+
+import pytest
+
+from slack_logger.formatter import LogLevel, SlackMessageFormatter
+from slack_logger.limits import MAX_HEADER_CHARS, fit_payload
+
+
+def _error():
+    try:
+        raise KeyError("missing")
+    except KeyError as e:
+        return e
+
+
+def test_templates_are_compiled_once_per_service_and_level():
+    template = SlackMessageFormatter.compile("svc", LogLevel.ERROR)
+    assert SlackMessageFormatter.compile("svc", LogLevel.ERROR) is template
+    assert SlackMessageFormatter.compile("svc", LogLevel.WARNING) is not template
+    assert SlackMessageFormatter.compile("other", LogLevel.ERROR) is not template
+
+
+@pytest.mark.parametrize("level, emoji", [
+    (LogLevel.INFO, "ℹ️"), (LogLevel.WARNING, "⚠️"), (LogLevel.ERROR, "❌"), (LogLevel.CRITICAL, "🚨"),
+])
+def test_header_and_fallback_text(level, emoji):
+    payload = SlackMessageFormatter.compile("svc", level).render("something happened")
+
+    header, divider, message, footer = payload["blocks"]
+    assert header["text"]["text"] == f"{emoji} {level.value.upper()}: svc"
+    assert divider == {"type": "divider"}
+    assert message["text"]["text"] == "*Message:*\nsomething happened"
+    assert footer["type"] == "context" and footer["elements"][0]["text"].endswith(" UTC")
+    assert payload["text"] == f"{level.value.upper()}: something happened"
+
+
+def test_exception_and_context_sections():
+    payload = SlackMessageFormatter.compile("svc", LogLevel.ERROR).render(
+        "lookup failed", exception=_error(), additional_context={"user_id": 42}
+    )
+
+    texts = [block["text"]["text"] for block in payload["blocks"] if block["type"] == "section"]
+    assert texts[0] == "*Message:*\nlookup failed"
+    assert texts[1] == "*Exception Type:* `KeyError`\n*Exception Message:* `'missing'`"
+    assert texts[2].startswith("*Stack Trace:*\n```Traceback (most recent call last):")
+    assert texts[2].endswith("KeyError: 'missing'\n```")
+    assert texts[3] == "*Additional Context:*\n• *user_id:* `42`\n"
+    assert payload["text"] == "ERROR: lookup failed (KeyError)"
+
+
+def test_render_matches_format_message():
+    error = _error()
+    compiled = SlackMessageFormatter.compile("svc", LogLevel.CRITICAL).render(
+        "boom", exception=error, additional_context={"a": [1, 2]}
+    )
+    formatted = SlackMessageFormatter.format_message(
+        "boom", LogLevel.CRITICAL, "svc", exception=error, additional_context={"a": [1, 2]}
+    )
+
+    # Everything but the timestamp footer
+    assert compiled["blocks"][:-1] == formatted["blocks"][:-1]
+    assert compiled["text"] == formatted["text"]
+
+
+def test_shared_blocks_are_never_modified():
+    template = SlackMessageFormatter.compile("s" * 200, LogLevel.ERROR)
+    header = copy.deepcopy(template.header)
+
+    payload = template.render("x" * 5000, additional_context={"k": "v"})
+    (fitted,) = fit_payload(payload)
+
+    assert len(fitted["blocks"][0]["text"]["text"]) == MAX_HEADER_CHARS
+    assert template.header == header
+    assert payload["blocks"][0] is template.header
@@ -0,0 +1,91 @@
+"""
+Tests for the standard library logging handler.
+"""
+
+import logging
+
+import pytest
+
+from slack_logger.formatter import LogLevel
+from slack_logger.handler import SlackLoggingHandler
+
+
+class _Recorder:
+    """Stands in for SlackLogger, keeping the arguments of every _log call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _log(self, **kwargs):
+        self.calls.append(kwargs)
+        return True
+
+    def flush(self, timeout=None):
+        return True
+
+
+@pytest.fixture
+def setup():
+    recorder = _Recorder()
+    handler = SlackLoggingHandler(recorder, level=logging.WARNING, exclude=("noisy",))
+    # Outside the logger hierarchy, so no other handler renders the records
+    log = logging.Logger("tests.handler", logging.DEBUG)
+    log.addHandler(handler)
+    return log, recorder
+
+
+def test_message_is_formatted_lazily(setup):
+    log, recorder = setup
+    rendered = []
+
+    class Arg:
+        def __str__(self):
+            rendered.append(self)
+            return "42"
+
+    log.error("order %s failed", Arg())
+
+    message = recorder.calls[0]["message"]
+    assert rendered == []
+    assert str(message) == "order 42 failed"
+    assert recorder.calls[0]["template"] == "order %s failed"
+
+
+def test_records_below_the_level_are_ignored(setup):
+    log, recorder = setup
+    log.info("not sent")
+    log.warning("sent")
+    log.critical("sent too")
+
+    assert [call["level"] for call in recorder.calls] == [LogLevel.WARNING, LogLevel.CRITICAL]
+
+
+def test_excluded_and_own_loggers_are_ignored():
+    recorder = _Recorder()
+    handler = SlackLoggingHandler(recorder, exclude=("noisy",))
+    for name in ("noisy", "noisy.child", "slack_logger.client"):
+        handler.handle(logging.LogRecord(name, logging.ERROR, __file__, 1, "x", (), None))
+    handler.handle(logging.LogRecord("noisy_neighbour", logging.ERROR, __file__, 1, "x", (), None))
+
+    assert len(recorder.calls) == 1
+
+
+def test_exc_info_becomes_the_exception(setup):
+    log, recorder = setup
+    try:
+        raise ValueError("bad input")
+    except ValueError as e:
+        error = e
+        log.exception("parsing failed")
+
+    assert recorder.calls[0]["exception"] is error
+    assert recorder.calls[0]["level"] is LogLevel.ERROR
+
+
+def test_extra_becomes_additional_context(setup):
+    log, recorder = setup
+    log.error("payment failed", extra={"user_id": 42, "order": "A-1"})
+    log.error("no extra")
+
+    assert recorder.calls[0]["additional_context"] == {"user_id": 42, "order": "A-1"}
+    assert recorder.calls[1]["additional_context"] is None
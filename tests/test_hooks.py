@@ -0,0 +1,43 @@
+"""
+Tests for the SIGTERM hook handing the signal on to the previous handler.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+
+_SCRIPT = """
+import os, signal, sys, time
+from slack_logger import SlackLogger
+from slack_logger.hooks import ExceptionHooks
+
+previous = {"none": None, "ign": signal.SIG_IGN, "dfl": signal.SIG_DFL}[sys.argv[1]]
+logger = SlackLogger(webhook_url="http://127.0.0.1:9/hooks", service_name="svc")
+hooks = ExceptionHooks(logger, flush_timeout=0.1).install()
+# None is what signal.signal returns for a handler installed outside Python
+hooks._previous_signal = previous
+os.kill(os.getpid(), signal.SIGTERM)
+time.sleep(0.5)
+print("survived")
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "kill") or sys.platform == "win32", reason="needs POSIX signals")
+@pytest.mark.parametrize("previous, terminated", [("none", True), ("dfl", True), ("ign", False)])
+def test_sigterm_terminates_unless_previously_ignored(previous, terminated):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, previous],
+        env={**os.environ, "PYTHONPATH": root},
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    if terminated:
+        assert result.returncode == -signal.SIGTERM
+        assert "survived" not in result.stdout
+    else:
+        assert result.returncode == 0 and "survived" in result.stdout
@@ -0,0 +1,49 @@
+"""
+Tests that importing slack_logger leaves optional and heavy modules unloaded.
+"""
+
+import json
+
+import pytest
+from conftest import run_python
+
+# Loaded on first use only
+LAZY_MODULES = (
+    "requests", "urllib3", "aiohttp", "asyncio", "orjson", "dotenv", "concurrent.futures",
+    "slack_logger.relay", "slack_logger.webapi", "slack_logger.async_logger", "slack_logger.async_client",
+)
+
+_PROBE = """
+import json, sys
+baseline = set(sys.modules)
+import slack_logger
+{setup}
+print(json.dumps([m for m in {lazy!r} if m in sys.modules and m not in baseline]))
+"""
+
+
+def _loaded(setup=""):
+    result = run_python(_PROBE.format(setup=setup, lazy=LAZY_MODULES))
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def test_import_loads_no_lazy_modules():
+    assert _loaded() == []
+
+
+def test_webhook_logger_loads_no_lazy_modules():
+    # Creating a logger (which reads .env) and formatting a message still
+    # needs no HTTP stack
+    loaded = _loaded(
+        "logger = slack_logger.SlackLogger(webhook_url='https://hooks.slack.com/services/T/B/X', service_name='svc')\n"
+        "logger._templates[slack_logger.logger.LogLevel.ERROR].render('boom', additional_context={'a': 1})\n"
+    )
+    assert set(loaded) <= {"dotenv"}
+
+
+@pytest.mark.parametrize("name, module", [
+    ("AsyncSlackLogger", "slack_logger.async_logger"),
+])
+def test_lazy_attribute_imports_on_access(name, module):
+    assert module in _loaded(f"getattr(slack_logger, {name!r})")
@@ -0,0 +1,121 @@
+"""
+Tests for priority lanes and drop policies when the queue overflows.
+"""
+
+import threading
+
+import pytest
+
+from slack_logger.delivery import LEVEL_PRIORITY, DeliveryQueue, DropPolicy
+from slack_logger.envelope import Envelope
+from slack_logger.formatter import LogLevel
+from slack_logger.metrics import Metrics
+
+INFO, WARNING, ERROR, CRITICAL = (LEVEL_PRIORITY[level] for level in LogLevel)
+
+
+class _Held:
+    """Sender that keeps the worker busy until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.sent = []
+
+    def __call__(self, envelope):
+        self.started.set()
+        self.release.wait(5)
+        self.sent.append(envelope.payload["text"])
+        return True
+
+
+@pytest.fixture
+def make_queue():
+    queues = []
+
+    def make(policy, max_size=4, **kwargs):
+        sender = _Held()
+        queue = DeliveryQueue(sender, max_size=max_size, drop_policy=policy, metrics=Metrics(), **kwargs)
+        queue.put(Envelope({"text": "busy"}))
+        assert sender.started.wait(5)
+        queues.append((queue, sender))
+        return queue, sender
+
+    yield make
+    for queue, sender in queues:
+        sender.release.set()
+        queue.close(5)
+
+
+def _put(queue, text, priority):
+    return queue.put(Envelope({"text": text}, priority=priority))
+
+
+def _drain(queue, sender):
+    sender.release.set()
+    assert queue.close(5)
+    return sender.sent[1:]
+
+
+def _fill(queue):
+    for text, priority in (("info 1", INFO), ("info 2", INFO), ("warning 1", WARNING), ("error 1", ERROR)):
+        assert _put(queue, text, priority)
+
+
+def test_lanes_drain_highest_first_and_in_order(make_queue):
+    queue, sender = make_queue(DropPolicy.DROP_OLDEST, max_size=10)
+    for text, priority in (("info 1", INFO), ("error 1", ERROR), ("critical", CRITICAL), ("info 2", INFO), ("error 2", ERROR)):
+        _put(queue, text, priority)
+
+    assert queue.depths() == [2, 0, 2, 1]
+    assert _drain(queue, sender) == ["critical", "error 1", "error 2", "info 1", "info 2"]
+
+
+def test_drop_oldest_evicts_oldest_of_the_lowest_lane(make_queue):
+    queue, sender = make_queue(DropPolicy.DROP_OLDEST)
+    _fill(queue)
+
+    assert _put(queue, "critical", CRITICAL)
+    assert _put(queue, "error 2", ERROR)
+    assert queue.depths() == [0, 1, 2, 1]
+    # The lowest lane is now WARNING; an INFO envelope is the one to go
+    assert not _put(queue, "info 3", INFO)
+    # Same lane as the lowest: the oldest of the lane goes
+    assert _put(queue, "warning 2", WARNING)
+
+    assert queue.metrics.snapshot()["dropped"]["queue_full"] == 4
+    assert _drain(queue, sender) == ["critical", "error 1", "error 2", "warning 2"]
+
+
+def test_drop_newest_evicts_newest_of_the_lowest_lane(make_queue):
+    queue, sender = make_queue(DropPolicy.DROP_NEWEST)
+    _fill(queue)
+
+    assert _put(queue, "critical", CRITICAL)
+    assert queue.depths() == [1, 1, 1, 1]
+    # Same lane as the lowest: the new envelope is the newest and goes
+    assert not _put(queue, "info 3", INFO)
+    assert _put(queue, "error 2", ERROR)
+
+    assert queue.dropped == 3
+    assert _drain(queue, sender) == ["critical", "error 1", "error 2", "warning 1"]
+
+
+def test_overflow_within_one_lane(make_queue):
+    queue, sender = make_queue(DropPolicy.DROP_OLDEST, max_size=2)
+    for i in range(5):
+        assert _put(queue, f"critical {i}", CRITICAL)
+
+    assert queue.dropped == 3
+    assert _drain(queue, sender) == ["critical 3", "critical 4"]
+
+
+def test_block_never_evicts(make_queue):
+    queue, sender = make_queue(DropPolicy.BLOCK, max_size=2, block_timeout=0.05)
+    assert _put(queue, "info 1", INFO)
+    assert _put(queue, "info 2", INFO)
+
+    # Even a CRITICAL envelope waits for room rather than evicting
+    assert not _put(queue, "critical", CRITICAL)
+    assert queue.metrics.snapshot()["dropped"]["queue_full"] == 1
+    assert _drain(queue, sender) == ["info 1", "info 2"]
@@ -0,0 +1,87 @@
+"""
+Tests for fitting payloads to Slack's block and text limits.
+"""
+
+from slack_logger.limits import (
+    MAX_BLOCKS, MAX_CONTEXT_ELEMENTS, MAX_HEADER_CHARS, MAX_SECTION_CHARS, MAX_TEXT_CHARS, fit_payload, split_text
+)
+
+
+def _header(text):
+    return {"type": "header", "text": {"type": "plain_text", "text": text}}
+
+
+def _section(text):
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _texts(payload):
+    return [block["text"]["text"] for block in payload["blocks"] if block["type"] == "section"]
+
+
+def test_payload_within_limits_is_returned_as_is():
+    payload = {"blocks": [_header("h" * MAX_HEADER_CHARS), _section("s" * MAX_SECTION_CHARS)], "text": "t"}
+    assert fit_payload(payload)[0] is payload
+
+
+def test_header_is_trimmed_at_the_limit():
+    template_block = _header("h" * (MAX_HEADER_CHARS + 1))
+    payload = {"blocks": [template_block]}
+    (fitted,) = fit_payload(payload)
+
+    text = fitted["blocks"][0]["text"]["text"]
+    assert len(text) == MAX_HEADER_CHARS
+    assert text.endswith("…")
+    # Templates share blocks; the original is left alone
+    assert len(template_block["text"]["text"]) == MAX_HEADER_CHARS + 1
+
+
+def test_long_section_is_split_without_losing_text():
+    lines = [f"line {i:05d}" for i in range(600)]
+    (fitted,) = fit_payload({"blocks": [_section("\n".join(lines))]})
+
+    texts = _texts(fitted)
+    assert len(texts) > 1
+    assert all(len(text) <= MAX_SECTION_CHARS for text in texts)
+    assert "\n".join(texts).split("\n") == lines
+
+
+def test_split_code_block_is_closed_and_reopened():
+    chunks = split_text("```" + "x = 1\n" * 1200 + "```", MAX_SECTION_CHARS)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert len(chunk) <= MAX_SECTION_CHARS
+        assert chunk.startswith("```") and chunk.endswith("```")
+
+
+def test_fifty_blocks_fit_in_one_message():
+    payload = {"blocks": [_section(str(i)) for i in range(MAX_BLOCKS)], "text": "t"}
+    assert fit_payload(payload) == [payload]
+
+
+def test_more_blocks_continue_in_further_messages():
+    blocks = [_section(str(i)) for i in range(MAX_BLOCKS * 2 + 5)]
+    messages = fit_payload({"blocks": blocks, "text": "boom"})
+
+    assert len(messages) == 3
+    assert all(len(message["blocks"]) <= MAX_BLOCKS for message in messages)
+    assert [text for message in messages for text in _texts(message)] == [str(i) for i in range(len(blocks))]
+    assert messages[0]["text"] == "boom"
+    for index, message in enumerate(messages[1:], 2):
+        assert message["blocks"][0]["type"] == "context"
+        assert f"({index}/3)" in message["blocks"][0]["elements"][0]["text"]
+        assert message["text"] == f"boom (continued {index}/3)"
+
+
+def test_context_elements_and_fallback_text_are_trimmed():
+    context = {
+        "type": "context",
+        "elements": [{"type": "mrkdwn", "text": "e" * (MAX_SECTION_CHARS + 10)}] * (MAX_CONTEXT_ELEMENTS + 2),
+    }
+    (fitted,) = fit_payload({"blocks": [context], "text": "t" * (MAX_TEXT_CHARS + 1)})
+
+    elements = fitted["blocks"][0]["elements"]
+    assert len(elements) == MAX_CONTEXT_ELEMENTS
+    assert all(len(element["text"]) == MAX_SECTION_CHARS for element in elements)
+    assert len(fitted["text"]) == MAX_TEXT_CHARS
@@ -0,0 +1,61 @@
+"""
+Tests for closing loggers, directly and at interpreter exit.
+"""
+
+from conftest import run_python
+
+from slack_logger import logger as logger_module
+from slack_logger.logger import SlackLogger, close_all_loggers
+
+
+def test_close_all_loggers_closes_open_loggers(stub):
+    first = SlackLogger(webhook_url=stub.url, service_name="svc")
+    second = SlackLogger(webhook_url=stub.url, service_name="svc")
+    assert first in logger_module._live_loggers
+    assert second in logger_module._live_loggers
+
+    second.close()
+    assert second not in logger_module._live_loggers
+
+    assert close_all_loggers(5)
+    assert first not in logger_module._live_loggers
+
+
+def test_queued_messages_are_delivered_at_exit(stub):
+    result = run_python(
+        "import sys\n"
+        "from slack_logger import SlackLogger\n"
+        "logger = SlackLogger(webhook_url=sys.argv[1], service_name='svc')\n"
+        "for i in range(3):\n"
+        "    logger.error(f'boom {i}', async_send=True)\n",
+        stub.url
+    )
+    assert result.returncode == 0, result.stderr
+    assert stub.counts["ok"] == 3
+
+
+def test_duplicate_summary_is_sent_at_exit(stub):
+    result = run_python(
+        "import sys\n"
+        "from slack_logger import SlackLogger\n"
+        "logger = SlackLogger(webhook_url=sys.argv[1], service_name='svc', dedupe_window=60)\n"
+        "for _ in range(5):\n"
+        "    logger.error('boom')\n",
+        stub.url
+    )
+    assert result.returncode == 0, result.stderr
+    # The first occurrence, then the "4 more occurrences" summary
+    assert stub.counts["ok"] == 2
+
+
+def test_pending_digest_is_sent_at_exit(stub):
+    result = run_python(
+        "import sys\n"
+        "from slack_logger import SlackLogger\n"
+        "logger = SlackLogger(webhook_url=sys.argv[1], service_name='svc', digest_interval=60)\n"
+        "for i in range(5):\n"
+        "    logger.error(f'boom {i}')\n",
+        stub.url
+    )
+    assert result.returncode == 0, result.stderr
+    assert stub.counts["ok"] == 1
@@ -0,0 +1,102 @@
+"""
+Tests for the Prometheus text exposition output.
+"""
+
+import re
+
+from slack_logger.metrics import BUCKETS, DROP_REASONS, Metrics, render_prometheus
+
+# name{labels} value, per the text exposition format
+_SAMPLE = re.compile(
+    r'^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)'
+    r'\{(?P<labels>[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\\n]|\\[\\"n])*"(?:,[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\\n]|\\[\\"n])*")*)\}'
+    r' (?P<value>[-+]?(?:[0-9.]+(?:e[-+]?[0-9]+)?|Inf|NaN))$'
+)
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def _parse(text):
+    """Return {family: {"help", "type", "samples": [(name, labels, value)]}}, checking the layout."""
+    assert text.endswith("\n")
+    families = {}
+    current = None
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            name, help_text = line[len("# HELP "):].split(" ", 1)
+            assert name not in families, f"family {name} declared twice"
+            current = families[name] = {"help": help_text, "type": None, "samples": []}
+        elif line.startswith("# TYPE "):
+            name, kind = line[len("# TYPE "):].split(" ")
+            assert name in families and families[name]["type"] is None
+            assert kind in ("counter", "gauge", "histogram")
+            current["type"] = kind
+        else:
+            match = _SAMPLE.match(line)
+            assert match, f"malformed sample line: {line!r}"
+            name = match.group("name")
+            family = families[max((f for f in families if name.startswith(f)), key=len)]
+            assert family is current, f"{name} is not under its family's TYPE line"
+            labels = dict(_LABEL.findall(match.group("labels")))
+            family["samples"].append((name, labels, float(match.group("value"))))
+    return families
+
+
+def _metrics(service="checkout"):
+    metrics = Metrics(service)
+    metrics.inc("sent", 3)
+    metrics.drop("queue_full", 2)
+    for seconds in (0.003, 0.2, 0.2, 20.0):
+        metrics.observe("http", seconds)
+    metrics.gauge("queue_depth", lambda: 7)
+    return metrics
+
+
+def test_every_line_is_valid_exposition():
+    families = _parse(render_prometheus(_metrics()))
+
+    assert families["slack_logger_sent_total"]["type"] == "counter"
+    assert families["slack_logger_stage_duration_seconds"]["type"] == "histogram"
+    assert families["slack_logger_queue_depth"]["type"] == "gauge"
+    assert ("slack_logger_sent_total", {"service": "checkout"}, 3.0) in families["slack_logger_sent_total"]["samples"]
+
+
+def test_dropped_has_one_sample_per_reason():
+    samples = _parse(render_prometheus(_metrics()))["slack_logger_dropped_total"]["samples"]
+
+    assert [labels["reason"] for _, labels, _ in samples] == list(DROP_REASONS)
+    assert {labels["reason"]: value for _, labels, value in samples}["queue_full"] == 2
+
+
+def test_histogram_buckets_are_cumulative():
+    samples = _parse(render_prometheus(_metrics()))["slack_logger_stage_duration_seconds"]["samples"]
+    http = [(name, labels, value) for name, labels, value in samples if labels["stage"] == "http"]
+
+    buckets = [(labels["le"], value) for name, labels, value in http if name.endswith("_bucket")]
+    assert [le for le, _ in buckets] == [f"{bound:g}" for bound in BUCKETS] + ["+Inf"]
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    assert dict(buckets)["0.005"] == 1 and dict(buckets)["0.25"] == 3 and dict(buckets)["10"] == 3
+    totals = {name: value for name, _, value in http if not name.endswith("_bucket")}
+    assert counts[-1] == totals["slack_logger_stage_duration_seconds_count"] == 4
+    assert abs(totals["slack_logger_stage_duration_seconds_sum"] - 20.403) < 1e-9
+
+
+def test_several_loggers_share_one_family():
+    text = render_prometheus(_metrics("a"), _metrics("b"))
+    families = _parse(text)
+
+    services = [labels["service"] for _, labels, _ in families["slack_logger_sent_total"]["samples"]]
+    assert services == ["a", "b"]
+    assert text.count("# TYPE slack_logger_sent_total ") == 1
+
+
+def test_label_values_are_escaped():
+    families = _parse(render_prometheus(_metrics('say "hi"\\\nbye')))
+    (_, labels, _), = families["slack_logger_sent_total"]["samples"]
+    assert labels["service"] == 'say \\"hi\\"\\\\\\nbye'
+
+
+def test_custom_prefix():
+    families = _parse(render_prometheus(_metrics(), prefix="app_slack"))
+    assert "app_slack_sent_total" in families
+    assert not any(name.startswith("slack_logger") for name in families)
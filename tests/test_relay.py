@@ -0,0 +1,83 @@
+"""
+Tests for the host-local relay, against a local stub webhook.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from conftest import run_python
+
+from slack_logger.formatter import LogLevel
+from slack_logger.relay import RelayServer, RelayTransport
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def _run(loop, coroutine):
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result(10)
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_relay_delivers_messages_from_workers(tmp_path, loop, stub):
+    socket_path = str(tmp_path / "relay.sock")
+    relay = RelayServer(socket_path, default_webhook_url=stub.url, batch_size=1, dedupe_window=0)
+    _run(loop, relay.start())
+
+    transport = RelayTransport(socket_path)
+    for i in range(3):
+        assert transport.send(stub.url, {"text": f"message {i}"})
+    transport.close()
+
+    assert _wait_for(lambda: relay.stats["sent"] == 3)
+    _run(loop, relay.stop(5))
+    assert stub.counts["ok"] == 3
+    assert relay.stats["received"] == 3
+
+
+def test_relay_suppresses_duplicates_across_workers(tmp_path, loop, stub):
+    socket_path = str(tmp_path / "relay.sock")
+    relay = RelayServer(socket_path, default_webhook_url=stub.url, batch_size=1, dedupe_window=60)
+    _run(loop, relay.start())
+
+    workers = [RelayTransport(socket_path) for _ in range(3)]
+    for worker in workers:
+        assert worker.send(stub.url, {"text": "boom"}, fingerprint="abc", level=LogLevel.ERROR, message="boom")
+        worker.close()
+
+    assert _wait_for(lambda: relay.stats["received"] == 3)
+    _run(loop, relay.stop(5))
+    # The first message, then "2 more occurrences" when the relay stops
+    assert relay.stats["suppressed"] == 2
+    assert stub.counts["ok"] == 2
+
+
+def test_transport_reports_a_missing_relay(tmp_path):
+    assert not RelayTransport(str(tmp_path / "missing.sock")).send("https://example.invalid", {"text": "x"})
+
+
+def test_relay_runs_without_aiohttp():
+    result = run_python(
+        "import sys\n"
+        "sys.modules['aiohttp'] = None\n"
+        "from slack_logger.relay import main\n"
+        "main(['--help'])\n"
+    )
+    assert result.returncode == 0, result.stderr
+    assert "slack-logger-relay" in result.stdout
@@ -0,0 +1,118 @@
+"""
+Tests for the retry policy and deadline, with a fake clock.
+"""
+
+import random
+
+import pytest
+
+from slack_logger import client as client_module
+from slack_logger import retry as retry_module
+from slack_logger.client import SendResult, SlackWebhookClient
+from slack_logger.retry import RetryPolicy
+
+
+class _FakeClock:
+    """Stands in for the time module; sleeping just advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    perf_counter = monotonic
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(retry_module, "time", clock)
+    monkeypatch.setattr(client_module, "time", clock)
+    return clock
+
+
+class _Response:
+    status_code = 500
+    headers = {}
+    text = "server error"
+
+
+class _FailingTransport:
+    """Answers every post with a 500 after ``latency`` fake seconds."""
+
+    def __init__(self, clock, latency):
+        self.clock = clock
+        self.latency = latency
+        self.timeouts = []
+
+    def post(self, url, data, timeout, headers):
+        self.timeouts.append(timeout)
+        self.clock.now += min(self.latency, timeout)
+        return _Response()
+
+
+def _client(clock, policy, latency=0.5):
+    client = SlackWebhookClient("https://hooks.slack.com/services/T/B/X", timeout=10, retry_policy=policy)
+    client.transport = _FailingTransport(clock, latency)
+    client.rate_limiter = None
+    client.breaker = None
+    return client
+
+
+@pytest.mark.parametrize("attempt", range(12))
+def test_full_jitter_stays_within_bounds(attempt):
+    policy = RetryPolicy(base_delay=0.5, max_delay=30)
+    ceiling = min(30, 0.5 * 2 ** attempt)
+    random.seed(attempt)
+    delays = [policy.backoff(attempt) for _ in range(2000)]
+
+    assert all(0 <= delay <= ceiling for delay in delays)
+    # Full jitter spreads over the whole range, not just its upper half
+    assert min(delays) < ceiling * 0.05
+    assert max(delays) > ceiling * 0.95
+
+
+def test_backoff_is_capped_for_large_attempts():
+    assert RetryPolicy(base_delay=1, max_delay=5).backoff(10_000) <= 5
+
+
+def test_deadline_counts_down(clock):
+    deadline = RetryPolicy(deadline=5).start()
+    assert deadline.remaining() == 5
+    clock.now += 3
+    assert deadline.remaining() == 2 and not deadline.expired
+    clock.now += 3
+    assert deadline.remaining() == 0 and deadline.expired
+
+
+def test_retries_stop_at_the_deadline(clock):
+    policy = RetryPolicy(max_attempts=50, base_delay=1, max_delay=2, deadline=6)
+    client = _client(clock, policy)
+    started = clock.now
+
+    assert client.deliver({"text": "x"}) is SendResult.FAILED
+    assert 1 < len(client.transport.timeouts) < 50
+    # Never sleeps or waits past the deadline
+    assert clock.now - started <= 6
+
+
+def test_attempt_timeout_is_capped_by_remaining_budget(clock):
+    policy = RetryPolicy(max_attempts=3, base_delay=0, deadline=4)
+    client = _client(clock, policy, latency=1.5)
+
+    client.deliver({"text": "x"})
+    assert client.transport.timeouts == [4, 2.5, 1]
+
+
+def test_max_attempts_bounds_retries(clock):
+    client = _client(clock, RetryPolicy(max_attempts=3, base_delay=0.01, deadline=600))
+
+    assert client.deliver({"text": "x"}) is SendResult.FAILED
+    assert len(client.transport.timeouts) == 3
+    assert len(clock.sleeps) == 2
@@ -0,0 +1,109 @@
+"""
+Tests for routing and fan-out to several webhooks.
+"""
+
+import threading
+
+import pytest
+
+from slack_logger import SlackLogger
+from slack_logger.client import SendResult
+from slack_logger.formatter import LogLevel
+from slack_logger.routing import Route, RoutingTable
+
+OPS = "http://127.0.0.1:9/routing/ops"
+PAGER = "http://127.0.0.1:9/routing/pager"
+BILLING = "http://127.0.0.1:9/routing/billing"
+
+TABLE = RoutingTable([
+    Route(OPS, min_level="warning"),
+    Route([PAGER, OPS], levels=["critical"]),
+    Route(BILLING, services=["billing"], context={"customer": Route.ANY}),
+])
+
+
+@pytest.mark.parametrize("level, service, context, expected", [
+    (LogLevel.INFO, "api", None, ()),
+    (LogLevel.ERROR, "api", None, (OPS,)),
+    (LogLevel.CRITICAL, "api", None, (OPS, PAGER)),
+    (LogLevel.INFO, "billing", {"customer": 7}, (BILLING,)),
+    (LogLevel.ERROR, "billing", {"order": 7}, (OPS,)),
+])
+def test_resolve(level, service, context, expected):
+    assert TABLE.resolve(level, service, context) == expected
+
+
+def test_context_predicates():
+    table = RoutingTable([Route(OPS, context={"status": lambda status: status >= 500})])
+    assert table.resolve(LogLevel.INFO, "api", {"status": 503}) == (OPS,)
+    assert table.resolve(LogLevel.INFO, "api", {"status": 404}) == ()
+    # A predicate that raises doesn't match
+    assert table.resolve(LogLevel.INFO, "api", {"status": "?"}) == ()
+
+
+def test_from_json():
+    table = RoutingTable.from_json(
+        '[{"webhooks": ["%s"], "levels": ["error"], "context": {"customer": "*"}}]' % OPS
+    )
+    assert table.resolve(LogLevel.ERROR, "api", {"customer": 1}) == (OPS,)
+    assert table.webhooks == [OPS]
+    with pytest.raises(ValueError):
+        RoutingTable.from_json('[{"levels": ["error"]}]')
+    with pytest.raises(ValueError):
+        Route(OPS, levels=["loud"])
+
+
+def test_fan_out_reaches_every_destination():
+    logger = SlackLogger(
+        webhook_url="http://127.0.0.1:9/routing/default", service_name="api", routes=TABLE
+    )
+    sent = []
+    lock = threading.Lock()
+
+    def recorder(url):
+        def deliver(payload, *args):
+            with lock:
+                sent.append(url)
+            return SendResult.SENT
+        return deliver
+
+    for url in (logger.client.webhook_url, OPS, PAGER, BILLING):
+        logger._clients[url].deliver = recorder(url)
+    try:
+        assert logger.critical("disk full")
+        assert sorted(sent) == sorted([OPS, PAGER])
+        sent.clear()
+        assert logger.info("hello")
+        assert sent == [logger.client.webhook_url]
+    finally:
+        logger.close()
+
+
+def test_fallback_and_replay_only_cover_failed_destinations(tmp_path):
+    logger = SlackLogger(
+        webhook_url="http://127.0.0.1:9/routing/spooled", service_name="api",
+        routes=TABLE, spool_dir=str(tmp_path), fallback="spool"
+    )
+    sent = []
+    results = {OPS: SendResult.SENT, PAGER: SendResult.CIRCUIT_OPEN}
+
+    def recorder(url):
+        def deliver(payload, *args):
+            if results[url] is SendResult.SENT:
+                sent.append(url)
+            return results[url]
+        return deliver
+
+    for url in (OPS, PAGER):
+        logger._clients[url].deliver = recorder(url)
+    try:
+        assert logger.critical("disk full")
+        assert sent == [OPS]
+        assert len(logger.spool) == 1
+
+        results[PAGER] = SendResult.SENT
+        logger._replay_spool()
+        assert sorted(sent) == [OPS, PAGER]
+        assert len(logger.spool) == 0
+    finally:
+        logger.close()
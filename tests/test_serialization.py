@@ -0,0 +1,79 @@
+"""
+Tests that the orjson and stdlib encoders produce the same payloads.
+"""
+
+import dataclasses
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+
+from slack_logger import serialization
+from slack_logger.formatter import LogLevel, SlackMessageFormatter
+
+orjson = pytest.importorskip("orjson")
+
+
+@pytest.fixture
+def encoders(monkeypatch):
+    monkeypatch.setattr(serialization, "_dumps", None)
+    assert serialization.encoder_name() == "orjson"
+    return serialization.dumps, serialization._stdlib_dumps
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+
+
+class _Custom:
+    def __str__(self):
+        return "custom"
+
+
+def _payload():
+    try:
+        raise ValueError("bad value ✗")
+    except ValueError as e:
+        error = e
+    return SlackMessageFormatter.format_message(
+        "Payment failed for order 81723 — retrying ✓",
+        LogLevel.ERROR,
+        "checkout-service",
+        exception=error,
+        additional_context={"user_id": 42, "ratio": 0.25, "tags": ["a", "b"], "quote": '"x"\n\t'},
+    )
+
+
+def test_slack_payload_bytes_are_identical(encoders):
+    fast, stdlib = encoders
+    payload = _payload()
+    assert fast(payload) == stdlib(payload)
+
+
+@pytest.mark.parametrize("value", [
+    "héllo ✓   \x00 \"quoted\" \\",
+    [1, -2, 2 ** 63 - 1, 1.5, 0.1, True, False, None],
+    {"nested": {"list": [{"deep": "x"}]}},
+    (1, 2),
+    {1: "int key", 2.5: "float key"},
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    datetime.date(2024, 1, 2),
+    uuid.UUID(int=1),
+    decimal.Decimal("1.50"),
+    _Point(3),
+    _Custom(),
+    2 ** 70,
+])
+def test_encoders_agree(encoders, value):
+    fast, stdlib = encoders
+    payload = {"value": value}
+    assert json.loads(fast(payload)) == json.loads(stdlib(payload))
+
+
+def test_output_is_compact_utf8(encoders):
+    fast, stdlib = encoders
+    for dumps in (fast, stdlib):
+        assert dumps({"text": "é", "n": [1, 2]}) == '{"text":"é","n":[1,2]}'.encode("utf-8")
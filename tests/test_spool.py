@@ -0,0 +1,249 @@
+"""
+Tests for the on-disk spool.
+"""
+
+import os
+import time
+
+import pytest
+from conftest import run_python
+
+from slack_logger import SlackLogger
+from slack_logger.client import SendResult, SlackWebhookClient
+from slack_logger.retry import RetryPolicy
+from slack_logger.spool import FsyncPolicy, Spool
+
+
+def _open(directory, **kwargs):
+    kwargs.setdefault("fsync", FsyncPolicy.NONE)
+    return Spool(str(directory), **kwargs)
+
+
+def test_unacked_payloads_survive_reopen(tmp_path):
+    spool = _open(tmp_path)
+    first = spool.append({"text": "one"})
+    spool.append({"text": "two"})
+    spool.ack(first)
+    spool.close()
+
+    reopened = _open(tmp_path)
+    assert len(reopened) == 1
+    assert [payload for _, payload in reopened.pending()] == [{"text": "two"}]
+
+
+def test_ids_keep_increasing_across_reopen(tmp_path):
+    spool = _open(tmp_path)
+    last = spool.append({"text": "one"})
+    spool.close()
+
+    assert _open(tmp_path).append({"text": "two"}) > last
+
+
+def test_ack_is_idempotent(tmp_path):
+    spool = _open(tmp_path)
+    record_id = spool.append({"text": "one"})
+    spool.ack(record_id)
+    spool.ack(record_id)
+    assert len(spool) == 0
+
+
+def test_torn_record_is_ignored(tmp_path):
+    spool = _open(tmp_path)
+    spool.append({"text": "one"})
+    spool.close()
+    segment = sorted(os.listdir(tmp_path))[-1]
+    with open(tmp_path / segment, "ab") as f:
+        f.write(b'P 99 {"text": "tor')
+
+    assert [payload for _, payload in _open(tmp_path).pending()] == [{"text": "one"}]
+
+
+def test_acknowledged_segments_are_deleted(tmp_path):
+    spool = _open(tmp_path, segment_bytes=64)
+    ids = [spool.append({"text": "x" * 40}) for _ in range(5)]
+    assert len(os.listdir(tmp_path)) > 2
+
+    for record_id in ids:
+        spool.ack(record_id)
+    assert len(os.listdir(tmp_path)) <= 2
+    assert len(spool) == 0
+
+
+def test_oldest_segment_is_discarded_over_max_bytes(tmp_path):
+    spool = _open(tmp_path, segment_bytes=64, max_bytes=200)
+    ids = [spool.append({"text": "x" * 40}) for _ in range(10)]
+
+    assert spool.size <= 200 + 64
+    spool.close()
+    kept = [record_id for record_id, _ in _open(tmp_path, max_bytes=200).pending()]
+    assert kept and ids[0] not in kept and ids[-1] in kept
+
+
+def test_defer_merged_payload_replaces_its_records(tmp_path):
+    spool = _open(tmp_path)
+    ids = [spool.append({"text": "one"}), spool.append({"text": "two"})]
+    spool.defer(ids, {"text": "one\ntwo"})
+
+    assert len(spool) == 1
+    assert [payload for _, payload in spool.pending()] == [{"text": "one\ntwo"}]
+
+
+def test_replay_acks_delivered_payloads(tmp_path):
+    spool = _open(tmp_path)
+    for text in ("one", "two"):
+        spool.append({"text": text})
+    spool.close()
+
+    reopened = _open(tmp_path)
+    sent = []
+    assert reopened.replay(lambda payload, url: sent.append(payload) or True, rate=0) == 2
+    assert sent == [{"text": "one"}, {"text": "two"}]
+    assert len(reopened) == 0 and reopened.pending() == []
+
+
+def test_replay_keeps_payloads_after_a_failure(tmp_path):
+    spool = _open(tmp_path)
+    for text in ("one", "two"):
+        spool.append({"text": text})
+    spool.close()
+
+    reopened = _open(tmp_path)
+    assert reopened.replay(lambda payload, url: False, rate=0) == 0
+    assert len(reopened.pending()) == 2
+
+
+def test_replay_skips_rejected_payloads(tmp_path):
+    spool = _open(tmp_path)
+    for text in ("one", "poison", "two"):
+        spool.append({"text": text})
+    spool.close()
+
+    reopened = _open(tmp_path)
+    sent = []
+
+    def deliver(payload, url):
+        if payload["text"] == "poison":
+            return SendResult.REJECTED
+        sent.append(payload["text"])
+        return SendResult.SENT
+
+    assert reopened.replay(deliver, rate=0) == 2
+    assert sent == ["one", "two"]
+    assert len(reopened) == 0
+
+
+def test_replay_stops_at_a_retryable_failure(tmp_path):
+    spool = _open(tmp_path)
+    for text in ("one", "two", "three"):
+        spool.append({"text": text})
+    spool.close()
+
+    reopened = _open(tmp_path)
+    results = iter([SendResult.SENT, SendResult.FAILED])
+    assert reopened.replay(lambda payload, url: next(results), rate=0) == 1
+    assert [payload["text"] for _, payload in reopened.pending()] == ["two", "three"]
+
+
+def test_replay_sends_routed_payloads_to_their_webhooks(tmp_path):
+    spool = _open(tmp_path)
+    spool.append({"text": "default"})
+    spool.append({"text": "routed"}, ["https://a", "https://b"])
+    spool.close()
+
+    reopened = _open(tmp_path)
+    sent = []
+    assert reopened.replay(lambda payload, url: sent.append((payload["text"], url)) or True, rate=0) == 2
+    assert sent == [("default", None), ("routed", "https://a"), ("routed", "https://b")]
+
+
+def test_partial_replay_keeps_only_the_missing_webhooks(tmp_path):
+    spool = _open(tmp_path)
+    spool.append({"text": "routed"}, ["https://a", "https://b", "https://c"])
+    spool.close()
+
+    reopened = _open(tmp_path)
+    results = {"https://a": SendResult.SENT, "https://b": SendResult.REJECTED, "https://c": SendResult.FAILED}
+    assert reopened.replay(lambda payload, url: results[url], rate=0) == 0
+    reopened.close()
+
+    sent = []
+    again = _open(tmp_path)
+    assert again.replay(lambda payload, url: sent.append(url) or True, rate=0) == 1
+    assert sent == ["https://c"]
+
+
+def test_defer_narrows_destinations(tmp_path):
+    spool = _open(tmp_path)
+    record_id = spool.append({"text": "routed"}, ["https://a", "https://b"])
+    spool.defer([record_id], {"text": "routed"}, ["https://b"])
+    spool.close()
+
+    sent = []
+    _open(tmp_path).replay(lambda payload, url: sent.append(url) or True, rate=0)
+    assert sent == ["https://b"]
+
+
+def _logger_with_spooled(tmp_path, monkeypatch, text, results):
+    """Start a logger on a spool holding ``text``; sends return ``results[text]``."""
+    spool = _open(tmp_path)
+    spool.append({"text": text})
+    spool.close()
+
+    attempts = []
+
+    def deliver(client, payload):
+        attempts.append(payload["text"])
+        return results.get(payload["text"], SendResult.SENT)
+
+    monkeypatch.setattr(SlackWebhookClient, "deliver", deliver)
+    policy = RetryPolicy(max_attempts=1)
+    policy.backoff = lambda attempt: 60.0
+    logger = SlackLogger(
+        webhook_url=f"http://127.0.0.1:9/spool/{tmp_path.name}", service_name="svc",
+        spool_dir=str(tmp_path), retry_policy=policy
+    )
+    # Wait for the startup replay
+    deadline = time.monotonic() + 5
+    while (not attempts or logger._replay_lock.locked()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return logger, attempts
+
+
+def test_logger_discards_rejected_record(tmp_path, monkeypatch):
+    logger, attempts = _logger_with_spooled(tmp_path, monkeypatch, "poison", {"poison": SendResult.REJECTED})
+    try:
+        for index in range(3):
+            assert logger.info(f"message {index}")
+        assert attempts.count("poison") == 1
+        assert len(logger.spool) == 0
+    finally:
+        logger.close()
+
+
+def test_logger_backs_off_failed_replays(tmp_path, monkeypatch):
+    logger, attempts = _logger_with_spooled(tmp_path, monkeypatch, "stuck", {"stuck": SendResult.FAILED})
+    try:
+        for index in range(3):
+            assert logger.info(f"message {index}")
+        time.sleep(0.05)
+        assert attempts.count("stuck") == 1
+        assert [payload["text"] for _, payload in logger.spool.pending()] == ["stuck"]
+    finally:
+        logger.close()
+
+
+def test_directory_is_locked_while_open(tmp_path):
+    spool = _open(tmp_path)
+    with pytest.raises(RuntimeError):
+        _open(tmp_path)
+
+    spool.close()
+    _open(tmp_path).close()
+
+
+def test_directory_is_locked_across_processes(tmp_path):
+    spool = _open(tmp_path)
+    result = run_python("import sys\nfrom slack_logger.spool import Spool\nSpool(sys.argv[1])\n", str(tmp_path))
+    assert result.returncode != 0
+    assert "in use by another spool" in result.stderr
+    spool.close()
@@ -0,0 +1,107 @@
+"""
+Tests for bounded traceback rendering.
+"""
+
+import pytest
+
+from slack_logger.tracebacks import TracebackRenderer
+
+
+def _raise_at_depth(depth):
+    if depth == 0:
+        raise ValueError("bottom")
+    return _hop(depth - 1)
+
+
+def _hop(depth):
+    return _raise_at_depth(depth)
+
+
+def _caught(func, *args):
+    try:
+        func(*args)
+    except Exception as e:
+        return e
+    raise AssertionError("no exception raised")
+
+
+def _chained():
+    try:
+        _raise_at_depth(2)
+    except ValueError as e:
+        raise RuntimeError("wrapper") from e
+
+
+def _during_handling():
+    try:
+        _raise_at_depth(2)
+    except ValueError:
+        raise KeyError("cleanup failed")
+
+
+def test_innermost_frames_are_kept_and_outer_ones_counted():
+    renderer = TracebackRenderer(max_chars=600)
+    text = renderer.render(_caught(_raise_at_depth, 200))
+
+    lines = text.splitlines()
+    assert lines[0] == "Traceback (most recent call last):"
+    assert "outer frames omitted" in lines[1]
+    # The raising frame is last, right before the exception line
+    assert "in _raise_at_depth" in lines[-3]
+    assert 'raise ValueError("bottom")' in lines[-2]
+    assert lines[-1] == "ValueError: bottom"
+
+
+@pytest.mark.parametrize("max_chars", [300, 600, 3000])
+def test_output_stays_within_max_chars(max_chars):
+    text = TracebackRenderer(max_chars=max_chars).render(_caught(_raise_at_depth, 500))
+    assert len(text) <= max_chars
+
+
+def test_omitted_count_adds_up():
+    error = _caught(_raise_at_depth, 100)
+    text = TracebackRenderer(max_chars=800).render(error)
+
+    omitted = int(text.split("... ")[1].split(" outer")[0])
+    shown = text.count('  File "')
+    total = 0
+    tb = error.__traceback__
+    while tb is not None:
+        total += 1
+        tb = tb.tb_next
+    assert omitted + shown == total
+
+
+def test_capture_keeps_only_renderable_frames():
+    renderer = TracebackRenderer(max_chars=600)
+    snapshot = renderer.capture(_caught(_raise_at_depth, 200))
+
+    assert len(snapshot.frames) == renderer.max_frames
+    assert snapshot.frame_count > renderer.max_frames
+    assert snapshot.frames[-1][0].co_name == "_raise_at_depth"
+    assert renderer.render(snapshot) == renderer.render(_caught(_raise_at_depth, 200))
+
+
+def test_direct_cause_is_rendered_first():
+    text = TracebackRenderer().render(_caught(_chained))
+
+    cause = text.index("ValueError: bottom")
+    separator = text.index("The above exception was the direct cause")
+    wrapper = text.index("RuntimeError: wrapper")
+    assert cause < separator < wrapper
+
+
+def test_context_is_rendered_first():
+    text = TracebackRenderer().render(_caught(_during_handling))
+
+    assert text.index("ValueError: bottom") < text.index("During handling") < text.index("KeyError")
+
+
+def test_repeated_frames_are_collapsed():
+    def recurse(n):
+        if n == 0:
+            raise ValueError("deep")
+        return recurse(n - 1)
+
+    text = TracebackRenderer().render(_caught(recurse, 50))
+    assert "[Previous line repeated" in text
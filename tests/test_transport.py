@@ -0,0 +1,57 @@
+"""
+Tests for the pooled keep-alive transport, against a local stub webhook.
+"""
+
+import threading
+
+from slack_logger.client import SlackWebhookClient
+from slack_logger.transport import get_transport
+
+from stub_server import StubWebhook
+
+
+def _client(url, pool_size=10):
+    client = SlackWebhookClient(url, pool_size=pool_size)
+    client.rate_limiter = None
+    return client
+
+
+def test_clients_of_one_host_share_a_transport(stub):
+    first = _client(stub.url)
+    second = _client(stub.url.replace("/services/", "/services/other/"))
+    assert first.transport is second.transport
+    assert get_transport(stub.url) is first.transport
+
+    with StubWebhook() as other:
+        assert _client(other.url).transport is not first.transport
+
+
+def test_sequential_posts_reuse_one_connection(stub):
+    client = _client(stub.url)
+    for i in range(20):
+        assert client.send({"text": f"message {i}"})
+
+    stats = client.transport.stats()
+    assert stub.counts["ok"] == 20
+    assert stats["requests"] == 20
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 19
+
+
+def test_concurrent_posts_stay_within_the_pool(stub):
+    client = _client(stub.url, pool_size=4)
+
+    def post():
+        for _ in range(10):
+            client.send({"text": "x"})
+
+    threads = [threading.Thread(target=post) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    stats = client.transport.stats()
+    assert stub.counts["ok"] == 40
+    assert stats["connections_opened"] <= 4
+    assert stats["connections_reused"] >= 36
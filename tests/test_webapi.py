@@ -0,0 +1,61 @@
+"""
+Tests for threading recurring errors through the Web API client.
+"""
+
+import json
+import threading
+import time
+
+from slack_logger.client import SendResult
+from slack_logger.limits import MAX_BLOCKS
+from slack_logger.webapi import SlackWebAPIClient
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+def _client(name, latency=0.0):
+    client = SlackWebAPIClient("xoxb-test", name, api_url="http://127.0.0.1:9/api", update_interval=60)
+    client.calls = []
+
+    def send_body(url, body, headers):
+        client.calls.append((url.rsplit("/", 1)[-1], body))
+        time.sleep(latency)
+        return SendResult.SENT, _Response({"ok": True, "channel": "C1", "ts": str(len(client.calls))})
+
+    client._send_body = send_body
+    return client
+
+
+def test_concurrent_first_occurrences_post_one_parent():
+    client = _client("#race", latency=0.05)
+    threads = [
+        threading.Thread(target=client.send, args=({"text": "boom"}, ("fp", "boom")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert [method for method, _ in client.calls] == ["chat.postMessage"]
+    assert client._threads["fp"].count == 5
+
+
+def test_counter_edit_stays_within_block_limit():
+    client = _client("#blocks")
+    blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": str(i)}} for i in range(MAX_BLOCKS)]
+    assert client.send({"text": "boom", "blocks": blocks}, ("fp", "boom"))
+    assert client.send({"text": "boom", "blocks": blocks}, ("fp", "boom"))
+    assert client.flush_updates(5)
+
+    method, body = client.calls[-1]
+    assert method == "chat.update"
+    blocks = json.loads(body)["blocks"]
+    assert len(blocks) == MAX_BLOCKS
+    assert "Occurred 2 times" in blocks[-1]["elements"][0]["text"]